@@ -0,0 +1,8 @@
+"""
+Benchmarks of the Cruditor views at realistic data sizes, using the models of
+the examples and SQLite. Run them using::
+
+    python -m benchmarks --sizes 10000 100000
+
+See ``python -m benchmarks --help`` for all options.
+"""
@@ -0,0 +1,196 @@
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+
+import django
+
+#: Relative increase of the latency or allocation which is reported as regression.
+DEFAULT_THRESHOLD = 0.25
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def measure(scenario, user, repeat):
+    """
+    Runs a scenario ``repeat`` times (after a warmup run) and returns the median
+    and 95th percentile latency in milliseconds. The number of queries and the
+    peak allocation (in KiB) are measured in separate runs to not distort the
+    timings.
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    scenario(user)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scenario(user)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    with CaptureQueriesContext(connection) as queries:
+        scenario(user)
+
+    tracemalloc.start()
+    try:
+        scenario(user)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    timings.sort()
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 2),
+        "queries": len(queries),
+        "peak_kib": round(peak / 1024),
+    }
+
+
+def run(sizes, children, repeat, only=None):
+    """
+    Runs all scenarios for every size, the database is populated incrementally.
+    Returns a dict of results keyed by ``<scenario>@<size>``.
+    """
+    from django.contrib.auth.models import User
+    from django.core.management import call_command
+    from examples.store.models import Person
+
+    from benchmarks.data import create_parent, populate_persons
+    from benchmarks.scenarios import get_scenarios
+
+    call_command("migrate", verbosity=0)
+    user = User.objects.create(
+        username="benchmark", is_superuser=True, is_staff=True, is_active=True
+    )
+    parent = create_parent(children)
+
+    results = {}
+    for size in sorted(sizes):
+        populate_persons(size)
+        victim = Person.objects.filter(relatedperson__isnull=True).order_by("-pk").first()
+        for scenario in get_scenarios(user, size, parent, victim):
+            if only and scenario.name not in only:
+                continue
+            key = f"{scenario.name}@{size}"
+            results[key] = measure(scenario, user, repeat)
+            print(format_row(key, results[key]), file=sys.stderr)
+    return results
+
+
+def format_row(key, result, baseline=None, threshold=DEFAULT_THRESHOLD):
+    row = (
+        f"{key:<32} {result['median_ms']:>10.2f} {result['p95_ms']:>10.2f} "
+        f"{result['queries']:>8} {result['peak_kib']:>10}"
+    )
+    if baseline is None:
+        return row
+
+    def delta(name):
+        if not baseline[name]:
+            return "n/a"
+        return f"{(result[name] - baseline[name]) / baseline[name]:+.0%}"
+
+    regressions = get_regressions(result, baseline, threshold)
+    return (
+        f"{row} {delta('median_ms'):>8} {result['queries'] - baseline['queries']:>+6} "
+        f"{delta('peak_kib'):>8}  {'REGRESSION: ' + ', '.join(regressions) if regressions else ''}"
+    ).rstrip()
+
+
+def get_regressions(result, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Returns the names of the measurements which regressed compared to the baseline.
+    Any additional query is a regression, latency and allocation are compared using
+    the relative ``threshold``.
+    """
+    regressions = []
+    if result["median_ms"] > baseline["median_ms"] * (1 + threshold):
+        regressions.append("latency")
+    if result["queries"] > baseline["queries"]:
+        regressions.append("queries")
+    if result["peak_kib"] > baseline["peak_kib"] * (1 + threshold):
+        regressions.append("allocation")
+    return regressions
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Prints the results compared to the baseline, returns the number of regressions.
+    """
+    print(
+        f"{'scenario':<32} {'median ms':>10} {'p95 ms':>10} {'queries':>8} {'peak KiB':>10} "
+        f"{'Δ median':>8} {'Δ q':>6} {'Δ peak':>8}"
+    )
+    count = 0
+    for key, result in results.items():
+        expected = baseline.get(key)
+        print(format_row(key, result, expected, threshold))
+        if expected is not None and get_regressions(result, expected, threshold):
+            count += 1
+    return count
+
+
+def get_environment():
+    return {
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "machine": platform.machine(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the Cruditor views."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000])
+    parser.add_argument("--children", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--only", nargs="+", help="Only run the scenarios with these names.")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save", action="store_true", help="Save the results as new baseline.")
+    parser.add_argument(
+        "--check", action="store_true", help="Exit with status 1 if there are regressions."
+    )
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+    django.setup()
+
+    results = run(args.sizes, args.children, args.repeat, args.only)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("environment") != get_environment():
+            print("Warning: the baseline was recorded in another environment.", file=sys.stderr)
+
+    regressions = compare(results, baseline.get("results", {}), args.threshold)
+
+    if args.save:
+        baseline_results = dict(baseline.get("results", {}), **results)
+        with open(args.baseline, "w") as f:
+            json.dump(
+                {"environment": get_environment(), "results": baseline_results},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+
+    if args.check and regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+import datetime
+import random
+
+from django.utils import timezone
+from examples.store.models import Person, RelatedPerson
+
+FIRST_NAMES = (
+    "Anna", "Ben", "Carla", "David", "Emma", "Felix", "Greta", "Hans", "Ida", "Jonas",
+    "Klara", "Lukas", "Marie", "Noah", "Olivia", "Paul", "Quentin", "Rosa", "Simon", "Tina",
+)  # fmt: skip
+LAST_NAMES = (
+    "Bauer", "Becker", "Fischer", "Hoffmann", "Koch", "Meyer", "Müller", "Richter",
+    "Schmidt", "Schneider", "Schulz", "Wagner", "Weber", "Wolf", "",
+)  # fmt: skip
+
+
+def populate_persons(size, seed=0, batch_size=5000):
+    """
+    Creates persons until there are ``size`` persons in the database. The values
+    are derived from a seeded random generator to get the same data on every run.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    existing = Person.objects.count()
+
+    for offset in range(existing, size, batch_size):
+        Person.objects.bulk_create(
+            [
+                Person(
+                    first_name=rng.choice(FIRST_NAMES),
+                    last_name=rng.choice(LAST_NAMES),
+                    country=rng.choice(Person.COUNTRIES),
+                    birthdate=datetime.date(1950, 1, 1)
+                    + datetime.timedelta(days=rng.randrange(20000)),
+                    reminder=now + datetime.timedelta(minutes=rng.randrange(100000)),
+                    approved=rng.random() < 0.7,
+                    stars=rng.randint(1, 5),
+                )
+                for _ in range(min(batch_size, size - offset))
+            ],
+            batch_size=batch_size,
+        )
+
+
+def create_parent(children, seed=0):
+    """
+    Creates a person with ``children`` related persons.
+    """
+    rng = random.Random(seed)
+    parent = Person.objects.create(
+        first_name="Parent", country="Germany", reminder=timezone.now(), approved=True, stars=3
+    )
+    RelatedPerson.objects.bulk_create(
+        RelatedPerson(
+            person=parent,
+            first_name=rng.choice(FIRST_NAMES),
+            last_name=rng.choice(LAST_NAMES),
+            is_child=rng.random() < 0.5,
+        )
+        for _ in range(children)
+    )
+    return parent
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.db import transaction
+from django.forms import MultiWidget
+from django.test import RequestFactory
+from examples.collection.views import PersonDeleteView, PersonFilterView, PersonListView
+from examples.formset.views import PersonChangeView
+
+
+@dataclass
+class Scenario:
+    """
+    A request to a view. ``rollback`` is set for requests which change data, they
+    are run in a transaction which is rolled back.
+    """
+
+    name: str
+    view: object
+    method: str = "get"
+    data: dict = None
+    kwargs: dict = None
+    rollback: bool = False
+
+    def __call__(self, user):
+        request = getattr(RequestFactory(), self.method)("/", data=self.data or {})
+        request.user = user
+        request._messages = CookieStorage(request)
+
+        with transaction.atomic():
+            response = self.view(request, **(self.kwargs or {}))
+            if hasattr(response, "render"):
+                response.render()
+            if response.streaming:
+                b"".join(response.streaming_content)
+            if self.rollback:
+                transaction.set_rollback(True)
+        return response
+
+
+def get_form_data(response):
+    """
+    Returns the POST data to submit the form and all formsets of a rendered form
+    view unchanged.
+    """
+    data = {}
+    forms = [response.context_data["form"]]
+    for formset in response.context_data["formsets"].values():
+        forms.append(formset.management_form)
+        forms.extend(formset.forms)
+
+    for form in forms:
+        for field in form:
+            value, widget = field.value(), field.field.widget
+            if isinstance(widget, MultiWidget):
+                for index, item in enumerate(widget.decompress(value)):
+                    data[f"{field.html_name}_{index}"] = "" if item is None else item
+            elif value is not None and value is not False:
+                data[field.html_name] = value
+    return data
+
+
+def get_scenarios(user, size, parent, victim, per_page=25):
+    """
+    Returns the scenarios for ``size`` rows. ``parent`` is a person with related
+    persons, ``victim`` is a person without related persons.
+    """
+    list_view = PersonListView.as_view()
+    filter_view = PersonFilterView.as_view()
+    change_view = PersonChangeView.as_view()
+    delete_view = PersonDeleteView.as_view()
+
+    change = Scenario("change-formset", change_view, kwargs={"pk": parent.pk})
+    change_data = get_form_data(change(user))
+
+    return [
+        Scenario("list", list_view),
+        Scenario("list-sorted", filter_view, data={"sort": "-first_name"}),
+        Scenario("list-filtered", filter_view, data={"search": "an", "country": "Germany"}),
+        Scenario("list-last-page", list_view, data={"page": max(size // per_page, 1)}),
+        change,
+        Scenario(
+            "change-formset-post",
+            change_view,
+            method="post",
+            data=change_data,
+            kwargs={"pk": parent.pk},
+            rollback=True,
+        ),
+        Scenario("delete", delete_view, kwargs={"pk": victim.pk}),
+        Scenario(
+            "delete-post", delete_view, method="post", kwargs={"pk": victim.pk}, rollback=True
+        ),
+        Scenario(
+            "delete-protected",
+            delete_view,
+            method="post",
+            kwargs={"pk": parent.pk},
+            rollback=True,
+        ),
+    ]
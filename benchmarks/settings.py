@@ -0,0 +1,18 @@
+import os
+
+from tests.settings import *  # noqa: F403
+
+# Query logging would distort the timings, queries are counted explicitly.
+DEBUG = False
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.environ.get("CRUDITOR_BENCHMARK_DB", ":memory:"),
+    }
+}
+
+ALLOWED_HOSTS = ["testserver"]
+
+# The formsets of the change view benchmarks have hundreds of forms.
+DATA_UPLOAD_MAX_NUMBER_FIELDS = None
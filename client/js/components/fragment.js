@@ -0,0 +1,106 @@
+const
+  DEFAULT_OPTIONS = {
+    selector: '.cruditor-table',
+    filterFormSelector: '.cruditor-filter-form',
+    header: 'X-Cruditor-Fragment',
+  }
+
+class TableFragmentLoader {
+  constructor(options) {
+    this.options = Object.assign({}, DEFAULT_OPTIONS, options)
+
+    if (!document.querySelector(this.options.selector)) {
+      return
+    }
+
+    document.addEventListener('click', (event) => this.handleClick(event))
+    document.addEventListener('submit', (event) => this.handleSubmit(event))
+    window.addEventListener('popstate', () => this.load(window.location.href, false))
+  }
+
+  getTable(element) {
+    const table = element.closest(this.options.selector)
+
+    if (!table || table.hasAttribute('data-fragment-no-initialize')) {
+      return null
+    }
+
+    return table
+  }
+
+  handleClick(event) {
+    const link = event.target.closest('a')
+
+    if (
+      !link
+      || event.defaultPrevented
+      || event.button !== 0
+      || event.metaKey
+      || event.ctrlKey
+      || event.shiftKey
+      || !this.getTable(link)
+      || !(link.getAttribute('href') || '').startsWith('?')
+    ) {
+      return
+    }
+
+    event.preventDefault()
+    this.load(link.href, true)
+  }
+
+  handleSubmit(event) {
+    const form = event.target
+
+    if (
+      event.defaultPrevented
+      || !form.matches(this.options.filterFormSelector)
+      || (form.getAttribute('method') || 'get').toLowerCase() !== 'get'
+      || !document.querySelector(this.options.selector)
+    ) {
+      return
+    }
+
+    event.preventDefault()
+    const url = new URL(form.action, window.location.href)
+    url.search = new URLSearchParams(new FormData(form)).toString()
+    this.load(url.href, true)
+  }
+
+  load(url, push) {
+    const current = document.querySelector(this.options.selector)
+
+    if (!current) {
+      return
+    }
+
+    current.setAttribute('aria-busy', 'true')
+
+    fetch(url, {
+      headers: { [this.options.header]: '1' },
+      credentials: 'same-origin',
+    }).then((response) => {
+      if (!response.ok) {
+        throw new Error(response.statusText)
+      }
+
+      return response.text()
+    }).then((html) => {
+      const
+        fragment = new DOMParser().parseFromString(html, 'text/html')
+      const table = fragment.querySelector(this.options.selector)
+
+      if (!table) {
+        throw new Error('No table in response')
+      }
+
+      current.replaceWith(document.importNode(table, true))
+      if (push) {
+        window.history.pushState(null, '', url)
+      }
+    }).catch(() => {
+      window.location.href = url
+    })
+  }
+}
+
+export { TableFragmentLoader }
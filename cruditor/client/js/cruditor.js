@@ -1,5 +1,7 @@
 import * as bootstrap from 'bootstrap'
 
 import { FormsetInitializer } from './components/formset'
+import { TableFragmentLoader } from './components/fragment'
 
 new FormsetInitializer({ selector: '.cruditor-formset' })
+new TableFragmentLoader({ selector: '.cruditor-table' })
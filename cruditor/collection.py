@@ -1,9 +1,10 @@
 import django_tables2 as tables
 from django.conf import settings
-from django.urls import path, reverse
+from django.urls import path
 from django.utils.translation import gettext
 
 from cruditor.datastructures import Breadcrumb, TitleButton
+from cruditor.urltemplates import get_url_builder, reverse
 from cruditor.views import (
     CruditorAddView,
     CruditorChangeView,
@@ -116,14 +117,15 @@ class CollectionViewMixin:
         if not hasattr(self, "_table_class"):
 
             class CollectionTable(tables.Table):
-                item = tables.LinkColumn(
-                    self.collection_detail_urlname,
-                    args=(tables.A("pk"),),
+                item = tables.Column(
+                    linkify=lambda record: self.get_collection_record_url(record),
                     verbose_name=self.get_model_verbose_name(),
-                    text=lambda obj: str(obj),
                     accessor=tables.A("pk"),
                 )
 
+                def render_item(self, record):
+                    return str(record)
+
             self._table_class = CollectionTable
 
         return self._table_class
@@ -198,6 +200,18 @@ class CollectionViewMixin:
             self.collection_detail_urlname, args=self.get_collection_object_url_args()
         )
 
+    def get_collection_record_url(self, record):
+        """
+        Helper method to generate the collection detail url of a record in the list table.
+        By default, builds the url of the ``collection_detail_urlname`` property using
+        the record pk, the route is compiled once (see ``cruditor.urltemplates``).
+        """
+        if not hasattr(self, "_collection_record_url_builder"):
+            self._collection_record_url_builder = get_url_builder(
+                self.collection_detail_urlname, names=1
+            )
+        return self._collection_record_url_builder((record.pk,))
+
     def get_collection_add_titlebutton_label(self):
         """
         Helper method to override the used button label for the "Add" title button.
@@ -0,0 +1,448 @@
+import csv
+import datetime
+import decimal
+import io
+import json
+import random
+import uuid
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+
+FIRST_NAMES = (
+    "Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hannah", "Ida", "Jonas",
+    "Klara", "Lukas", "Marie", "Noah", "Olivia", "Paul", "Rosa", "Simon", "Tina", "Vincent",
+    "Alice", "Bruno", "Chloe", "Daniel", "Elena", "Frank", "Giulia", "Hugo", "Iris", "Jakob",
+)  # fmt: skip
+
+LAST_NAMES = (
+    "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Meyer", "Wagner", "Becker",
+    "Schulz", "Hoffmann", "Martin", "Bernard", "Dubois", "Rossi", "Russo", "Ferrari",
+    "Smith", "Jones", "Brown", "Taylor", "Wilson", "García", "López", "Novak", "Kowalski",
+)  # fmt: skip
+
+WORDS = (
+    "alpha", "bright", "city", "delta", "east", "field", "green", "harbor", "island",
+    "journey", "king", "lake", "meadow", "north", "ocean", "park", "quiet", "river",
+    "stone", "tower", "upper", "valley", "west", "yellow", "zone", "garden", "hill",
+)  # fmt: skip
+
+#: Database values which are written to COPY's CSV as they are.
+COPY_TYPES = (str, int, float, decimal.Decimal, datetime.date, datetime.time, uuid.UUID)
+
+
+def zipf_weights(count, exponent=1.0):
+    """
+    Returns Zipf distributed weights for ``count`` values, the first values are the
+    most frequent ones (like names, countries or categories in real data).
+    """
+    return [1 / (rank**exponent) for rank in range(1, count + 1)]
+
+
+def get_collection_models(urlconf=None):
+    """
+    Returns the models of all Cruditor collection views (views using
+    ``CollectionViewMixin`` with a ``model``) found in the URL configuration.
+    """
+    from cruditor.collection import CollectionViewMixin
+
+    found = []
+
+    def walk(patterns):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                walk(pattern.url_patterns)
+            elif isinstance(pattern, URLPattern):
+                view_class = getattr(pattern.callback, "view_class", None)
+                model = getattr(view_class, "model", None)
+                if (
+                    view_class
+                    and issubclass(view_class, CollectionViewMixin)
+                    and model is not None
+                    and model not in found
+                ):
+                    found.append(model)
+
+    walk(get_resolver(urlconf).url_patterns)
+    return found
+
+
+class DataGenerator:
+    """
+    Generates rows with realistic distributions for a model. Values are derived
+    from the field types, choices, validators and names (e.g. ``first_name``),
+    values of choices and names are Zipf distributed. Nullable fields are None
+    and blank fields are empty for ``blank_ratio`` of the rows. Forward relations
+    point to random existing rows of the related model, one-to-one relations and
+    unique foreign keys point to rows which are not referenced yet.
+
+    The generated data only depends on the ``seed``.
+    """
+
+    #: Ratio of rows with empty values for nullable and blank fields.
+    blank_ratio = 0.1
+
+    def __init__(self, model, seed=0, values=None):
+        self.model = model
+        self.rng = random.Random(f"{model._meta.label}:{seed}")
+        self.values = values or {}
+        self.related_pks = {}
+        self.unused_pks = {}
+        self.now = timezone.now()
+
+    def get_fields(self):
+        """
+        Returns the concrete fields to generate values for, automatic primary keys
+        are skipped.
+        """
+        return [
+            field
+            for field in self.model._meta.concrete_fields
+            if not (field.primary_key and isinstance(field, models.AutoField))
+        ]
+
+    def build(self, index, values=None):
+        """
+        Returns an unsaved instance with generated values, ``index`` is the number
+        of the row and used for unique values. ``values`` are fixed values of this
+        row (e.g. the parent of a related row), in addition to ``self.values``.
+        """
+        values = {**self.values, **values} if values else self.values
+        instance = self.model()
+        for field in self.get_fields():
+            if field.name in values:
+                value = values[field.name]
+            else:
+                value = self.generate_value(field, index)
+            setattr(instance, field.attname if field.is_relation else field.name, value)
+        return instance
+
+    def generate_value(self, field, index):
+        rng = self.rng
+        if field.null and rng.random() < self.blank_ratio:
+            return None
+
+        if field.is_relation:
+            return self.get_related_pk(field)
+
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            return self.now
+
+        if field.choices:
+            choices = [value for value, label in field.flatchoices]
+            return rng.choices(choices, weights=zipf_weights(len(choices)))[0]
+
+        if isinstance(field, (models.CharField, models.TextField)):
+            if field.blank and not field.unique and rng.random() < self.blank_ratio:
+                return ""
+            return self.generate_text(field, index)
+
+        if isinstance(field, models.BooleanField):
+            return rng.random() < 0.7
+
+        if isinstance(field, models.DateTimeField):
+            value = self.now + datetime.timedelta(seconds=rng.randint(-31536000, 31536000))
+            return value
+
+        if isinstance(field, models.DateField):
+            if "birth" in field.name:
+                start, days = datetime.date(1940, 1, 1), 25000
+            else:
+                start, days = self.now.date() - datetime.timedelta(days=365), 730
+            return start + datetime.timedelta(days=rng.randrange(days))
+
+        if isinstance(field, models.TimeField):
+            return datetime.time(rng.randrange(24), rng.randrange(60))
+
+        if isinstance(field, models.DurationField):
+            return datetime.timedelta(minutes=rng.randrange(10000))
+
+        if isinstance(field, models.UUIDField):
+            return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+        if isinstance(field, models.DecimalField):
+            maximum = 10 ** (field.max_digits - field.decimal_places) - 1
+            value = min(rng.lognormvariate(3, 1.5), maximum)
+            return decimal.Decimal(value).quantize(
+                decimal.Decimal(1).scaleb(-field.decimal_places)
+            )
+
+        if isinstance(field, models.FloatField):
+            return rng.lognormvariate(3, 1.5)
+
+        if isinstance(field, models.IntegerField):
+            if field.unique:
+                return index
+            low, high = self.get_integer_range(field)
+            # Log-uniform, small values are more frequent.
+            return min(max(int(10 ** rng.uniform(0, 4)) - 1 + low, low), high)
+
+        if isinstance(field, models.JSONField):
+            return {}
+
+        if field.has_default():
+            return field.get_default()
+        if field.null:
+            return None
+        raise ImproperlyConfigured(
+            f"Can't generate values for {field.__class__.__name__} {field.name!r}, "
+            "pass the value explicitly."
+        )
+
+    def generate_text(self, field, index):
+        rng, name = self.rng, field.name
+        first = rng.choices(FIRST_NAMES, weights=zipf_weights(len(FIRST_NAMES)))[0]
+        last = rng.choices(LAST_NAMES, weights=zipf_weights(len(LAST_NAMES)))[0]
+
+        if isinstance(field, models.EmailField):
+            value = f"{first}.{last}.{index}@example.com".lower()
+        elif isinstance(field, models.URLField):
+            value = f"https://example.com/{index}"
+        elif isinstance(field, models.SlugField):
+            value = f"{rng.choice(WORDS)}-{index}"
+        elif "first_name" in name:
+            value = first
+        elif "last_name" in name or "surname" in name:
+            value = last
+        elif name.endswith("name"):
+            value = f"{first} {last}"
+        else:
+            words = rng.choices(WORDS, weights=zipf_weights(len(WORDS)), k=rng.randint(1, 8))
+            value = " ".join(words).capitalize()
+
+        if field.unique and not isinstance(
+            field, (models.EmailField, models.URLField, models.SlugField)
+        ):
+            value = f"{value} {index}"
+        return value[: field.max_length] if field.max_length else value
+
+    def get_integer_range(self, field):
+        low, high = 0, 2**31 - 1
+        if isinstance(field, (models.SmallIntegerField, models.PositiveSmallIntegerField)):
+            high = 2**15 - 1
+        for validator in field.validators:
+            if isinstance(validator, MinValueValidator):
+                low = max(low, validator.limit_value)
+            elif isinstance(validator, MaxValueValidator):
+                high = min(high, validator.limit_value)
+        return low, high
+
+    def get_related_pk(self, field):
+        if field.unique:
+            return self.get_unused_related_pk(field)
+
+        pks = self.get_related_pks(field)
+        if not pks:
+            raise ImproperlyConfigured(
+                f"There are no {field.related_model._meta.verbose_name_plural} to "
+                f"use for {self.model._meta.label}.{field.name}, generate them first."
+            )
+        return self.rng.choice(pks)
+
+    def get_unused_related_pk(self, field):
+        """
+        Returns a random pk of the related model which is not referenced by ``field``
+        yet (neither by existing rows nor by rows built before), for one-to-one
+        relations and unique foreign keys.
+        """
+        if field.name not in self.unused_pks:
+            used = set(
+                self.model._default_manager.filter(
+                    **{f"{field.attname}__isnull": False}
+                ).values_list(field.attname, flat=True)
+            )
+            pks = [pk for pk in self.get_related_pks(field) if pk not in used]
+            self.rng.shuffle(pks)
+            self.unused_pks[field.name] = pks
+
+        pks = self.unused_pks[field.name]
+        if not pks:
+            raise ImproperlyConfigured(
+                f"There are no unused {field.related_model._meta.verbose_name_plural} "
+                f"left for the unique relation {self.model._meta.label}.{field.name}, "
+                "generate more of them first."
+            )
+        return pks.pop()
+
+    def get_related_pks(self, field):
+        if field.related_model not in self.related_pks:
+            self.related_pks[field.related_model] = list(
+                field.related_model._default_manager.order_by("pk").values_list(
+                    field.target_field.attname, flat=True
+                )
+            )
+        return self.related_pks[field.related_model]
+
+
+def insert_rows(model, rows, using=DEFAULT_DB_ALIAS, batch_size=2000):
+    """
+    Inserts the (unsaved) instances. PostgreSQL uses COPY, other databases (and
+    rows with values which cannot be written to COPY's CSV) use ``bulk_create``.
+    """
+    connection = connections[using]
+    if connection.vendor == "postgresql" and copy_rows(model, rows, connection):
+        return
+    model._default_manager.using(using).bulk_create(rows, batch_size=batch_size)
+
+
+def get_copy_value(field, value, connection):
+    """
+    Returns the CSV value of ``value`` for COPY, raises ``TypeError`` if the database
+    value is an adapter object or a type without a CSV representation (e.g. arrays,
+    binary data or intervals). JSON is serialized here, ``get_db_prep_save`` would
+    return the adapter of the database driver (e.g. psycopg's ``Jsonb``).
+    """
+    if isinstance(field, models.JSONField):
+        value = field.get_prep_value(value)
+        return "\\N" if value is None else json.dumps(value, cls=field.encoder)
+
+    value = field.get_db_prep_save(value, connection)
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if not isinstance(value, COPY_TYPES):
+        raise TypeError(f"{type(value).__name__} values of {field} cannot be copied.")
+    return value
+
+
+def copy_rows(model, rows, connection):
+    """
+    Inserts the (unsaved) instances using PostgreSQL's COPY. Returns False (and
+    inserts nothing) if a value cannot be written to COPY's CSV.
+    """
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if not (field.primary_key and isinstance(field, models.AutoField))
+    ]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    try:
+        for row in rows:
+            writer.writerow(
+                [
+                    get_copy_value(field, getattr(row, field.attname), connection)
+                    for field in fields
+                ]
+            )
+    except TypeError:
+        return False
+    buffer.seek(0)
+
+    qn = connection.ops.quote_name
+    sql = "COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')".format(
+        qn(model._meta.db_table), ", ".join(qn(field.column) for field in fields)
+    )
+    with connection.cursor() as cursor:
+        if hasattr(cursor.cursor, "copy"):
+            with cursor.cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+        else:
+            cursor.cursor.copy_expert(sql, buffer)
+    return True
+
+
+def get_reverse_relation(model, name):
+    """
+    Returns the reverse foreign key of ``model`` with the accessor or query name
+    ``name`` (e.g. ``relatedperson`` or ``relatedperson_set``).
+    """
+    for relation in model._meta.related_objects:
+        if relation.one_to_many and name in (
+            relation.get_accessor_name(),
+            relation.field.related_query_name(),
+            relation.related_model._meta.model_name,
+        ):
+            return relation
+    raise ImproperlyConfigured(f"{model._meta.label} has no reverse relation {name!r}.")
+
+
+def generate(
+    model,
+    rows,
+    seed=0,
+    batch_size=2000,
+    fan_out=None,
+    values=None,
+    using=DEFAULT_DB_ALIAS,
+    progress=None,
+):
+    """
+    Generates rows for ``model`` until the table has ``rows`` rows. Existing rows
+    are kept, running the generation again with a higher target only adds the
+    missing rows.
+
+    ``fan_out`` is a dict of reverse relations (e.g. ``relatedperson``) and a tuple
+    of the minimum and maximum number of related rows to generate for every new
+    row, smaller numbers are more frequent. ``values`` is a dict of field values
+    which are used instead of generated values.
+
+    Returns the number of generated rows (including related rows).
+    """
+    manager = model._default_manager.using(using)
+    existing = manager.count()
+    if existing >= rows:
+        return 0
+
+    generator = DataGenerator(model, seed=f"{seed}:{existing}", values=values)
+    last_pk = manager.order_by("-pk").values_list("pk", flat=True).first()
+    created = 0
+
+    for offset in range(existing, rows, batch_size):
+        batch = [
+            generator.build(index) for index in range(offset, min(offset + batch_size, rows))
+        ]
+        with transaction.atomic(using=using):
+            insert_rows(model, batch, using, batch_size)
+        created += len(batch)
+        if progress:
+            progress(model, offset + len(batch), rows)
+
+    for name, (minimum, maximum) in (fan_out or {}).items():
+        relation = get_reverse_relation(model, name)
+        created += generate_related(
+            relation, last_pk, minimum, maximum, seed, batch_size, using, progress
+        )
+    return created
+
+
+def generate_related(relation, after_pk, minimum, maximum, seed, batch_size, using, progress):
+    """
+    Generates between ``minimum`` and ``maximum`` related rows of ``relation`` for
+    every row with a primary key greater than ``after_pk``.
+    """
+    model = relation.related_model
+    rng = random.Random(f"{model._meta.label}:fan-out:{seed}:{after_pk}")
+    parents = relation.model._default_manager.using(using).order_by("pk")
+    if after_pk is not None:
+        parents = parents.filter(pk__gt=after_pk)
+
+    generator = DataGenerator(model, seed=f"{seed}:{after_pk}")
+    index = model._default_manager.using(using).count()
+    created, batch = 0, []
+
+    def flush():
+        with transaction.atomic(using=using):
+            insert_rows(model, batch, using, batch_size)
+        if progress:
+            progress(model, created, None)
+
+    for parent_pk in parents.values_list(
+        relation.field.target_field.attname, flat=True
+    ).iterator():
+        # Triangular distribution, most parents have only a few related rows.
+        for _ in range(int(rng.triangular(minimum, maximum + 1, minimum))):
+            batch.append(generator.build(index, {relation.field.name: parent_pk}))
+            index += 1
+            created += 1
+            if len(batch) >= batch_size:
+                flush()
+                batch = []
+
+    if batch:
+        flush()
+    return created
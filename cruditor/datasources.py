@@ -0,0 +1,234 @@
+import copy
+from dataclasses import dataclass, field
+
+from asgiref.sync import sync_to_async
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.core.validators import EMPTY_VALUES
+from django.utils.functional import cached_property
+from django.utils.translation import gettext
+
+from cruditor.pagination import CruditorPaginator, ResultCount
+
+try:
+    from django_tables2.data import TableQuerysetData
+    from django_tables2.utils import segment
+except ImportError:
+    # django-tables2 is optional, DataSourceTableData is only used by the list view.
+    TableQuerysetData = object
+
+
+@dataclass
+class DataSourceResult:
+    """
+    Result of ``CruditorDataSource.fetch``: the items of the requested page and the
+    total number of items (an int or a ``ResultCount`` if the count is not exact).
+    """
+
+    items: list = field(default_factory=list)
+    count: ResultCount = None
+
+    def __post_init__(self):
+        if not isinstance(self.count, ResultCount):
+            self.count = ResultCount(len(self.items) if self.count is None else self.count)
+
+
+class CruditorDataSource:
+    """
+    Base class for list view data which is not stored in the database, e.g. items
+    fetched from a remote API. The data source mimics the parts of the QuerySet
+    API django-tables2 and django-filter use (``all``, ``filter``, ``order_by``,
+    ``count`` and slicing), but the actual work is pushed down to the backend by
+    calling ``fetch`` with the offset and size of the current page, the ordering
+    and the filter values.
+
+    Subclasses have to implement ``fetch``. Return a ``CruditorDataSource`` from
+    ``get_queryset`` in your list view to use it. If you use a ``filter_class``, all
+    filters need an explicit ``label`` as there is no model to derive it from.
+    """
+
+    #: Data sources are not backed by a model, django-filter expects the attribute.
+    model = None
+
+    #: Human readable name of the items, used by django-tables2.
+    verbose_name = "item"
+
+    #: Human readable plural name of the items, used by django-tables2.
+    verbose_name_plural = "items"
+
+    #: Number of items fetched at once when iterating over all items (e.g. exports).
+    chunk_size = 100
+
+    def __init__(self, filters=None, ordering=()):
+        self.filters = dict(filters or {})
+        self.ordering = tuple(ordering)
+        self.result_count = None
+
+    def __iter__(self):
+        offset = 0
+        while True:
+            items = self.get_result(offset, self.chunk_size).items
+            yield from items
+            if len(items) < self.chunk_size:
+                break
+            offset += self.chunk_size
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError("Data sources don't support slicing with steps.")
+            start = key.start or 0
+            if key.stop is None:
+                return list(self)[start:]
+            return self.get_result(start, max(key.stop - start, 0)).items
+
+        items = self.get_result(key, 1).items
+        if not items:
+            raise IndexError("Data source index out of range.")
+        return items[0]
+
+    def clone(self):
+        """
+        Returns a copy of the data source, the cached count is reset.
+        """
+        clone = copy.copy(self)
+        clone.filters = dict(self.filters)
+        clone.result_count = None
+        return clone
+
+    def all(self):
+        return self.clone()
+
+    def filter(self, **filters):
+        """
+        Returns a copy of the data source with the provided filter values added.
+        The ``__exact`` suffix of lookups (as generated by django-filter) is removed.
+        """
+        clone = self.clone()
+        for name, value in filters.items():
+            clone.filters[name.removesuffix("__exact")] = value
+        return clone
+
+    def order_by(self, *ordering):
+        """
+        Returns a copy of the data source with the provided ordering (field names,
+        prefixed with "-" for descending order).
+        """
+        clone = self.clone()
+        clone.ordering = tuple(ordering)
+        return clone
+
+    def count(self):
+        return self.get_result_count().value
+
+    def get_result_count(self):
+        """
+        Returns the ``ResultCount`` of the last fetch, fetches an empty page if
+        nothing was fetched yet.
+        """
+        if self.result_count is None:
+            self.get_result(0, 0)
+        return self.result_count
+
+    def get_result(self, offset, limit):
+        """
+        Calls ``fetch`` with the filters and the ordering of the data source and
+        remembers the returned count.
+        """
+        result = self.fetch(offset, limit, list(self.ordering), dict(self.filters))
+        if not isinstance(result, DataSourceResult):
+            result = DataSourceResult(*result)
+        self.result_count = result.count
+        return result
+
+    def fetch(self, offset, limit, ordering, filters):
+        """
+        Fetch ``limit`` items starting at ``offset`` from the backend, ordered by
+        ``ordering`` and filtered using the ``filters`` dict. Returns a
+        ``DataSourceResult`` (or a tuple of items and count).
+        """
+        raise NotImplementedError
+
+
+def filter_data_source(filterset):
+    """
+    Pushes the filter values of a django-filter FilterSet down to the data source
+    passed as the FilterSet's queryset. The values are keyed by the filter names,
+    empty values are skipped. If the filter form is invalid, no filters are applied.
+    """
+    source = filterset.queryset
+    if not filterset.is_bound or not filterset.is_valid():
+        return source.all()
+
+    return source.filter(
+        **{
+            name: value
+            for name, value in filterset.form.cleaned_data.items()
+            if value not in EMPTY_VALUES
+        }
+    )
+
+
+class DataSourceTableData(TableQuerysetData):
+    """
+    django-tables2 table data container for a ``CruditorDataSource``.
+    """
+
+    def __len__(self):
+        return self.data.count()
+
+    @property
+    def ordering(self):
+        aliases = {}
+        for bound_column in self.table.columns:
+            aliases[bound_column.order_by_alias] = bound_column.order_by
+        try:
+            return next(segment(self.data.ordering, aliases))
+        except StopIteration:
+            pass
+
+    @cached_property
+    def verbose_name(self):
+        return self.data.verbose_name
+
+    @cached_property
+    def verbose_name_plural(self):
+        return self.data.verbose_name_plural
+
+
+class DataSourcePaginator(CruditorPaginator):
+    """
+    Paginator for tables backed by a ``CruditorDataSource``. The items of the page
+    and the count are fetched using a single call to ``fetch``.
+    """
+
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(gettext("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(gettext("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        result = self.object_list.data.data.get_result(
+            (number - 1) * self.per_page, self.per_page
+        )
+        self.result_count = result.count
+
+        if self.result_count.exact:
+            if number > self.num_pages and not (number == 1 and self.allow_empty_first_page):
+                raise EmptyPage(gettext("That page contains no results"))
+        elif len(result.items) >= self.per_page:
+            self.num_pages = max(self.num_pages, number + 1)
+        else:
+            self.num_pages = number
+
+        return self._get_page(
+            self.object_list.__class__(result.items, table=self.object_list.table), number, self
+        )
+
+    async def apage(self, number):
+        # Data sources are synchronous, don't block the event loop.
+        return await sync_to_async(self.page)(number)
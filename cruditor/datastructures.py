@@ -20,6 +20,7 @@ class NavigationItem:
     name: str
     url: str
     help_text: str = ""
+    permission: str = None
 
 
 @dataclass
@@ -32,3 +33,4 @@ class NavigationGroup:
     name: str
     items: list[NavigationItem | NavigationDivider]
     help_text: str = ""
+    permission: str = None
@@ -0,0 +1,103 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+class Echo:
+    """
+    File-like object which returns the written value instead of buffering it.
+    Used to stream the output of ``csv.writer``.
+    """
+
+    def write(self, value):
+        return value
+
+
+class CSVFormat:
+    """
+    CSV document with a header row, one line per row.
+
+    Text values starting with a character which makes spreadsheet applications
+    evaluate the cell as formula (see ``formula_prefixes``) are prefixed with a
+    single quote to prevent formula injection. Set ``escape_formulas`` to False in
+    a subclass (and register it in ``FORMATS``) to export the values as they are.
+    """
+
+    content_type = "text/csv; charset=utf-8"
+
+    #: Prefix text values which would be evaluated as formula with a single quote.
+    escape_formulas = True
+
+    #: Leading characters of text values which are evaluated as formula.
+    formula_prefixes = ("=", "+", "-", "@", "\t", "\r")
+
+    def __init__(self, names, headers):
+        self.headers = headers
+        self.writer = csv.writer(Echo())
+
+    def escape(self, value):
+        if (
+            self.escape_formulas
+            and isinstance(value, str)
+            and value.startswith(self.formula_prefixes)
+        ):
+            return f"'{value}"
+        return value
+
+    def header(self):
+        return self.writer.writerow([self.escape(value) for value in self.headers])
+
+    def row(self, values):
+        return self.writer.writerow([self.escape(value) for value in values])
+
+
+class JSONLFormat:
+    """
+    One JSON object per row, the column names are used as keys.
+    """
+
+    content_type = "application/x-ndjson; charset=utf-8"
+
+    def __init__(self, names, headers):
+        self.names = names
+
+    def header(self):
+        return ""
+
+    def row(self, values):
+        return json.dumps(dict(zip(self.names, values)), cls=DjangoJSONEncoder) + "\n"
+
+
+#: Supported export formats.
+FORMATS = {
+    "csv": CSVFormat,
+    "jsonl": JSONLFormat,
+}
+
+#: Content types of the supported export formats.
+CONTENT_TYPES = {name: format_class.content_type for name, format_class in FORMATS.items()}
+
+
+def iter_export(export_format, names, headers, rows):
+    """
+    Yields the chunks of an export document for the provided rows.
+    """
+    formatter = FORMATS[export_format](names, headers)
+    header = formatter.header()
+    if header:
+        yield header
+    for values in rows:
+        yield formatter.row(values)
+
+
+async def aiter_export(export_format, names, headers, rows):
+    """
+    Async variant of ``iter_export``, ``rows`` has to be an async iterable.
+    """
+    formatter = FORMATS[export_format](names, headers)
+    header = formatter.header()
+    if header:
+        yield header
+    async for values in rows:
+        yield formatter.row(values)
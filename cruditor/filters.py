@@ -1,10 +1,77 @@
 import functools
 import operator
 
-from django.db.models import Q
+from django.contrib.postgres.indexes import OpClass
+from django.core.exceptions import FieldDoesNotExist
+from django.db.backends.utils import names_digest
+from django.db.models import CharField, Exists, F, Index, ManyToOneRel, OuterRef, Q, Value
+from django.db.models.fields.reverse_related import ForeignObjectRel
+from django.db.models.functions import Lower
 from django.utils.translation import gettext
 from django_filters import CharFilter, ChoiceFilter
 
+from cruditor.search import get_search_backend
+
+
+def get_lookup_query(lookup, value, transform=None):
+    """
+    Returns a Q object for ``lookup`` and ``value``. If ``transform`` is set (e.g.
+    ``Lower``), the field and the value are both passed through the transform
+    before they are compared, e.g. ``LOWER(field) LIKE LOWER(value) || '%'``.
+    """
+    if transform is None:
+        return Q(**{lookup: value})
+
+    path, lookup_name = lookup.rsplit("__", 1)
+    lookup_class = CharField.get_lookups()[lookup_name]
+    return Q(lookup_class(transform(F(path)), transform(Value(value))))
+
+
+def get_exists_query(model, lookup, value, transform=None):
+    """
+    Returns a Q object to filter ``model`` using ``lookup`` and ``value`` (see
+    ``get_lookup_query`` for ``transform``). If the lookup spans a multi-valued
+    relation (reverse foreign key or many-to-many), the relation is filtered using an
+    EXISTS subquery instead of a JOIN. This way, no duplicate rows are returned and
+    no DISTINCT is required.
+    """
+    parts = lookup.split("__")
+    opts = model._meta
+
+    for index, part in enumerate(parts[:-1]):
+        try:
+            field = opts.pk if part == "pk" else opts.get_field(part)
+        except FieldDoesNotExist:
+            break
+
+        if not field.is_relation:
+            break
+
+        related_opts = field.related_model._meta
+        if not (field.one_to_many or field.many_to_many):
+            opts = related_opts
+            continue
+
+        try:
+            related_opts.get_field(parts[index + 1])
+        except FieldDoesNotExist:
+            if parts[index + 1] != "pk":
+                break
+
+        if isinstance(field, ForeignObjectRel):
+            remote_name = field.field.name
+        else:
+            remote_name = field.related_query_name()
+
+        target = field.field.target_field.name if isinstance(field, ManyToOneRel) else "pk"
+        subquery = field.related_model._base_manager.filter(
+            get_lookup_query("__".join(parts[index + 1 :]), value, transform),
+            **{remote_name: OuterRef("__".join(parts[:index] + [target]))},
+        )
+        return Q(Exists(subquery))
+
+    return get_lookup_query(lookup, value, transform)
+
 
 class AnyChoiceFilter(ChoiceFilter):
     """
@@ -37,6 +104,19 @@ class MultiCharFilter(CharFilter):
     iexact, and search). icontains is the default mode, use ^, = and @ in the
     list of fields for the other modes.
 
+    The istartswith and iexact modes compare ``UPPER(field)`` which can't use plain
+    indexes. Set ``use_lower`` to True to compare ``LOWER(field)`` with ``LOWER(value)``
+    instead, which can use the functional indexes returned by ``get_filter_indexes``.
+
+    Fields in search mode (@) are searched together using a full text search
+    backend (see ``cruditor.search``), the default backend depends on the database.
+    Pass ``search_backend`` to use a specific backend. The results are ordered by
+    relevance, set ``order_by_rank`` to False to keep the ordering of the queryset.
+
+    Lookups spanning multi-valued relations (e.g. reverse foreign keys) are performed
+    using EXISTS subqueries to avoid duplicate rows, set ``use_exists`` to False to
+    use plain JOINs instead.
+
     Based on some ideas from https://gist.github.com/nkryptic/4727865
     """
 
@@ -44,24 +124,101 @@ class MultiCharFilter(CharFilter):
     lookup_types = [
         ("^", "istartswith"),
         ("=", "iexact"),
-        ("@", "search"),
+    ]
+    lower_lookup_types = [
+        ("^", "startswith"),
+        ("=", "exact"),
     ]
 
     def __init__(self, fields, *args, **kwargs):
         self.fields = fields
+        self.use_exists = kwargs.pop("use_exists", True)
+        self.use_lower = kwargs.pop("use_lower", False)
+        self.search_backend = kwargs.pop("search_backend", None)
+        self.order_by_rank = kwargs.pop("order_by_rank", True)
         super().__init__(*args, **kwargs)
 
     def filter(self, qs, value):
         if not self.fields or not value:
             return qs
 
-        lookups = [self._get_lookup(str(field)) for field in self.fields]
-        queries = [Q(**{lookup: value}) for lookup in lookups]
+        search_fields = [str(field)[1:] for field in self.fields if str(field).startswith("@")]
+        lookups = [
+            (self._get_lookup(str(field)), self._get_transform(str(field)))
+            for field in self.fields
+            if not str(field).startswith("@")
+        ]
+        if self.use_exists:
+            queries = [
+                get_exists_query(qs.model, lookup, value, transform)
+                for lookup, transform in lookups
+            ]
+        else:
+            queries = [
+                get_lookup_query(lookup, value, transform) for lookup, transform in lookups
+            ]
+
+        if search_fields:
+            backend = self.get_search_backend(qs)
+            qs, query = backend.get_query(qs, search_fields, value)
+            queries.append(query)
+
         qs = qs.filter(functools.reduce(operator.or_, queries))
+        if search_fields and self.order_by_rank:
+            qs = backend.order_by_rank(qs)
         return qs
 
+    def get_search_backend(self, qs):
+        """
+        Returns the search backend for fields in search mode (@).
+        """
+        return self.search_backend or get_search_backend(qs.db)
+
+    def _get_transform(self, field_name):
+        if self.use_lower and field_name[:1] in dict(self.lower_lookup_types):
+            return Lower
+        return None
+
     def _get_lookup(self, field_name):
-        for key, lookup_type in self.lookup_types:
+        lookup_types = self.lower_lookup_types if self.use_lower else self.lookup_types
+        for key, lookup_type in lookup_types:
             if field_name.startswith(key):
                 return f"{field_name[len(key) :]}__{lookup_type}"
         return f"{field_name}__{self.default_lookup_type}"
+
+
+def get_filter_indexes(filterset_class, opclass=None):
+    """
+    Returns the indexes on ``LOWER(field)`` for the fields used in the istartswith
+    (^) and iexact (=) modes of the ``MultiCharFilter`` filters with ``use_lower``
+    of a FilterSet class. Add them to ``Meta.indexes`` of the FilterSet's model.
+
+    On PostgreSQL, prefix searches (``LIKE 'value%'``) only use the index if the
+    database uses the C locale or if the ``text_pattern_ops`` operator class is
+    passed as ``opclass``. Fields of related models are skipped.
+    """
+    model = filterset_class._meta.model
+    names = []
+    for filter_ in filterset_class.base_filters.values():
+        if not isinstance(filter_, MultiCharFilter) or not filter_.use_lower:
+            continue
+
+        for field in map(str, filter_.fields):
+            if field[:1] not in ("^", "=") or field[1:] in names:
+                continue
+            try:
+                model._meta.get_field(field[1:])
+            except FieldDoesNotExist:
+                continue
+            names.append(field[1:])
+
+    indexes = []
+    for name in names:
+        expression = Lower(name)
+        if opclass:
+            expression = OpClass(expression, name=opclass)
+
+        db_table = model._meta.db_table
+        digest = names_digest(db_table, name, length=8)
+        indexes.append(Index(expression, name=f"{db_table[:16]}_{digest}_lwr"))
+    return indexes
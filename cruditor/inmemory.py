@@ -0,0 +1,289 @@
+import heapq
+import threading
+import time
+from array import array
+
+from cruditor.datasources import CruditorDataSource, DataSourceResult
+
+
+def resolve(record, field):
+    """
+    Returns the value of ``field`` (e.g. ``name`` or ``category__name``) of a record,
+    which is either a dict or an object. Missing values are returned as None.
+    """
+    value = record
+    for part in field.replace(".", "__").split("__"):
+        if value is None:
+            break
+        value = value.get(part) if isinstance(value, dict) else getattr(value, part, None)
+    return value
+
+
+def sort_key(value):
+    # None values are sorted last.
+    return (value is None, value)
+
+
+class InMemoryIndex:
+    """
+    Snapshot of the rows of an ``InMemoryCollection``. The rows are stored as a
+    tuple, the indexes are arrays of row positions which are built once per field
+    (when they are used first) and shared by all requests until the snapshot is
+    replaced.
+    """
+
+    def __init__(self, records):
+        self.records = tuple(records)
+        self.created = time.monotonic()
+        self.columns = {}
+        self.folded = {}
+        self.sort_orders = {}
+        self.sort_ranks = {}
+        self.lookups = {}
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.records)
+
+    def get_index(self, indexes, field, build):
+        index = indexes.get(field)
+        if index is None:
+            with self.lock:
+                index = indexes.get(field)
+                if index is None:
+                    index = indexes[field] = build(field)
+        return index
+
+    def get_column(self, field):
+        """
+        Returns the values of ``field`` of all rows.
+        """
+        return self.get_index(
+            self.columns, field, lambda field: tuple(resolve(r, field) for r in self.records)
+        )
+
+    def get_folded(self, field):
+        """
+        Returns the values of ``field`` of all rows as casefolded strings.
+        """
+        return self.get_index(
+            self.folded,
+            field,
+            lambda field: tuple(
+                "" if value is None else str(value).casefold()
+                for value in self.get_column(field)
+            ),
+        )
+
+    def build_sort_order(self, field):
+        column = self.get_column(field)
+        return array("l", sorted(range(len(column)), key=lambda i: sort_key(column[i])))
+
+    def get_sort_order(self, field):
+        """
+        Returns the positions of all rows in ascending order of ``field``.
+        """
+        return self.get_index(self.sort_orders, field, self.build_sort_order)
+
+    def build_sort_ranks(self, field):
+        column, ranks = self.get_column(field), array("l", [0] * len(self.records))
+        rank, previous = -1, object()
+        for position in self.get_sort_order(field):
+            if column[position] != previous:
+                rank, previous = rank + 1, column[position]
+            ranks[position] = rank
+        return ranks
+
+    def get_sort_ranks(self, field):
+        """
+        Returns the rank of every row when ordered by ``field``, equal values have
+        the same rank.
+        """
+        return self.get_index(self.sort_ranks, field, self.build_sort_ranks)
+
+    def build_lookup(self, field):
+        lookup = {}
+        for position, value in enumerate(self.get_column(field)):
+            lookup.setdefault(str(value), array("l")).append(position)
+        return lookup
+
+    def get_lookup(self, field):
+        """
+        Returns a dict of the positions of the rows by the value of ``field`` (as
+        string).
+        """
+        return self.get_index(self.lookups, field, self.build_lookup)
+
+    def search(self, fields, value):
+        """
+        Returns the positions of the rows matching ``value`` in one of the ``fields``,
+        using the modes of ``MultiCharFilter`` (icontains, ^ for istartswith, = for
+        iexact and @ to match all words).
+        """
+        value, matches = str(value).casefold(), set()
+        words = value.split()
+        for field in fields:
+            mode, name = (field[0], field[1:]) if field[:1] in "^=@" else ("", field)
+            if mode == "=":
+                lookup = self.get_index(self.lookups, field, self.build_folded_lookup)
+                matches.update(lookup.get(value, ()))
+                continue
+
+            for position, folded in enumerate(self.get_folded(name)):
+                if mode == "^":
+                    match = folded.startswith(value)
+                elif mode == "@":
+                    match = all(word in folded for word in words)
+                else:
+                    match = value in folded
+                if match:
+                    matches.add(position)
+        return matches
+
+    def build_folded_lookup(self, key):
+        lookup = {}
+        for position, folded in enumerate(self.get_folded(key[1:])):
+            lookup.setdefault(folded, array("l")).append(position)
+        return lookup
+
+    def filter(self, filters, search_fields=None):
+        """
+        Returns the set of positions of the rows matching all ``filters`` or None if
+        all rows match. Filters listed in ``search_fields`` are searched (see
+        ``search``), all other filters match the field of the same name exactly.
+        Lists of values match any of the values.
+        """
+        search_fields = search_fields or {}
+        matches = None
+        for name, value in filters.items():
+            if name in search_fields:
+                positions = self.search(search_fields[name], value)
+            else:
+                lookup = self.get_lookup(name)
+                values = value if isinstance(value, (list, tuple, set)) else [value]
+                positions = set()
+                for item in values:
+                    positions.update(lookup.get(str(item), ()))
+
+            matches = positions if matches is None else matches & positions
+            if not matches:
+                break
+        return matches
+
+    def page(self, matches, ordering, offset, limit):
+        """
+        Returns ``limit`` rows starting at ``offset`` of the rows at the positions
+        ``matches`` (or all rows if None), ordered by ``ordering``. Only the rows up
+        to the requested page are sorted (using ``heapq.nsmallest``), pages of
+        unfiltered rows ordered by a single field are sliced from its sort order.
+        """
+        stop = offset + limit
+        if limit <= 0:
+            return []
+
+        if not ordering:
+            positions = range(len(self.records)) if matches is None else sorted(matches)
+            return [self.records[position] for position in positions[offset:stop]]
+
+        if matches is None and len(ordering) == 1:
+            order = self.get_sort_order(ordering[0].lstrip("-"))
+            if ordering[0].startswith("-"):
+                positions = reversed(order[max(len(order) - stop, 0) : len(order) - offset])
+            else:
+                positions = order[offset:stop]
+            return [self.records[position] for position in positions]
+
+        ranks = [
+            (self.get_sort_ranks(field.lstrip("-")), -1 if field.startswith("-") else 1)
+            for field in ordering
+        ]
+        candidates = range(len(self.records)) if matches is None else matches
+        positions = heapq.nsmallest(
+            stop,
+            candidates,
+            key=lambda position: (
+                tuple(rank[position] * sign for rank, sign in ranks),
+                position,
+            ),
+        )
+        return [self.records[position] for position in positions[offset:]]
+
+
+class InMemoryCollection(CruditorDataSource):
+    """
+    Data source for list data which is loaded at once (e.g. a generator or a list
+    returned by a remote API) and kept in memory. The rows are loaded using ``load``
+    and are refreshed after ``ttl`` seconds. Sort and lookup indexes are built once
+    per loaded snapshot, only the rows up to the requested page are sorted.
+
+    Filter values are matched exactly against the field with the name of the
+    filter (like ``AnyChoiceFilter``), filters listed in ``search_fields`` are
+    searched like ``MultiCharFilter``::
+
+        class PetCollection(InMemoryCollection):
+            search_fields = {"search": ("name", "^category")}
+
+            def load(self):
+                return Pet.get_list()
+
+    The snapshot is shared by all instances of the class (and all requests in the
+    process), use ``invalidate`` to reload it after changes.
+    """
+
+    #: Seconds after which the rows are reloaded. If None, the rows are kept forever.
+    ttl = 300
+
+    #: Search filters, a dict of filter names and ``MultiCharFilter`` style fields.
+    search_fields = {}
+
+    #: Loaded snapshots by collection class.
+    snapshots = {}
+
+    #: Lock to load only one snapshot at a time.
+    snapshots_lock = threading.Lock()
+
+    def load(self):
+        """
+        Returns an iterable of all rows of the collection (dicts or objects).
+        """
+        raise NotImplementedError
+
+    def get_snapshot(self):
+        """
+        Returns the ``InMemoryIndex`` of the current snapshot, loads the rows if
+        there is no snapshot or if it expired. While a request reloads an expired
+        snapshot, other requests use the expired snapshot.
+        """
+        snapshot = self.snapshots.get(self.__class__)
+        if snapshot is not None and not self.is_expired(snapshot):
+            return snapshot
+
+        if snapshot is not None and not self.snapshots_lock.acquire(blocking=False):
+            return snapshot
+        if snapshot is None:
+            self.snapshots_lock.acquire()
+
+        try:
+            current = self.snapshots.get(self.__class__)
+            if current is not None and current is not snapshot:
+                return current
+            snapshot = self.snapshots[self.__class__] = InMemoryIndex(self.load())
+            return snapshot
+        finally:
+            self.snapshots_lock.release()
+
+    def is_expired(self, snapshot):
+        return self.ttl is not None and time.monotonic() - snapshot.created >= self.ttl
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Drops the snapshot, the rows are reloaded on next access.
+        """
+        cls.snapshots.pop(cls, None)
+
+    def fetch(self, offset, limit, ordering, filters):
+        snapshot = self.get_snapshot()
+        matches = snapshot.filter(filters, self.search_fields)
+        count = len(snapshot) if matches is None else len(matches)
+        return DataSourceResult(snapshot.page(matches, ordering, offset, limit), count)
@@ -0,0 +1,83 @@
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from cruditor.datagen import generate, get_collection_models
+
+
+def parse_fan_out(value):
+    try:
+        name, counts = value.split("=", 1)
+        minimum, _, maximum = counts.partition(":")
+        return name, (int(minimum), int(maximum or minimum))
+    except ValueError as exc:
+        raise CommandError(f"Invalid fan out {value!r}, use e.g. relatedperson=0:5.") from exc
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates synthetic data for models used in Cruditor collections, e.g. to test "
+        "list views with millions of rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models", nargs="*", metavar="app_label.Model", help="Models to generate data for."
+        )
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=10000,
+            help="Number of rows in the table after the generation (default: 10000).",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the random data.")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--fan-out",
+            action="append",
+            type=parse_fan_out,
+            default=[],
+            metavar="RELATION=MIN:MAX",
+            help="Generate MIN to MAX related rows per new row (e.g. relatedperson=0:5).",
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+        parser.add_argument(
+            "--list", action="store_true", help="List the models used in collections."
+        )
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            for model in get_collection_models():
+                self.stdout.write(model._meta.label)
+            return
+
+        labels = options["models"]
+        if not labels:
+            raise CommandError("Pass at least one model or use --list.")
+
+        try:
+            models = [apps.get_model(label) for label in labels]
+        except (LookupError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        for model in models:
+            try:
+                created = generate(
+                    model,
+                    options["rows"],
+                    seed=options["seed"],
+                    batch_size=options["batch_size"],
+                    fan_out=dict(options["fan_out"]),
+                    using=options["database"],
+                    progress=self.progress if options["verbosity"] > 1 else None,
+                )
+            except ImproperlyConfigured as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write(f"Generated {created} rows for {model._meta.label}.")
+
+    def progress(self, model, done, total):
+        if total is None:
+            self.stdout.write(f"  {model._meta.label}: {done}")
+        else:
+            self.stdout.write(f"  {model._meta.label}: {done}/{total}")
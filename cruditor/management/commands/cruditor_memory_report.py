@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand
+
+from cruditor.memory import (
+    aggregate_memory_records,
+    clear_memory_records,
+    get_memory_directory,
+    load_memory_records,
+)
+
+
+def format_size(size):
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class Command(BaseCommand):
+    help = (
+        "Shows the peak memory allocation and the top sites of the allocations surviving "
+        "the request per Cruditor view recorded for the sampled requests (see "
+        "CRUDITOR_MEMORY_SAMPLE_RATE)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--directory", help="Directory of the memory records.")
+        parser.add_argument(
+            "--view", help="Only show views whose class path contains this value."
+        )
+        parser.add_argument(
+            "--sites",
+            type=int,
+            default=5,
+            help="Number of sites of surviving allocations per view.",
+        )
+        parser.add_argument(
+            "--clear", action="store_true", help="Remove the records after the report."
+        )
+
+    def handle(self, *args, **options):
+        directory = options["directory"] or get_memory_directory()
+        results = aggregate_memory_records(load_memory_records(directory))
+        if options["view"]:
+            results = [result for result in results if options["view"] in result["view"]]
+
+        if not results:
+            self.stdout.write(f"No memory records in {directory}.")
+
+        for result in results:
+            self.stdout.write(
+                "{view}: {samples} samples, peak max {max}, p95 {p95}, mean {mean}".format(
+                    view=result["view"],
+                    samples=result["samples"],
+                    max=format_size(result["max_peak"]),
+                    p95=format_size(result["p95_peak"]),
+                    mean=format_size(result["mean_peak"]),
+                )
+            )
+            sites = result["surviving_sites"][: options["sites"]]
+            if sites:
+                self.stdout.write("  Allocations surviving the request (not the peak):")
+            for site, size in sites:
+                self.stdout.write(f"  {format_size(size):>12}  {site}")
+
+        if options["clear"]:
+            clear_memory_records(directory)
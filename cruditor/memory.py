@@ -0,0 +1,199 @@
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+#: Only one request is traced at a time, tracemalloc traces the whole process.
+trace_lock = threading.Lock()
+
+#: Allocations of these files are not recorded.
+IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<unknown>")
+
+
+class MemoryTrace:
+    """
+    Records the peak traced allocation of a request and the allocation sites of
+    the memory which is still allocated at the end of the request (used as context
+    manager), using ``tracemalloc``. tracemalloc only tracks the size of the peak,
+    the sites (``surviving_sites``) are not the sites of the peak allocation but of
+    the allocations surviving the request (e.g. caches or leaks).
+
+    As tracemalloc traces the whole process, only one request is traced at a time,
+    concurrent requests are not traced (``active`` is False). Allocations of other
+    threads during the request are included.
+    """
+
+    def __init__(self, frames=1, sites=10):
+        self.frames = frames
+        self.sites = sites
+        self.active = False
+        self.peak = None
+        self.surviving_sites = []
+
+    def __enter__(self):
+        if not trace_lock.acquire(blocking=False):
+            return self
+
+        self.active = True
+        self.started = not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start(self.frames)
+            self.baseline_snapshot = None
+        else:
+            self.baseline_snapshot = self.take_snapshot()
+        tracemalloc.reset_peak()
+        self.baseline = tracemalloc.get_traced_memory()[0]
+        return self
+
+    def __exit__(self, *exc_info):
+        if not self.active:
+            return
+
+        try:
+            self.peak = tracemalloc.get_traced_memory()[1] - self.baseline
+            snapshot = self.take_snapshot()
+            if self.baseline_snapshot is None:
+                stats = [
+                    (stat.traceback[0], stat.size, stat.count)
+                    for stat in snapshot.statistics("lineno")
+                ]
+            else:
+                stats = [
+                    (stat.traceback[0], stat.size_diff, stat.count_diff)
+                    for stat in snapshot.compare_to(self.baseline_snapshot, "lineno")
+                ]
+            self.surviving_sites = [
+                (f"{frame.filename}:{frame.lineno}", size, count)
+                for frame, size, count in sorted(stats, key=lambda stat: -stat[1])[: self.sites]
+                if size > 0
+            ]
+        finally:
+            if self.started:
+                tracemalloc.stop()
+            trace_lock.release()
+
+    def take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in IGNORED_FILES]
+        )
+
+    def save(self, view):
+        """
+        Appends the results to the memory records of the process in the memory
+        directory (see ``get_memory_directory``). Errors are logged, the request
+        does not fail.
+        """
+        if not self.active or self.peak is None:
+            return
+
+        directory = get_memory_directory()
+        record = {
+            "view": f"{view.__class__.__module__}.{view.__class__.__qualname__}",
+            "method": view.request.method,
+            "path": view.request.path,
+            "time": time.time(),
+            "peak": self.peak,
+            "surviving_sites": self.surviving_sites,
+        }
+        path = os.path.join(directory, f"{os.getpid()}.jsonl")
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError:
+            logger.exception("Writing the memory record to %s failed.", path)
+
+
+def get_memory_trace():
+    """
+    Returns a ``MemoryTrace`` for a sample of the requests (set using the
+    ``CRUDITOR_MEMORY_SAMPLE_RATE`` setting, e.g. ``0.01`` for 1% of the requests),
+    otherwise None. ``CRUDITOR_MEMORY_FRAMES`` sets the number of frames stored
+    per allocation (default: 1).
+    """
+    sample_rate = getattr(settings, "CRUDITOR_MEMORY_SAMPLE_RATE", 0)
+    if not sample_rate or random.random() >= sample_rate:
+        return None
+    return MemoryTrace(frames=getattr(settings, "CRUDITOR_MEMORY_FRAMES", 1))
+
+
+def get_memory_directory():
+    """
+    Returns the directory of the memory records, ``CRUDITOR_MEMORY_DIR`` (defaults
+    to ``cruditor-memory`` in the temporary directory).
+    """
+    return getattr(settings, "CRUDITOR_MEMORY_DIR", None) or os.path.join(
+        tempfile.gettempdir(), "cruditor-memory"
+    )
+
+
+def load_memory_records(directory=None):
+    """
+    Returns the memory records of all processes.
+    """
+    directory = directory or get_memory_directory()
+    if not os.path.isdir(directory):
+        return []
+
+    records = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".jsonl"):
+            continue
+        with open(os.path.join(directory, filename)) as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Incomplete line of a running process.
+                    continue
+    return records
+
+
+def aggregate_memory_records(records):
+    """
+    Returns a list of dicts with the number of samples, the maximum, mean and 95th
+    percentile peak and the sites of the allocations surviving the requests (with
+    the mean size per sample) per view, ordered by the maximum peak.
+    """
+    views = {}
+    for record in records:
+        views.setdefault(record["view"], []).append(record)
+
+    results = []
+    for view, view_records in views.items():
+        peaks = sorted(record["peak"] for record in view_records)
+        sites = {}
+        for record in view_records:
+            for site, size, count in record["surviving_sites"]:
+                sites[site] = sites.get(site, 0) + size
+        results.append(
+            {
+                "view": view,
+                "samples": len(peaks),
+                "max_peak": peaks[-1],
+                "mean_peak": sum(peaks) / len(peaks),
+                "p95_peak": peaks[min(len(peaks) - 1, int(len(peaks) * 0.95))],
+                "surviving_sites": sorted(
+                    ((site, size / len(peaks)) for site, size in sites.items()),
+                    key=lambda site: -site[1],
+                ),
+            }
+        )
+    return sorted(results, key=lambda result: -result["max_peak"])
+
+
+def clear_memory_records(directory=None):
+    directory = directory or get_memory_directory()
+    if not os.path.isdir(directory):
+        return
+    for filename in os.listdir(directory):
+        if filename.endswith(".jsonl"):
+            os.remove(os.path.join(directory, filename))
@@ -0,0 +1,442 @@
+import atexit
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+#: Name of the file in the metrics directory with the values of exited processes.
+ARCHIVE_FILENAME = "archive.json"
+
+#: Default buckets of histograms (in seconds), the same as used by Prometheus clients.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def escape_label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{{{}}}".format(
+        ",".join(f'{name}="{escape_label_value(value)}"' for name, value in labels)
+    )
+
+
+def format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def get_view_label(view):
+    """
+    Returns the label of a view (the dotted path of its class).
+    """
+    return f"{view.__class__.__module__}.{view.__class__.__qualname__}"
+
+
+def is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class Metric:
+    """
+    Base class of the metrics of a ``MetricsRegistry``. The values are stored by
+    the tuple of label values.
+    """
+
+    type = None
+
+    def __init__(self, registry, name, documentation, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+
+    def get_key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} requires the labels {', '.join(self.labelnames)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def merge(self, values, pid):
+        """
+        Merges the values of another process into the values of this metric.
+        """
+        for key, value in values:
+            key = tuple(key)
+            self.values[key] = self.values.get(key, 0) + value
+
+    def get_samples(self):
+        """
+        Returns a list of tuples of the sample name, labels and value.
+        """
+        return [
+            (self.name, list(zip(self.labelnames, key)), value)
+            for key, value in sorted(self.values.items())
+        ]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self.get_key(labels)
+        with self.registry.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    """
+    Gauge metric. If the values of multiple processes are aggregated, the values
+    get a ``pid`` label, values of processes which are not running anymore are
+    skipped.
+    """
+
+    type = "gauge"
+
+    #: Set when the values of multiple processes are aggregated.
+    pid_label = False
+
+    def set(self, value, **labels):
+        key = self.get_key(labels)
+        with self.registry.lock:
+            self.values[key] = value
+
+    def merge(self, values, pid):
+        if not is_process_alive(pid):
+            return
+        for key, value in values:
+            self.values[(*key, str(pid))] = value
+
+    def get_samples(self):
+        labelnames = (*self.labelnames, "pid") if self.pid_label else self.labelnames
+        return [
+            (self.name, list(zip(labelnames, key)), value)
+            for key, value in sorted(self.values.items())
+        ]
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, registry, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = (*sorted(buckets), math.inf)
+
+    def observe(self, value, **labels):
+        key = self.get_key(labels)
+        with self.registry.lock:
+            # Counts per bucket (not cumulative), the sum and the count.
+            counts = self.values.setdefault(key, [0] * (len(self.buckets) + 2))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            counts[-2] += value
+            counts[-1] += 1
+
+    def merge(self, values, pid):
+        for key, counts in values:
+            current = self.values.setdefault(tuple(key), [0] * len(counts))
+            self.values[tuple(key)] = [a + b for a, b in zip(current, counts)]
+
+    def get_samples(self):
+        samples = []
+        for key, counts in sorted(self.values.items()):
+            labels = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                samples.append(
+                    (f"{self.name}_bucket", labels + [("le", format_value(bound))], cumulative)
+                )
+            samples.append((f"{self.name}_sum", labels, counts[-2]))
+            samples.append((f"{self.name}_count", labels, counts[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    In-process registry of metrics which renders the Prometheus text exposition
+    format.
+
+    For deployments with multiple worker processes (e.g. gunicorn), set the
+    ``CRUDITOR_METRICS_DIR`` setting to a directory shared by the processes. Every
+    process writes its values to a file in the directory (at most once per
+    ``flush_interval`` seconds and at exit), the values of all files are
+    aggregated when rendering.
+
+    Call ``mark_process_dead`` when a worker process exits (e.g. in the
+    ``child_exit`` hook of gunicorn) to move its counters and histograms to the
+    archive of the directory and remove its file. Files of exited processes
+    which were not marked dead are archived when a new process with the same pid
+    writes its values. Clear the directory when the whole service is restarted.
+    """
+
+    #: Minimum number of seconds between writing the values of the process.
+    flush_interval = 1.0
+
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.RLock()
+        self.flushed = None
+        self.flushed_pid = None
+
+    def register(self, metric_class, name, documentation, labelnames=(), **kwargs):
+        with self.lock:
+            if name not in self.metrics:
+                self.metrics[name] = metric_class(
+                    self, name, documentation, labelnames, **kwargs
+                )
+            return self.metrics[name]
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def reset(self):
+        """
+        Removes the values of all metrics of this process.
+        """
+        with self.lock:
+            for metric in self.metrics.values():
+                metric.values = {}
+
+    def get_directory(self):
+        return getattr(settings, "CRUDITOR_METRICS_DIR", None)
+
+    def get_state(self):
+        with self.lock:
+            return {
+                name: [[list(key), value] for key, value in metric.values.items()]
+                for name, metric in self.metrics.items()
+            }
+
+    def flush(self, force=False):
+        """
+        Writes the values of this process to the metrics directory (if configured).
+        Errors are logged, writing the metrics never fails the request.
+        """
+        directory = self.get_directory()
+        if not directory:
+            return
+
+        with self.lock:
+            now, pid = time.monotonic(), os.getpid()
+            first = self.flushed_pid != pid
+            if not force and not first and now - self.flushed < self.flush_interval:
+                return
+
+            if first:
+                atexit.register(self.flush, force=True)
+            self.flushed, self.flushed_pid = now, pid
+
+            path = os.path.join(directory, f"{pid}.json")
+            try:
+                os.makedirs(directory, exist_ok=True)
+                if first:
+                    # The file of an exited process which had the same pid.
+                    self.archive(path)
+                self.write_json(path, self.get_state())
+            except OSError:
+                logger.exception("Writing the metrics to %s failed.", path)
+
+    def write_json(self, path, data):
+        """
+        Writes ``data`` to ``path`` atomically, using a unique temporary file.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def merge_states(self, *states):
+        """
+        Returns the sum of the counter and histogram values of ``states``, the
+        values of gauges are dropped. Values of metrics which are not registered
+        (e.g. in the master process) are kept, archived gauges are ignored when
+        collecting.
+        """
+        merged = {}
+        for state in states:
+            for name, values in state.items():
+                if isinstance(self.metrics.get(name), Gauge):
+                    continue
+                current = merged.setdefault(name, {})
+                for key, value in values:
+                    key = tuple(key)
+                    if isinstance(value, list):
+                        previous = current.get(key, [0] * len(value))
+                        current[key] = [a + b for a, b in zip(previous, value)]
+                    else:
+                        current[key] = current.get(key, 0) + value
+        return {
+            name: [[list(key), value] for key, value in values.items()]
+            for name, values in merged.items()
+        }
+
+    def archive(self, path):
+        """
+        Moves the counter and histogram values of the metrics file ``path`` to the
+        archive of the directory and removes the file.
+        """
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            state = {}
+
+        directory = os.path.dirname(path)
+        with open(os.path.join(directory, "archive.lock"), "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            archive_path = os.path.join(directory, ARCHIVE_FILENAME)
+            try:
+                with open(archive_path) as f:
+                    archive = json.load(f)
+            except (FileNotFoundError, ValueError):
+                archive = {}
+            self.write_json(archive_path, self.merge_states(archive, state))
+            os.remove(path)
+
+    def mark_process_dead(self, pid, directory=None):
+        """
+        Archives the values of the exited process ``pid``, see ``archive``.
+        """
+        directory = directory or self.get_directory()
+        if directory:
+            self.archive(os.path.join(directory, f"{pid}.json"))
+
+    def collect(self):
+        """
+        Returns the metrics with the values of this process and (if the metrics
+        directory is configured) the values of the other processes.
+        """
+        collected = {}
+        with self.lock:
+            for name, metric in self.metrics.items():
+                copy = collected[name] = metric.__class__.__new__(metric.__class__)
+                copy.__dict__.update(metric.__dict__, values=dict(metric.values))
+
+        directory = self.get_directory()
+        if not directory or not os.path.isdir(directory):
+            return list(collected.values())
+
+        for metric in collected.values():
+            if isinstance(metric, Gauge):
+                metric.pid_label = True
+                metric.values = {
+                    (*key, str(os.getpid())): value for key, value in metric.values.items()
+                }
+
+        for filename in sorted(os.listdir(directory)):
+            pid, ext = os.path.splitext(filename)
+            archived = filename == ARCHIVE_FILENAME
+            if not archived and (
+                ext != ".json" or not pid.isdigit() or int(pid) == os.getpid()
+            ):
+                continue
+            try:
+                with open(os.path.join(directory, filename)) as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name, values in state.items():
+                if name in collected and not (archived and isinstance(collected[name], Gauge)):
+                    collected[name].merge(values, 0 if archived else int(pid))
+        return list(collected.values())
+
+    def render(self):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            for name, labels, value in metric.get_samples():
+                lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+#: Default registry used by the Cruditor views.
+registry = MetricsRegistry()
+
+REQUEST_DURATION = registry.histogram(
+    "cruditor_request_duration_seconds",
+    "Duration of Cruditor requests including rendering.",
+    ["view", "method"],
+)
+REQUEST_QUERIES = registry.histogram(
+    "cruditor_request_queries",
+    "Number of database queries of Cruditor requests.",
+    ["view", "method"],
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+REQUESTS = registry.counter(
+    "cruditor_requests_total", "Number of Cruditor requests.", ["view", "method", "status"]
+)
+FORM_SUBMISSIONS = registry.counter(
+    "cruditor_form_submissions_total",
+    "Number of submitted forms by result (valid, invalid).",
+    ["view", "result"],
+)
+DELETIONS = registry.counter(
+    "cruditor_deletions_total",
+    "Number of confirmed deletions by result (deleted, protected).",
+    ["view", "result"],
+)
+LIST_PAGE_ROWS = registry.gauge(
+    "cruditor_list_page_rows", "Number of rows on the last rendered list page.", ["view"]
+)
+LIST_RESULT_COUNT = registry.gauge(
+    "cruditor_list_result_count",
+    "Number of rows (possibly estimated) of the last rendered list.",
+    ["view"],
+)
+
+
+def mark_process_dead(pid, directory=None):
+    """
+    Archives the values of the exited worker process ``pid`` in the metrics
+    directory, e.g. in the ``child_exit`` hook of gunicorn::
+
+        def child_exit(server, worker):
+            from cruditor.metrics import mark_process_dead
+
+            mark_process_dead(worker.pid)
+    """
+    registry.mark_process_dead(pid, directory)
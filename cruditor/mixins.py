@@ -1,15 +1,33 @@
+import logging
+import time
+import warnings
+import weakref
 from collections import OrderedDict
+from contextlib import ExitStack
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.views import REDIRECT_FIELD_NAME, LoginView
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.http import Http404
 from django.shortcuts import redirect
+from django.utils.cache import add_never_cache_headers
 from django.utils.decorators import method_decorator
 from django.utils.translation import gettext
 from django.views.decorators.cache import never_cache
 
+from cruditor import metrics
 from cruditor.datastructures import Breadcrumb
 from cruditor.forms import LoginForm
+from cruditor.memory import get_memory_trace
+from cruditor.profiling import get_request_profile
+from cruditor.queries import QueryBudgetExceeded, QueryCounter
+from cruditor.timing import NULL_TIMER, RequestTimer, get_timing_sinks
+
+logger = logging.getLogger(__name__)
+
+slow_request_logger = logging.getLogger("cruditor.slow_requests")
 
 
 class CruditorMixin:
@@ -37,6 +55,9 @@ class CruditorMixin:
     #: Template name which is included to render the menu.
     menu_template_name = "cruditor/includes/menu.html"
 
+    #: ``NavigationRegistry`` which provides the navigation, see ``get_navigation``.
+    navigation_registry = None
+
     #: Template used to include extra head stuff.
     extrahead_template_name = "cruditor/includes/extrahead.html"
 
@@ -55,21 +76,377 @@ class CruditorMixin:
     #: If not provided, Cruditor tries to look up the verbose name from ``model.Meta``
     model_verbose_name = None
 
+    #: Maximum number of database queries of a request (including rendering the
+    #: response). If None, the number of queries is not checked.
+    max_queries = None
+
+    #: Maximum total duration of the database queries of a request in seconds.
+    #: If None, the duration is not checked.
+    max_query_time = None
+
+    #: What to do if the query budget is exceeded: ``log`` a warning or ``raise``
+    #: ``QueryBudgetExceeded``. If None, the ``CRUDITOR_QUERY_BUDGET_ACTION`` setting
+    #: is used (defaults to ``log``).
+    query_budget_action = None
+
+    #: Requests taking longer (in seconds) are logged with their queries, see
+    #: ``log_slow_request``. If None, the ``CRUDITOR_SLOW_REQUEST_THRESHOLD`` setting
+    #: is used (disabled by default).
+    slow_request_threshold = None
+
+    #: Maximum number of SQL statements (the most recent ones) kept for the slow
+    #: request log, if the log is the only instrumentation of the request.
+    slow_request_max_queries = 100
+
+    #: Record request metrics (see ``cruditor.metrics``). If None, the
+    #: ``CRUDITOR_METRICS`` setting is used (defaults to False).
+    collect_metrics = None
+
+    #: Add a ``Server-Timing`` header with the duration of the phases of the request
+    #: (e.g. ``auth``, ``count``, ``page``, ``context`` and ``render``).
+    server_timing = False
+
+    #: Timer of the request, a ``RequestTimer`` if timing is enabled (see
+    #: ``get_timer``). Use ``with self.timer.phase(name):`` to time custom phases.
+    timer = NULL_TIMER
+
     @method_decorator(never_cache)
     def dispatch(self, request, *args, **kwargs):
+        """
+        Dispatches the request using ``handle_dispatch``.
+
+        If a query budget is set (``max_queries`` or ``max_query_time``) or timing
+        is enabled (see ``get_timer``), the queries are counted, see
+        ``check_query_budget`` and ``finish_timing``. Queries of streaming responses
+        are not counted.
+
+        Requests are profiled if ``get_request_profile`` returns a profile, see
+        ``cruditor.profiling``. If ``get_collect_metrics`` returns True, the duration,
+        queries and status of the request are recorded, see ``cruditor.metrics``. The
+        memory usage of the request is recorded if ``get_memory_trace`` returns a
+        trace, see ``cruditor.memory``.
+
+        Template responses are rendered as usual (after the middlewares), the checks
+        run once the response is rendered and include the rendering, see
+        ``finish_request``.
+
+        Requests taking longer than ``get_slow_request_threshold`` are logged, see
+        ``log_slow_request``. If only the slow request log is enabled, the request is
+        dispatched using ``dispatch_slow_request_log``.
+        """
+        self.timer = self.get_timer()
+        self.collect_metrics = self.get_collect_metrics()
+        profile = self.get_request_profile()
+        memory = self.get_memory_trace()
+        slow_threshold = self.get_slow_request_threshold()
+        budget = self.max_queries is not None or self.max_query_time is not None
+        if not (budget or self.timer.enabled or self.collect_metrics or profile or memory):
+            if slow_threshold is not None:
+                return self.dispatch_slow_request_log(slow_threshold, request, *args, **kwargs)
+            return self.handle_dispatch(request, *args, **kwargs)
+
+        start, counter = time.perf_counter(), QueryCounter()
+        # The profile and the memory trace include the rendering of the response.
+        tracing = ExitStack()
+        for context in (profile, memory):
+            if context is not None:
+                tracing.enter_context(context)
+
+        def finish(response, render_duration):
+            self.finish_request(
+                response,
+                time.perf_counter() - start,
+                render_duration,
+                counter,
+                profile=profile,
+                memory=memory,
+                slow_threshold=slow_threshold,
+                budget=budget,
+            )
+
+        try:
+            with counter:
+                response = self.handle_dispatch(request, *args, **kwargs)
+        except Exception as exc:
+            tracing.close()
+            self.record_failed_request(exc, time.perf_counter() - start, counter)
+            raise
+
+        if not hasattr(response, "render") or response.is_rendered:
+            tracing.close()
+            finish(response, 0)
+            return response
+
+        # Stop tracing if the response is dropped without being rendered (e.g. if a
+        # middleware replaced it), once the response is garbage collected.
+        stop_tracing = weakref.finalize(response, tracing.close)
+        render = response.render
+
+        def render_and_finish():
+            # Remove the wrapper, rendered responses might be pickled (e.g. cached).
+            del response.render
+            render_start = time.perf_counter()
+            try:
+                with counter, self.timer.phase("render"):
+                    render()
+            except Exception as exc:
+                stop_tracing()
+                self.record_failed_request(exc, time.perf_counter() - start, counter)
+                raise
+            stop_tracing()
+            finish(response, time.perf_counter() - render_start)
+            return response
+
+        response.render = render_and_finish
+        return response
+
+    def finish_request(
+        self,
+        response,
+        duration,
+        render_duration,
+        counter,
+        profile=None,
+        memory=None,
+        slow_threshold=None,
+        budget=False,
+    ):
+        """
+        Runs the checks of ``dispatch`` once the response is rendered: records the
+        metrics, logs slow requests, saves the profile and the memory trace, checks
+        the query budget and finishes the timing.
+        """
+        if self.collect_metrics:
+            self.record_request_metrics(response.status_code, duration, counter)
+        if slow_threshold is not None and duration >= slow_threshold:
+            self.log_slow_request(response, duration, render_duration, counter)
+        if profile is not None:
+            profile.save(self)
+        if memory is not None:
+            memory.save(self)
+        if budget:
+            self.check_query_budget(counter)
+        if self.timer.enabled:
+            self.timer.add("db", counter.duration * 1000, f"{counter.count} queries")
+            self.finish_timing(response)
+
+    def record_failed_request(self, exc, duration, counter):
+        """
+        Records the metrics of a request which raised ``exc``.
+        """
+        if not self.collect_metrics:
+            return
+        status = 500
+        if isinstance(exc, Http404):
+            status = 404
+        elif isinstance(exc, PermissionDenied):
+            status = 403
+        self.record_request_metrics(status, duration, counter)
+
+    def dispatch_slow_request_log(self, threshold, request, *args, **kwargs):
+        """
+        Dispatches the request if only the slow request log is enabled. The most
+        recent ``slow_request_max_queries`` SQL statements are kept, the details are
+        only collected if the request took longer than ``threshold``. Template
+        responses are rendered as usual (after the middlewares), the queries and
+        the duration of the rendering are included.
+        """
+        timer, counter = RequestTimer(), QueryCounter(limit=self.slow_request_max_queries)
+        with counter:
+            response = self.handle_dispatch(request, *args, **kwargs)
+
+        if not hasattr(response, "render") or response.is_rendered:
+            if timer.total >= threshold * 1000:
+                self.log_slow_request(response, timer.total / 1000, 0, counter)
+            return response
+
+        render = response.render
+
+        def render_and_log():
+            # Remove the wrapper, rendered responses might be pickled (e.g. cached).
+            del response.render
+            render_start = time.perf_counter()
+            with counter:
+                render()
+            if timer.total >= threshold * 1000:
+                self.log_slow_request(
+                    response, timer.total / 1000, time.perf_counter() - render_start, counter
+                )
+            return response
+
+        response.render = render_and_log
+        return response
+
+    def handle_dispatch(self, request, *args, **kwargs):
         """
         Ensure the user is logged in (by calling `ensure_logged_in`` method).
         If the user is logged in, permissions are checked by calling
         ``ensure_required_permission``.
         """
-        login_result = self.ensure_logged_in(request, *args, **kwargs)
+        with self.timer.phase("auth"):
+            login_result = self.ensure_logged_in(request, *args, **kwargs)
+            if login_result is True:
+                self.ensure_required_permission()
+
         if login_result is not True:
             return login_result
 
-        self.ensure_required_permission()
-
         return super().dispatch(request, *args, **kwargs)
 
+    def get_collect_metrics(self):
+        """
+        Returns True if metrics should be recorded for the request. Uses
+        ``collect_metrics`` if set, otherwise the ``CRUDITOR_METRICS`` setting.
+        """
+        if self.collect_metrics is not None:
+            return self.collect_metrics
+        return getattr(settings, "CRUDITOR_METRICS", False)
+
+    def record_request_metrics(self, status, duration, counter):
+        """
+        Records the status, the duration (in seconds) and the number of queries
+        (from the ``QueryCounter``) of the request.
+        """
+        view, method = metrics.get_view_label(self), self.request.method
+        metrics.REQUESTS.inc(view=view, method=method, status=status)
+        metrics.REQUEST_DURATION.observe(duration, view=view, method=method)
+        metrics.REQUEST_QUERIES.observe(counter.count, view=view, method=method)
+        metrics.registry.flush()
+
+    def get_request_profile(self):
+        """
+        Returns a ``RequestProfile`` if the request should be profiled or None.
+        By default, the ``CRUDITOR_PROFILE_*`` settings are used, see
+        ``cruditor.profiling.get_request_profile``.
+        """
+        return get_request_profile()
+
+    def get_slow_request_threshold(self):
+        """
+        Returns the duration in seconds after which a request is logged as slow
+        request or None. Uses ``slow_request_threshold`` if set, otherwise the
+        ``CRUDITOR_SLOW_REQUEST_THRESHOLD`` setting.
+        """
+        if self.slow_request_threshold is not None:
+            return self.slow_request_threshold
+        return getattr(settings, "CRUDITOR_SLOW_REQUEST_THRESHOLD", None)
+
+    def get_slow_request_details(self, context):
+        """
+        Returns a dict of details of a slow request. ``context`` is the context of
+        the rendered template (or None). Views extend the details, e.g. with the
+        number of rows of the list.
+        """
+        details = {
+            "params": {
+                key: values[0] if len(values) == 1 else values
+                for key, values in sorted(self.request.GET.lists())
+                if any(values)
+            },
+        }
+        if hasattr(super(), "get_slow_request_details"):
+            details.update(super().get_slow_request_details(context))
+        return details
+
+    def log_slow_request(self, response, duration, render_duration, counter):
+        """
+        Logs a slow request to the ``cruditor.slow_requests`` logger. The record
+        has a ``cruditor`` attribute with the view class, the query parameters,
+        the SQL statements with their duration (the most recent
+        ``slow_request_max_queries`` statements), the rendering time and the details
+        returned by ``get_slow_request_details``.
+        """
+        details = {
+            "view": metrics.get_view_label(self),
+            "method": self.request.method,
+            "path": self.request.path,
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 1),
+            "render_ms": round(render_duration * 1000, 1),
+            "query_count": counter.count,
+            "query_ms": round(counter.duration * 1000, 1),
+            "queries": [
+                {"sql": sql, "duration_ms": round(query_duration * 1000, 2)}
+                for sql, query_duration in counter.queries
+            ],
+        }
+        details.update(self.get_slow_request_details(getattr(response, "context_data", None)))
+        slow_request_logger.warning(
+            "Slow request: %s %s (%s) took %.1fms, %d queries (%.1fms), rendering %.1fms",
+            details["method"],
+            details["path"],
+            details["view"],
+            details["duration_ms"],
+            details["query_count"],
+            details["query_ms"],
+            details["render_ms"],
+            extra={"cruditor": details, "request": self.request},
+        )
+
+    def get_memory_trace(self):
+        """
+        Returns a ``MemoryTrace`` if the memory usage of the request should be
+        recorded or None. By default, the ``CRUDITOR_MEMORY_*`` settings are used,
+        see ``cruditor.memory.get_memory_trace``.
+        """
+        return get_memory_trace()
+
+    def get_timer(self):
+        """
+        Returns the timer of the request. A ``RequestTimer`` is used if
+        ``server_timing`` is set or timing sinks are configured (see
+        ``cruditor.timing.get_timing_sinks``), otherwise the timer records nothing.
+        """
+        if self.server_timing or getattr(settings, "CRUDITOR_TIMING_SINKS", None):
+            return RequestTimer()
+        return NULL_TIMER
+
+    def finish_timing(self, response):
+        """
+        Adds the ``Server-Timing`` header (if ``server_timing`` is set) and passes
+        the timer to the configured timing sinks.
+        """
+        if self.server_timing:
+            response.headers["Server-Timing"] = self.timer.get_header()
+        for sink in get_timing_sinks():
+            sink(self, self.timer)
+
+    def get_query_budget_action(self):
+        """
+        Returns the action if the query budget is exceeded, ``log`` or ``raise``.
+        """
+        return self.query_budget_action or getattr(
+            settings, "CRUDITOR_QUERY_BUDGET_ACTION", "log"
+        )
+
+    def check_query_budget(self, counter):
+        """
+        Checks the queries of the request (a ``QueryCounter``) against
+        ``max_queries`` and ``max_query_time``. If the budget is exceeded, a warning
+        with the queries grouped by normalized statement is logged or
+        ``QueryBudgetExceeded`` is raised.
+        """
+        exceeded = []
+        if self.max_queries is not None and counter.count > self.max_queries:
+            exceeded.append(f"{counter.count} queries (max. {self.max_queries})")
+        if self.max_query_time is not None and counter.duration > self.max_query_time:
+            exceeded.append(
+                f"{counter.duration * 1000:.1f}ms query time "
+                f"(max. {self.max_query_time * 1000:.1f}ms)"
+            )
+        if not exceeded:
+            return
+
+        message = "{} {} exceeded its query budget: {}\n{}".format(
+            self.request.method,
+            self.request.path,
+            ", ".join(exceeded),
+            counter.format(),
+        )
+        if self.get_query_budget_action() == "raise":
+            raise QueryBudgetExceeded(message)
+        logger.warning(message, extra={"request": self.request, "view": self})
+
     def get_cruditor_context(self, alternative_title=None, login_context=False):
         """
         Provides some context for all Cruditor templates to render menu, header,
@@ -78,31 +455,32 @@ class CruditorMixin:
         The method takes an optional argument ``alternative_title`` to override
         the default title from ``get_title`` method.
         """
-        constants = {
-            "menu_title": self.menu_title,
-            "menu_template_name": self.menu_template_name,
-            "extrahead_template_name": self.extrahead_template_name,
-            "index_url": self.index_url,
-            "logout_url": self.logout_url,
-            "change_password_url": self.change_password_url,
-        }
+        with self.timer.phase("context"):
+            constants = {
+                "menu_title": self.menu_title,
+                "menu_template_name": self.menu_template_name,
+                "extrahead_template_name": self.extrahead_template_name,
+                "index_url": self.index_url,
+                "logout_url": self.logout_url,
+                "change_password_url": self.change_password_url,
+            }
+
+            if login_context:
+                return {
+                    "title": "Login",
+                    "constants": constants,
+                }
 
-        if login_context:
             return {
-                "title": "Login",
+                "title": alternative_title or self.get_title(),
+                "breadcrumb": self.get_breadcrumb()
+                + [Breadcrumb(title=alternative_title or self.get_breadcrumb_title())],
+                "titlebuttons": self.get_titlebuttons(),
+                "navigation": self.get_navigation(),
+                "form_save_button_label": self.get_form_save_button_label(),
                 "constants": constants,
             }
 
-        return {
-            "title": alternative_title or self.get_title(),
-            "breadcrumb": self.get_breadcrumb()
-            + [Breadcrumb(title=alternative_title or self.get_breadcrumb_title())],
-            "titlebuttons": self.get_titlebuttons(),
-            "navigation": self.get_navigation(),
-            "form_save_button_label": self.get_form_save_button_label(),
-            "constants": constants,
-        }
-
     def get_title(self):
         """
         Returns the title of the page. Uses view's ``title`` property. If not set
@@ -139,6 +517,17 @@ class CruditorMixin:
         return []
 
     def get_navigation(self):
+        """
+        Returns the navigation items to render in the menu. If ``navigation_registry``
+        is set, the compiled navigation filtered by the permissions of the user is
+        returned (see ``cruditor.navigation.NavigationRegistry``). Its menu is cached
+        and rendered with the navigation as only context, ``menu_template_name`` must
+        not use the request, the user or variables of context processors.
+        """
+        if self.navigation_registry is not None:
+            return self.navigation_registry.get_navigation(
+                self.request.user, self.menu_template_name
+            )
         return []
 
     def get_form_save_button_label(self):
@@ -238,6 +627,12 @@ class FormViewMixin:
 
     formset_classes = None
 
+    #: Timer of the request, see ``CruditorMixin.timer``.
+    timer = NULL_TIMER
+
+    #: Record form metrics, see ``CruditorMixin.collect_metrics``.
+    collect_metrics = None
+
     def get_formset_classes(self):
         """
         This method returns the formset classes to render in the form view.
@@ -252,64 +647,94 @@ class FormViewMixin:
         """
         return None
 
+    def get_formsets(self):
+        """
+        Returns the initialized formsets as an OrderedDict. For POST (and PUT)
+        requests, the formsets are bound to the submitted data.
+        """
+        formsets = OrderedDict()
+        for formset_name, formset_class in self.get_formset_classes().items():
+            kwargs = self.get_formset_kwargs(formset_class) or {}
+            if self.request.method in ("POST", "PUT"):
+                formsets[formset_name] = formset_class(
+                    self.request.POST, files=self.request.FILES, instance=self.object, **kwargs
+                )
+            else:
+                formsets[formset_name] = formset_class(instance=self.object, **kwargs)
+        return formsets
+
     def get(self, request, *args, **kwargs):
         """
         Extended get-method to render to form and all formsets properly initialized.
         """
-        self.object = self.get_object()
+        with self.timer.phase("object"):
+            self.object = self.get_object()
+        return self.render_form()
 
-        formsets = OrderedDict(
-            [
-                (
-                    formset_name,
-                    formset_class(
-                        instance=self.object, **(self.get_formset_kwargs(formset_class) or {})
-                    ),
-                )
-                for formset_name, formset_class in self.get_formset_classes().items()
-            ]
-        )
+    def post(self, request, *args, **kwargs):
+        """
+        Extended version of the FormView.post method which validates the form and
+        all configured formsets, see ``process_form``.
+        """
+        with self.timer.phase("object"):
+            self.object = self.get_object()
+        return self.process_form()
 
+    def render_form(self):
+        """
+        Renders the form and all formsets for ``self.object``.
+        """
         return self.render_to_response(
             self.get_context_data(
                 form=self.get_form(self.get_form_class()),
-                formsets=formsets,
+                formsets=self.get_formsets(),
             )
         )
 
-    def post(self, request, *args, **kwargs):
+    def process_form(self):
         """
-        Extended version of the FormView.post method which validates the form and
-        all configured formsets. If everything is valid, ``form_valid`` is called.
-        If something is not valid, ``form_invalid`` is called.
+        Validates the form and all configured formsets. If everything is valid,
+        ``form_valid`` is called. If something is not valid, ``form_invalid`` is called.
 
         Both the form instance and all formset instances are provided to the called
         method. The form is passed as the first argument, the formsets are passed
         as keyword arguments using the formset key from ``formset_classes``.
         """
-        self.object = self.get_object()
-
-        form = self.get_form(self.get_form_class())
-        formsets = OrderedDict(
-            [
-                (
-                    formset_name,
-                    formset_class(
-                        request.POST,
-                        files=request.FILES,
-                        instance=self.object,
-                        **(self.get_formset_kwargs(formset_class) or {}),
-                    ),
-                )
-                for formset_name, formset_class in self.get_formset_classes().items()
-            ]
-        )
+        with self.timer.phase("validate"):
+            form = self.get_form(self.get_form_class())
+            formsets = self.get_formsets()
+            self.processed_forms = (form, formsets)
+            valid = all(
+                [form.is_valid()] + [formset.is_valid() for formset in formsets.values()]
+            )
 
-        if all([form.is_valid()] + [formset.is_valid() for formset in formsets.values()]):
+        if valid:
             return self.form_valid(form, **formsets)
         else:
             return self.form_invalid(form, **formsets)
 
+    def get_slow_request_details(self, context):
+        """
+        Adds the fields with errors of the form and the number of forms and errors
+        of the formsets to the details of slow requests.
+        """
+        form, formsets = getattr(self, "processed_forms", (None, None))
+        if context:
+            form, formsets = context.get("form", form), context.get("formsets", formsets)
+
+        details = {}
+        if form is not None:
+            details["form_errors"] = sorted(form.errors) if form.is_bound else []
+        if formsets:
+            details["formsets"] = {
+                name: {
+                    "forms": len(formset.forms),
+                    "errors": formset.total_error_count() if formset.is_bound else 0,
+                }
+                for name, formset in formsets.items()
+            }
+        return details
+
     def save_form(self, form, **formsets):
         """
         This method is called from ``form_valid`` to actual save the data from the
@@ -335,7 +760,11 @@ class FormViewMixin:
         Saves the data and provides a nice success message, then redirects to the
         ``get_success_url`` url.
         """
-        self.save_form(form, **formsets)
+        with self.timer.phase("save"):
+            self.save_form(form, **formsets)
+
+        if self.collect_metrics:
+            metrics.FORM_SUBMISSIONS.inc(view=metrics.get_view_label(self), result="valid")
 
         messages.success(self.request, self.get_success_message())
 
@@ -345,6 +774,9 @@ class FormViewMixin:
         """
         Re-render the page with the invalid form and/or formsets.
         """
+        if self.collect_metrics:
+            metrics.FORM_SUBMISSIONS.inc(view=metrics.get_view_label(self), result="invalid")
+
         return self.render_to_response(
             self.get_context_data(
                 form=form,
@@ -352,3 +784,176 @@ class FormViewMixin:
                 formset_errors=True,
             )
         )
+
+
+async def aget_user(request):
+    """
+    Returns the user of the request without blocking the event loop. Uses
+    ``request.auser`` (set by the authentication middleware) if available.
+    """
+    if hasattr(request, "auser"):
+        return await request.auser()
+
+    def get_user():
+        # Accessing an attribute evaluates the (lazy) user object.
+        request.user.is_active
+        return request.user
+
+    return await sync_to_async(get_user)()
+
+
+class AsyncCruditorMixin(CruditorMixin):
+    """
+    Async variant of ``CruditorMixin`` for ASGI deployments. The user, the
+    permissions and (for single object views) the object are looked up using
+    async interfaces, the HTTP method handlers of the view have to be async.
+
+    Everything which might access the database lazily (e.g. building the context
+    or saving forms) is run using ``sync_to_async``. Query budgets
+    (``max_queries``, ``max_query_time``), timing (``server_timing``), profiling,
+    memory tracing, metrics and the slow request log are not supported in async
+    views, see ``check_instrumentation``.
+    """
+
+    #: View attributes enabling instrumentation which is not supported in async views.
+    unsupported_attributes = (
+        "max_queries",
+        "max_query_time",
+        "slow_request_threshold",
+        "collect_metrics",
+        "server_timing",
+    )
+
+    #: Settings enabling instrumentation which is not supported in async views.
+    unsupported_settings = (
+        "CRUDITOR_TIMING_SINKS",
+        "CRUDITOR_METRICS",
+        "CRUDITOR_SLOW_REQUEST_THRESHOLD",
+        "CRUDITOR_PROFILE_SAMPLE_RATE",
+        "CRUDITOR_PROFILE_THRESHOLD",
+        "CRUDITOR_MEMORY_SAMPLE_RATE",
+    )
+
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        Async variant of ``CruditorMixin.dispatch``, calls ``check_instrumentation``,
+        ``aensure_logged_in`` and ``aensure_required_permission``.
+        """
+        self.check_instrumentation()
+        response = await self.aensure_logged_in(request, *args, **kwargs)
+        if response is True:
+            await self.aensure_required_permission()
+            # Skip the sync dispatch of CruditorMixin, the handlers are coroutines.
+            response = await super(CruditorMixin, self).dispatch(request, *args, **kwargs)
+
+        add_never_cache_headers(response)
+        return response
+
+    def check_instrumentation(self):
+        """
+        Raises ``ImproperlyConfigured`` if the view enables instrumentation which is
+        not supported in async views (see ``unsupported_attributes``). Settings
+        enabling it (see ``unsupported_settings``) apply to the sync views too, a
+        ``RuntimeWarning`` is issued instead.
+        """
+        attributes = [
+            name
+            for name in self.unsupported_attributes
+            if getattr(self, name) is not None and getattr(self, name) is not False
+        ]
+        if attributes:
+            raise ImproperlyConfigured(
+                f"{self.__class__.__name__} is an async view, {', '.join(attributes)} "
+                "is not supported in async views."
+            )
+
+        # Thresholds are enabled if set (0 logs or profiles all requests).
+        names = [
+            name
+            for name in self.unsupported_settings
+            if (
+                getattr(settings, name, None) is not None
+                if name.endswith("_THRESHOLD")
+                else getattr(settings, name, None)
+            )
+        ]
+        if names:
+            warnings.warn(
+                f"{', '.join(names)} is ignored by the async view {self.__class__.__name__}.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    async def aensure_logged_in(self, request, *args, **kwargs):
+        """
+        Async variant of ``ensure_logged_in``.
+        """
+        user = await aget_user(request)
+        if not user.is_active or (self.staff_required and not user.is_staff):
+            return await sync_to_async(self.handle_not_logged_in)(request, *args, **kwargs)
+
+        return True
+
+    async def aensure_required_permission(self):
+        """
+        Async variant of ``ensure_required_permission``.
+        """
+        required_permission = self.get_required_permission()
+
+        if not required_permission:
+            return
+
+        user = await aget_user(self.request)
+        if hasattr(user, "ahas_perm"):
+            has_perm = await user.ahas_perm(required_permission)
+        else:
+            has_perm = await sync_to_async(user.has_perm)(required_permission)
+
+        if not has_perm:
+            raise PermissionDenied
+
+    async def aget_object(self, queryset=None):
+        """
+        Async variant of Django's ``SingleObjectMixin.get_object``. If you override
+        ``get_object`` in an async view, you have to override this method too.
+        """
+        if queryset is None:
+            queryset = self.get_queryset()
+
+        pk = self.kwargs.get(self.pk_url_kwarg)
+        slug = self.kwargs.get(self.slug_url_kwarg)
+        if pk is not None:
+            queryset = queryset.filter(pk=pk)
+        if slug is not None and (pk is None or self.query_pk_and_slug):
+            queryset = queryset.filter(**{self.get_slug_field(): slug})
+        if pk is None and slug is None:
+            raise AttributeError(
+                f"Generic detail view {self.__class__.__name__} must be called with "
+                "either an object pk or a slug in the URLconf."
+            )
+
+        try:
+            return await queryset.aget()
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                gettext("No %(verbose_name)s found matching the query")
+                % {"verbose_name": queryset.model._meta.verbose_name}
+            )
+
+
+class AsyncFormViewMixin(FormViewMixin):
+    """
+    Async variant of ``FormViewMixin``. The object is fetched using ``aget_object``,
+    rendering and processing the form and formsets is run using ``sync_to_async``.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return await sync_to_async(self.render_form)()
+
+    async def post(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        return await sync_to_async(self.process_form)()
+
+    async def put(self, *args, **kwargs):
+        return await self.post(*args, **kwargs)
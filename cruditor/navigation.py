@@ -0,0 +1,229 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.template.loader import get_template
+from django.urls import get_script_prefix
+from django.utils.functional import cached_property
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from cruditor.datastructures import NavigationDivider, NavigationGroup
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledItem:
+    name: str
+    url: str
+    help_text: str = ""
+    permission: str = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledDivider:
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledGroup:
+    name: str
+    items: tuple
+    help_text: str = ""
+    permission: str = None
+
+
+class Navigation(tuple):
+    """
+    Navigation of a user (a tuple of compiled nodes). The rendered menu is available
+    as ``html`` and cached by the registry, see ``NavigationRegistry.render``.
+    """
+
+    def __new__(cls, items, registry=None, key=None, template_name=None):
+        navigation = super().__new__(cls, items)
+        navigation.registry = registry
+        navigation.key = key
+        navigation.template_name = template_name
+        return navigation
+
+    @cached_property
+    def html(self):
+        if self.registry is None or not self.template_name:
+            return None
+        return self.registry.render(self)
+
+
+class NavigationRegistry:
+    """
+    Compiles the navigation once per process (and per script prefix and language)
+    and caches the navigation and the rendered menu per set of permissions.
+
+    ``build`` is a callable returning the navigation using the data structures of
+    ``cruditor.datastructures`` (``NavigationItem``, ``NavigationGroup`` and
+    ``NavigationDivider``). It is called when the navigation is used first with the
+    active script prefix and language, the URLs and names are resolved at that time
+    (lazy URLs and translations are allowed). Items and groups
+    with a ``permission`` are only shown to users with this permission, groups
+    without visible items are hidden::
+
+        navigation = NavigationRegistry(lambda: [
+            NavigationItem(name="Persons", url=reverse("collection:list")),
+            NavigationItem(
+                name="Add person", url=reverse("collection:add"), permission="store.add_person"
+            ),
+        ])
+
+        class MyCruditorMixin(CruditorMixin):
+            navigation_registry = navigation
+
+    The rendered menu is shared by all users with the same permissions, the menu
+    template only gets the navigation (``cruditor.navigation``) as context. The
+    request, the user and the variables of context processors are not available,
+    render request specific parts outside of the menu template.
+    """
+
+    #: Maximum number of cached navigations and menus.
+    max_entries = 256
+
+    def __init__(self, build):
+        self.build = build
+        self.lock = threading.RLock()
+        self.trees = {}
+        self.permissions = frozenset()
+        self.navigations = OrderedDict()
+        self.menus = OrderedDict()
+
+    def compile_node(self, node):
+        if isinstance(node, NavigationDivider):
+            return CompiledDivider()
+        permission = getattr(node, "permission", None)
+        if isinstance(node, NavigationGroup):
+            return CompiledGroup(
+                name=str(node.name),
+                items=tuple(self.compile_node(item) for item in node.items),
+                help_text=str(node.help_text),
+                permission=permission,
+            )
+        return CompiledItem(
+            name=str(node.name),
+            url=str(node.url),
+            help_text=str(node.help_text),
+            permission=permission,
+        )
+
+    def get_tree_key(self):
+        """
+        Returns the key of the compiled navigation, the URLs and names depend on the
+        script prefix and the language.
+        """
+        return (get_script_prefix(), get_language())
+
+    def get_tree(self):
+        """
+        Returns the compiled navigation, the navigation is built and compiled once
+        per script prefix and language.
+        """
+        key = self.get_tree_key()
+        tree = self.trees.get(key)
+        if tree is None:
+            with self.lock:
+                tree = self.trees.get(key)
+                if tree is None:
+                    tree = tuple(self.compile_node(node) for node in self.build())
+                    self.permissions = self.permissions | frozenset(
+                        getattr(node, "permission", None)
+                        for node in iter_nodes(tree)
+                        if getattr(node, "permission", None)
+                    )
+                    self.trees[key] = tree
+        return tree
+
+    def clear(self):
+        """
+        Drops the compiled navigation and all cached navigations and menus.
+        """
+        with self.lock:
+            self.trees.clear()
+            self.permissions = frozenset()
+            self.navigations.clear()
+            self.menus.clear()
+
+    def get_permission_key(self, user):
+        """
+        Returns the permissions of the user which are used in the navigation, as
+        sorted tuple (``("*",)`` for superusers). The permissions of the user are
+        only looked up if the navigation uses permissions.
+        """
+        self.get_tree()
+        if not self.permissions:
+            return ()
+        if user.is_active and user.is_superuser:
+            return ("*",)
+        return tuple(sorted(self.permissions & user.get_all_permissions()))
+
+    def filter(self, nodes, key):
+        visible = []
+        for node in nodes:
+            permission = getattr(node, "permission", None)
+            if permission and "*" not in key and permission not in key:
+                continue
+            if isinstance(node, CompiledGroup):
+                items = self.filter(node.items, key)
+                if not any(isinstance(item, CompiledItem) for item in items):
+                    continue
+                node = CompiledGroup(node.name, tuple(items), node.help_text, node.permission)
+            if isinstance(node, CompiledDivider) and (
+                not visible or isinstance(visible[-1], CompiledDivider)
+            ):
+                continue
+            visible.append(node)
+        if visible and isinstance(visible[-1], CompiledDivider):
+            visible.pop()
+        return visible
+
+    def get_cached(self, cache, key, build):
+        with self.lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+        value = build()
+        with self.lock:
+            cache[key] = value
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+        return value
+
+    def get_navigation(self, user, template_name=None):
+        """
+        Returns the ``Navigation`` for the user, ``template_name`` is the template
+        used to render the menu.
+        """
+        permissions = self.get_permission_key(user)
+        key = (*self.get_tree_key(), permissions)
+        items = self.get_cached(
+            self.navigations, key, lambda: tuple(self.filter(self.get_tree(), permissions))
+        )
+        return Navigation(items, registry=self, key=key, template_name=template_name)
+
+    def render(self, navigation):
+        """
+        Returns the rendered menu of the navigation, cached by the script prefix, the
+        language, the permissions and the template. The template is rendered with the
+        navigation (``cruditor.navigation``) as only context variable, there is no
+        request and context processors are not run.
+        """
+        return self.get_cached(
+            self.menus,
+            (*navigation.key, navigation.template_name),
+            lambda: mark_safe(
+                get_template(navigation.template_name).render(
+                    {"cruditor": {"navigation": navigation}}
+                )
+            ),
+        )
+
+
+def iter_nodes(nodes):
+    for node in nodes:
+        yield node
+        if isinstance(node, CompiledGroup):
+            yield from iter_nodes(node.items)
@@ -0,0 +1,545 @@
+import base64
+import binascii
+import copy
+import functools
+import hashlib
+import json
+import operator
+from dataclasses import dataclass
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models
+from django.db.models import F, Q
+from django.db.models.expressions import OrderBy
+from django.utils.functional import cached_property
+from django.utils.translation import gettext
+
+from cruditor.search import SearchBackend
+
+
+def resolve_lookup(obj, lookup):
+    """
+    Resolve a queryset-style lookup (e.g. ``person__first_name``) on a record. Records
+    can be model instances or dicts (e.g. when using ``QuerySet.values``).
+    """
+    value = obj
+    for bit in lookup.split("__"):
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            value = value.get(bit)
+        else:
+            value = getattr(value, bit)
+
+    if isinstance(value, models.Model):
+        return value.pk
+    return value
+
+
+class KeysetPaginator:
+    """
+    Paginator which uses keyset (seek) pagination instead of OFFSET/LIMIT. The cursor
+    is derived from the current ordering of the queryset, the primary key is added
+    as a tie-breaker. This way, every page is fetched using the same (indexed) range
+    scan, no matter how deep the user navigates into the result.
+
+    The paginator is meant to be used together with django-tables2's ``RequestConfig``,
+    the "page number" passed to ``page`` is the opaque cursor from the request.
+
+    There is no total count and no page numbers, only links to the next and the
+    previous page are available. Ordering by expressions other than plain fields
+    is not supported. NULL values of nullable fields are sorted the way the
+    database sorts them by default (as largest values on PostgreSQL and Oracle, as
+    smallest values on other databases), explicit ``nulls_first``/``nulls_last``
+    orderings are not supported. The relevance ordering of the full text search
+    (see ``ignored_orderings``) is dropped, the rows are ordered by the remaining
+    ordering.
+    """
+
+    #: Annotations which are removed from the ordering, e.g. the relevance of the full
+    #: text search which is not stable enough to seek to a row.
+    ignored_orderings = (SearchBackend.rank_annotation,)
+
+    #: Marker to allow templates to render keyset-style pagination links.
+    keyset = True
+
+    def __init__(self, object_list, per_page, cursor_field="cursor"):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.cursor_field = cursor_field
+
+    def get_queryset(self):
+        """
+        Returns the (already ordered) queryset behind the table rows.
+        """
+        return self.object_list.data.data
+
+    def get_ordering(self, queryset):
+        """
+        Returns the ordering of the queryset as a list of lookups (prefixed with "-"
+        for descending order). The primary key is appended if not already part
+        of the ordering to get a stable, unique ordering.
+        """
+        ordering = []
+        query = queryset.query
+        source = query.order_by or (query.default_ordering and query.get_meta().ordering) or ()
+
+        for item in source:
+            if (
+                isinstance(item, OrderBy)
+                and isinstance(item.expression, F)
+                and item.expression.name in self.ignored_orderings
+            ):
+                continue
+            if (
+                isinstance(item, OrderBy)
+                and isinstance(item.expression, F)
+                and not (item.nulls_first or item.nulls_last)
+            ):
+                item = "{}{}".format("-" if item.descending else "", item.expression.name)
+            if not isinstance(item, str) or item.lstrip("-") in ("", "?"):
+                raise ImproperlyConfigured(
+                    "Keyset pagination requires an ordering by plain fields."
+                )
+            ordering.append(item)
+
+        pk_name = query.get_meta().pk.name
+        if not any(item.lstrip("-") in ("pk", pk_name) for item in ordering):
+            ordering.append("pk")
+
+        return ordering
+
+    def encode_cursor(self, direction, ordering, record):
+        """
+        Encode the position of a record as an opaque, url-safe cursor string.
+        """
+        values = [resolve_lookup(record, item.lstrip("-")) for item in ordering]
+        payload = json.dumps([direction, ordering, values], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor, ordering):
+        """
+        Decode a cursor created by ``encode_cursor``. Returns ``None`` if the cursor
+        is invalid or was created for a different ordering.
+        """
+        if not cursor or not isinstance(cursor, str):
+            return None
+
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            direction, cursor_ordering, values = json.loads(payload)
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+            return None
+
+        if direction not in ("n", "p") or cursor_ordering != ordering:
+            return None
+
+        return direction, values
+
+    def get_seek_filter(self, ordering, values, nulls_largest=False):
+        """
+        Build the filter to seek to the rows after the provided values using a
+        lexicographic comparison of the ordering. ``nulls_largest`` defines if the
+        database sorts NULL values after all other values in ascending order.
+        """
+        conditions = []
+        for index, item in enumerate(ordering):
+            field, descending = item.lstrip("-"), item.startswith("-")
+            # NULL values come after all other values in this direction.
+            nulls_after = nulls_largest != descending
+
+            if values[index] is None:
+                if nulls_after:
+                    continue
+                condition = Q(**{f"{field}__isnull": False})
+            else:
+                lookup = "lt" if descending else "gt"
+                condition = Q(**{f"{field}__{lookup}": values[index]})
+                if nulls_after:
+                    condition |= Q(**{f"{field}__isnull": True})
+
+            for previous, value in zip(ordering[:index], values[:index]):
+                previous = previous.lstrip("-")
+                if value is None:
+                    condition &= Q(**{f"{previous}__isnull": True})
+                else:
+                    condition &= Q(**{previous: value})
+
+            conditions.append(condition)
+
+        return functools.reduce(operator.or_, conditions) if conditions else Q(pk__in=[])
+
+    def page(self, number):
+        """
+        Returns the page for the provided cursor. Invalid cursors (or the default
+        page number "1") return the first page.
+        """
+        queryset = self.get_queryset()
+        ordering = self.get_ordering(queryset)
+        cursor = self.decode_cursor(number, ordering)
+
+        records = None
+        if cursor:
+            try:
+                records = list(self.get_page_queryset(queryset, ordering, *cursor))
+            except (TypeError, ValueError, ValidationError):
+                cursor = None
+
+        if not cursor:
+            records = list(self.get_page_queryset(queryset, ordering))
+
+        return self.get_page(records, ordering, cursor)
+
+    async def apage(self, number):
+        """
+        Async variant of ``page``, the records are fetched using the async
+        interface of the queryset.
+        """
+        queryset = self.get_queryset()
+        ordering = self.get_ordering(queryset)
+        cursor = self.decode_cursor(number, ordering)
+
+        records = None
+        if cursor:
+            try:
+                records = [
+                    record
+                    async for record in self.get_page_queryset(queryset, ordering, *cursor)
+                ]
+            except (TypeError, ValueError, ValidationError):
+                cursor = None
+
+        if not cursor:
+            records = [record async for record in self.get_page_queryset(queryset, ordering)]
+
+        return self.get_page(records, ordering, cursor)
+
+    def get_page_queryset(self, queryset, ordering, direction="n", values=None):
+        """
+        Returns the queryset to fetch the records for a page, plus one additional
+        record to detect if there are more rows available. When seeking backwards
+        (direction "p"), the ordering is reversed.
+        """
+        if direction == "p":
+            ordering = [item[1:] if item.startswith("-") else f"-{item}" for item in ordering]
+        if values is not None:
+            nulls_largest = connections[queryset.db].features.nulls_order_largest
+            queryset = queryset.filter(self.get_seek_filter(ordering, values, nulls_largest))
+        return queryset.order_by(*ordering)[: self.per_page + 1]
+
+    def get_page(self, records, ordering, cursor=None):
+        """
+        Build the page for the fetched records and the cursor used to fetch them.
+        """
+        backwards = bool(cursor) and cursor[0] == "p"
+        has_more = len(records) > self.per_page
+        records = records[: self.per_page]
+        if backwards:
+            records.reverse()
+
+        return KeysetPage(
+            self.object_list.__class__(records, table=self.object_list.table),
+            self,
+            previous_cursor=(
+                self.encode_cursor("p", ordering, records[0])
+                if records and (has_more if backwards else cursor)
+                else None
+            ),
+            next_cursor=(
+                self.encode_cursor("n", ordering, records[-1])
+                if records and (backwards or has_more)
+                else None
+            ),
+        )
+
+
+class KeysetPage:
+    """
+    A page of a ``KeysetPaginator``. Provides the cursors to the next and the previous
+    page.
+    """
+
+    def __init__(self, object_list, paginator, previous_cursor=None, next_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.previous_cursor = previous_cursor
+        self.next_cursor = next_cursor
+
+    def __repr__(self):
+        return f"<KeysetPage next={self.next_cursor} previous={self.previous_cursor}>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+@dataclass
+class ResultCount:
+    """
+    Result of a count strategy. ``accuracy`` is one of "exact", "more_than" (the
+    value is a lower bound) or "about" (the value is an estimate).
+    """
+
+    value: int
+    accuracy: str = "exact"
+
+    @property
+    def exact(self):
+        return self.accuracy == "exact"
+
+
+class ExactCount:
+    """
+    Count strategy which counts all rows (``COUNT(*)`` for QuerySets).
+    """
+
+    def count(self, data):
+        if hasattr(data, "query"):
+            return ResultCount(data.count())
+        return ResultCount(len(data))
+
+    async def acount(self, data):
+        if hasattr(data, "query"):
+            return ResultCount(await data.acount())
+        return ResultCount(len(data))
+
+
+class CappedCount(ExactCount):
+    """
+    Count strategy which stops counting after ``limit`` rows. If there are more
+    rows, the result is reported as "more than ``limit``".
+    """
+
+    def __init__(self, limit=10000):
+        self.limit = limit
+
+    def count(self, data):
+        if not hasattr(data, "query"):
+            return super().count(data)
+
+        return self.get_result(data[: self.limit + 1].count())
+
+    async def acount(self, data):
+        if not hasattr(data, "query"):
+            return await super().acount(data)
+
+        return self.get_result(await data[: self.limit + 1].acount())
+
+    def get_result(self, value):
+        if value > self.limit:
+            return ResultCount(self.limit, "more_than")
+        return ResultCount(value)
+
+
+class EstimatedCount(ExactCount):
+    """
+    Count strategy which uses the row estimate of the database query planner.
+    Only PostgreSQL is supported, other databases fall back to an exact count.
+
+    If the estimate is below ``threshold``, an exact count is performed as small
+    results are cheap to count and estimates tend to be inaccurate for them.
+    """
+
+    def __init__(self, threshold=1000):
+        self.threshold = threshold
+
+    def count(self, data):
+        if not hasattr(data, "query") or connections[data.db].vendor != "postgresql":
+            return super().count(data)
+
+        estimate = self.get_estimate(data)
+        if estimate < self.threshold:
+            return super().count(data)
+        return ResultCount(estimate, "about")
+
+    async def acount(self, data):
+        # There is no async interface for raw database cursors.
+        return await sync_to_async(self.count)(data)
+
+    def get_estimate(self, queryset):
+        """
+        Returns the number of rows the PostgreSQL planner expects for the queryset.
+        """
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def normalize_filter_value(value):
+    """
+    Returns a JSON serializable representation of a filter value (e.g. from the
+    ``cleaned_data`` of a filter form) to build cache keys. Model instances are
+    replaced by their primary key and multiple values are sorted.
+    """
+    if isinstance(value, models.Model):
+        return value.pk
+    if isinstance(value, (list, tuple, set, frozenset, models.QuerySet)):
+        return sorted((normalize_filter_value(item) for item in value), key=str)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class CachedCount:
+    """
+    Count strategy which caches the result of another count strategy for a short
+    time. List views bind the strategy to the view and the normalized filter values
+    of the request (see ``with_key`` and ``CruditorListView.get_count_cache_key``),
+    the same filters share the cached count regardless of the order of the
+    parameters or the sorting. Without a key (e.g. if the filter form is invalid),
+    the cache key is built from the SQL query of the queryset to count.
+    """
+
+    def __init__(self, strategy=None, timeout=60, cache_alias="default", key=None):
+        self.strategy = strategy or ExactCount()
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.key = key
+
+    def with_key(self, key):
+        """
+        Returns a copy of the strategy which uses ``key`` (a string) to build the
+        cache key instead of the SQL query.
+        """
+        strategy = copy.copy(self)
+        strategy.key = key
+        return strategy
+
+    def get_cache_key(self, queryset):
+        if self.key is not None:
+            source = f"{queryset.db}:{self.key}"
+        else:
+            sql, params = queryset.order_by().query.sql_with_params()
+            source = f"{queryset.db}:{sql}:{params!r}"
+        digest = hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()
+        return f"cruditor:count:{queryset.model._meta.label_lower}:{digest}"
+
+    def count(self, data):
+        if not hasattr(data, "query"):
+            return self.strategy.count(data)
+
+        cache = caches[self.cache_alias]
+        key = self.get_cache_key(data)
+        result = cache.get(key)
+        if result is None:
+            result = self.strategy.count(data)
+            cache.set(key, (result.value, result.accuracy), self.timeout)
+            return result
+        return ResultCount(*result)
+
+    async def acount(self, data):
+        if not hasattr(data, "query"):
+            return await self.strategy.acount(data)
+
+        cache = caches[self.cache_alias]
+        key = self.get_cache_key(data)
+        result = await cache.aget(key)
+        if result is None:
+            result = await self.strategy.acount(data)
+            await cache.aset(key, (result.value, result.accuracy), self.timeout)
+            return result
+        return ResultCount(*result)
+
+
+class CruditorPaginator(Paginator):
+    """
+    Paginator for django-tables2 tables which gets the number of rows using a
+    count strategy (``ExactCount`` by default).
+
+    If the count is not exact, every page number is accepted and the paginator
+    looks ahead one row to find out if there is a next page.
+    """
+
+    def __init__(self, object_list, per_page, count_strategy=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy or ExactCount()
+
+    @cached_property
+    def result_count(self):
+        return self.count_strategy.count(self.object_list.data.data)
+
+    @cached_property
+    def count(self):
+        return self.result_count.value
+
+    def validate_number(self, number):
+        if self.result_count.exact:
+            return super().validate_number(number)
+
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(gettext("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(gettext("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        if self.result_count.exact:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        rows = self.get_lookahead_rows(number)
+        rows.data = list(rows.data)
+        return self.get_lookahead_page(rows, number)
+
+    async def apage(self, number):
+        """
+        Async variant of ``page``, the count and the rows of the page are fetched
+        using the async interface of the queryset.
+        """
+        data = self.object_list.data.data
+        if not hasattr(data, "query"):
+            return self.page(number)
+
+        if "result_count" not in self.__dict__:
+            self.result_count = await self.count_strategy.acount(data)
+
+        if self.result_count.exact:
+            page = super().page(number)
+            page.object_list.data = [record async for record in page.object_list.data]
+            return page
+
+        number = self.validate_number(number)
+        rows = self.get_lookahead_rows(number)
+        rows.data = [record async for record in rows.data]
+        return self.get_lookahead_page(rows, number)
+
+    def get_lookahead_rows(self, number):
+        """
+        Returns the rows of a page plus one additional row (not yet evaluated).
+        """
+        bottom = (number - 1) * self.per_page
+        return self.object_list[bottom : bottom + self.per_page + 1]
+
+    def get_lookahead_page(self, rows, number):
+        """
+        Build the page from the evaluated rows returned by ``get_lookahead_rows``,
+        the number of pages is updated depending on the additional row.
+        """
+        records = rows.data
+        rows.data = records[: self.per_page]
+
+        if len(records) > self.per_page:
+            self.num_pages = max(self.num_pages, number + 1)
+        else:
+            self.num_pages = number
+
+        return self._get_page(rows, number, self)
@@ -0,0 +1,201 @@
+import cProfile
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CProfiler:
+    """
+    Deterministic profiler using ``cProfile``, the dumps can be analyzed using
+    ``pstats`` or tools like snakeviz.
+    """
+
+    extension = "prof"
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def dump(self, path):
+        self.profile.dump_stats(path)
+
+
+class StackSampler:
+    """
+    Statistical profiler which samples the stack of the profiled thread every
+    ``interval`` seconds from a background thread. The overhead is low enough to
+    profile every request. The dumps are written in the folded stack format (one
+    line per stack, e.g. for flamegraph.pl or speedscope).
+    """
+
+    extension = "folded"
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread_id = threading.get_ident()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[self.get_stack(frame)] += 1
+
+    def get_stack(self, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def dump(self, path):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+#: Available profilers, selected by the ``CRUDITOR_PROFILER`` setting.
+PROFILERS = {"cprofile": CProfiler, "sampler": StackSampler}
+
+
+class RequestProfile:
+    """
+    Profiles a request (used as context manager). The profile is written if the
+    request was ``sampled`` or if it took at least ``threshold`` seconds.
+    """
+
+    def __init__(self, profiler, sampled=True, threshold=None):
+        self.profiler = profiler
+        self.sampled = sampled
+        self.threshold = threshold
+        self.duration = None
+        self.active = False
+
+    def __enter__(self):
+        try:
+            self.profiler.start()
+            self.active = True
+        except ValueError:
+            # Another profiler (e.g. a coverage tool) is active in this thread.
+            pass
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.duration = time.perf_counter() - self.start
+        if self.active:
+            self.profiler.stop()
+
+    def should_save(self):
+        if not self.active or self.duration is None:
+            return False
+        return self.sampled or (self.threshold is not None and self.duration >= self.threshold)
+
+    def save(self, view):
+        """
+        Writes the profile to the profile directory of the view (see
+        ``get_profile_directory``) if the request was sampled or slow. Only the
+        latest ``CRUDITOR_PROFILE_KEEP`` dumps (default: 20) per view are kept.
+        Returns the path of the dump or None. Errors are logged, the request does
+        not fail.
+        """
+        if not self.should_save():
+            return None
+
+        directory = get_profile_directory(view)
+        path = os.path.join(
+            directory,
+            "{}-{}-{}ms.{}".format(
+                datetime.now().strftime("%Y%m%dT%H%M%S%f"),
+                view.request.method,
+                round(self.duration * 1000),
+                self.profiler.extension,
+            ),
+        )
+        try:
+            os.makedirs(directory, exist_ok=True)
+            self.profiler.dump(path)
+            rotate_profiles(directory, getattr(settings, "CRUDITOR_PROFILE_KEEP", 20))
+        except OSError:
+            logger.exception("Writing the profile to %s failed.", path)
+            return None
+        return path
+
+
+def get_request_profile():
+    """
+    Returns a ``RequestProfile`` if the current request should be profiled, or None.
+
+    The sample of profiled requests is set using ``CRUDITOR_PROFILE_SAMPLE_RATE``
+    (e.g. ``0.01`` for 1% of the requests). If ``CRUDITOR_PROFILE_THRESHOLD`` is set
+    (in seconds), all requests are profiled and the profiles of requests which took
+    longer are kept too, use the ``sampler`` profiler to keep the overhead low.
+    The profiler is selected using ``CRUDITOR_PROFILER`` (``cprofile`` or
+    ``sampler``, see ``PROFILERS``).
+    """
+    sample_rate = getattr(settings, "CRUDITOR_PROFILE_SAMPLE_RATE", 0)
+    threshold = getattr(settings, "CRUDITOR_PROFILE_THRESHOLD", None)
+    if not sample_rate and threshold is None:
+        return None
+
+    sampled = random.random() < sample_rate
+    if not sampled and threshold is None:
+        return None
+
+    profiler_class = PROFILERS[getattr(settings, "CRUDITOR_PROFILER", "cprofile")]
+    return RequestProfile(profiler_class(), sampled=sampled, threshold=threshold)
+
+
+def get_profile_directory(view):
+    """
+    Returns the directory for the profiles of the view, a directory named like the
+    view class in ``CRUDITOR_PROFILE_DIR`` (defaults to ``cruditor-profiles`` in
+    the temporary directory).
+    """
+    base = getattr(settings, "CRUDITOR_PROFILE_DIR", None) or os.path.join(
+        tempfile.gettempdir(), "cruditor-profiles"
+    )
+    return os.path.join(base, f"{view.__class__.__module__}.{view.__class__.__qualname__}")
+
+
+def rotate_profiles(directory, keep):
+    """
+    Removes all but the latest ``keep`` profiles in the directory.
+    """
+    names = sorted(
+        name
+        for name in os.listdir(directory)
+        if name.endswith(tuple(f".{profiler.extension}" for profiler in PROFILERS.values()))
+    )
+    for name in names[: max(len(names) - keep, 0)]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            # Removed by a concurrent request.
+            pass
@@ -0,0 +1,93 @@
+import re
+import time
+from collections import deque
+from contextlib import ExitStack
+
+from django.db import connections
+
+NORMALIZE_PATTERNS = (
+    # String literals
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    # Numbers which are not part of identifiers
+    (re.compile(r"(?<![\w\"`.])-?\d+(?:\.\d+)?\b"), "?"),
+    # Lists of values, e.g. IN (?, ?, ?) or VALUES (?, ?), (?, ?)
+    (re.compile(r"\((?:\s*(?:%s|\?|NULL)\s*,)*\s*(?:%s|\?|NULL)\s*\)", re.I), "(...)"),
+    (re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+"), "(...)"),
+    (re.compile(r"\s+"), " "),
+)
+
+
+def normalize_sql(sql):
+    """
+    Returns the SQL statement with literals and lists of values replaced by
+    placeholders, queries which only differ in their parameters (like the queries
+    of an N+1 problem) have the same normalized statement.
+    """
+    for pattern, replacement in NORMALIZE_PATTERNS:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+class QueryBudgetExceeded(Exception):
+    """
+    Raised if a view exceeds its query budget (``max_queries`` or ``max_query_time``)
+    and the budget action is ``raise``.
+    """
+
+
+class QueryCounter:
+    """
+    Context manager which counts the queries (and their duration) executed on all
+    database connections of the current thread, using Django's execute wrappers.
+    If ``limit`` is set, only the most recent ``limit`` statements are kept in
+    ``queries``, ``count`` and ``duration`` include all queries.
+    """
+
+    def __init__(self, limit=None):
+        self.queries = deque(maxlen=limit)
+        self.count = 0
+        self.duration = 0
+        self.stack = None
+
+    def __enter__(self):
+        self.stack = ExitStack()
+        for connection in connections.all():
+            self.stack.enter_context(connection.execute_wrapper(self))
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stack.close()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.queries.append((sql, duration))
+            self.count += 1
+            self.duration += duration
+
+    def group(self):
+        """
+        Returns a list of tuples of the normalized statement, the number of queries
+        and their total duration, ordered by the number of queries.
+        """
+        groups = {}
+        for sql, duration in self.queries:
+            statement = normalize_sql(sql)
+            count, total = groups.get(statement, (0, 0))
+            groups[statement] = (count + 1, total + duration)
+        return sorted(
+            ((sql, count, total) for sql, (count, total) in groups.items()),
+            key=lambda group: (-group[1], -group[2]),
+        )
+
+    def format(self, limit=10):
+        """
+        Returns a summary of the most frequent normalized statements.
+        """
+        return "\n".join(
+            f"{count:>5}x {total * 1000:>8.1f}ms  {sql}"
+            for sql, count, total in self.group()[:limit]
+        )
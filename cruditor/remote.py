@@ -0,0 +1,419 @@
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlencode, urljoin
+
+from django.core.cache import caches
+from django.db import connections
+from django.utils.functional import cached_property
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    # requests is optional, it is only required if the remote client is used.
+    requests = None
+
+
+class RemoteError(Exception):
+    """
+    Base exception of the remote client.
+    """
+
+
+#: Exceptions which indicate a failed request.
+REQUEST_ERRORS = (RemoteError, requests.RequestException) if requests else (RemoteError,)
+
+
+class CircuitOpenError(RemoteError):
+    """
+    Raised if a request is refused because the circuit breaker is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker to stop calling a failing remote service. After
+    ``failure_threshold`` consecutive failures, the circuit opens and requests
+    are refused for ``reset_timeout`` seconds. Afterwards, a single trial request
+    is let through ("half open"), if it succeeds, the circuit is closed again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self):
+        """
+        Returns True if a request may be sent. In half open state, only one trial
+        request is allowed until its result is recorded.
+        """
+        with self.lock:
+            state = self.state
+            if state == "half-open":
+                # Re-open the circuit until the trial request succeeded.
+                self.opened_at = time.monotonic()
+                return True
+            return state == "closed"
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class RemoteClient:
+    """
+    HTTP client for remote backed collections (e.g. in ``get_queryset``,
+    ``get_object`` or a ``CruditorDataSource``). Use one client per remote service
+    and share it (e.g. on module level) to benefit from connection pooling.
+
+    * Connections are kept alive and pooled using a ``requests.Session``.
+    * GET responses are cached using the Django cache. After ``max_age`` seconds,
+      responses are revalidated using ``ETag``/``Last-Modified`` headers.
+    * If ``stale_while_revalidate`` is enabled (e.g. for list endpoints), a stale
+      response is returned immediately and revalidated in the background.
+    * If the service fails (or the circuit breaker is open), a cached response is
+      returned if available.
+    * Unsafe requests (POST, PUT, PATCH, DELETE) invalidate all cached responses
+      of the client.
+
+    All options can be passed as keyword arguments or set on a subclass.
+    """
+
+    #: Base URL of the remote service, paths are resolved relative to it.
+    base_url = ""
+
+    #: Default headers sent with every request.
+    headers = None
+
+    #: Timeout in seconds, a single value or a (connect, read) tuple.
+    timeout = (3.05, 10)
+
+    #: Number of connection pools (one per host) to cache.
+    pool_connections = 10
+
+    #: Maximum number of connections kept alive per host.
+    pool_maxsize = 10
+
+    #: Number of retries for failed connections, see urllib3's ``Retry``.
+    max_retries = 0
+
+    #: Cache alias used to cache GET responses. Set to None to disable caching.
+    cache_alias = "default"
+
+    #: Seconds a cached response is considered fresh.
+    max_age = 60
+
+    #: Seconds a stale response is kept to be served while revalidating or on errors.
+    stale_ttl = 300
+
+    #: Serve stale responses while revalidating them in the background.
+    stale_while_revalidate = False
+
+    #: Number of consecutive failures which open the circuit breaker.
+    failure_threshold = 5
+
+    #: Seconds the circuit breaker stays open before a trial request is sent.
+    reset_timeout = 30
+
+    def __init__(self, base_url=None, **kwargs):
+        if base_url is not None:
+            self.base_url = base_url
+
+        for key, value in kwargs.items():
+            if not hasattr(self.__class__, key):
+                raise TypeError(f"{self.__class__.__name__} got an unexpected option {key!r}")
+            setattr(self, key, value)
+
+        self.circuit_breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        self.revalidating = set()
+        self.lock = threading.Lock()
+
+    @cached_property
+    def session(self):
+        """
+        Returns the ``requests.Session`` with pooled adapters for http and https.
+        """
+        if requests is None:
+            raise RemoteError("The remote client requires the requests package.")
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self.headers or {})
+        return session
+
+    @cached_property
+    def executor(self):
+        """
+        Executor used to revalidate stale responses in the background.
+        """
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="cruditor-remote")
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias] if self.cache_alias else None
+
+    def get_url(self, path):
+        return urljoin(self.base_url, path)
+
+    def get_generation_key(self):
+        """
+        Returns the cache key of the generation counter, which is part of all cache
+        keys of this client. Bumping the generation (see ``invalidate``) invalidates
+        all cached responses.
+        """
+        digest = hashlib.md5(self.base_url.encode(), usedforsecurity=False).hexdigest()
+        return f"cruditor:remote:{digest}:generation"
+
+    def get_cache_prefix(self):
+        key = self.get_generation_key()
+        return "{}:{}".format(key.rsplit(":", 1)[0], self.cache.get(key, 0))
+
+    def get_cache_key(self, url, params=None):
+        digest = hashlib.md5(
+            f"{url}?{urlencode(sorted((params or {}).items()), doseq=True)}".encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return f"{self.get_cache_prefix()}:{digest}"
+
+    def invalidate(self):
+        """
+        Invalidate all cached responses of the client.
+        """
+        if self.cache is None:
+            return
+
+        key = self.get_generation_key()
+        self.cache.add(key, 0, None)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, 1, None)
+
+    def request(self, method, path, **kwargs):
+        """
+        Send a request to the remote service and return the response. Connection
+        errors, timeouts and server errors are recorded by the circuit breaker,
+        ``CircuitOpenError`` is raised if the circuit is open.
+        """
+        if not self.circuit_breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {self.base_url}")
+
+        kwargs.setdefault("timeout", self.timeout)
+        try:
+            response = self.session.request(method, self.get_url(path), **kwargs)
+        except requests.RequestException:
+            self.circuit_breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+        response.raise_for_status()
+        return response
+
+    def get(self, path, params=None, stale_while_revalidate=None):
+        """
+        Fetch a (cached) JSON response. See the class documentation for details
+        on caching.
+        """
+        if self.cache is None:
+            return self.decode(self.request("GET", path, params=params))
+
+        if stale_while_revalidate is None:
+            stale_while_revalidate = self.stale_while_revalidate
+
+        key = self.get_cache_key(self.get_url(path), params)
+        entry = self.cache.get(key)
+        if entry is not None:
+            age = time.time() - entry["fetched"]
+            if age < self.max_age:
+                return entry["data"]
+            if stale_while_revalidate:
+                self.schedule_revalidation(key, path, params, entry)
+                return entry["data"]
+
+        try:
+            return self.fetch(key, path, params, entry)
+        except REQUEST_ERRORS as e:
+            # Serve stale data if the remote service fails, but not on client errors.
+            response = getattr(e, "response", None)
+            if entry is None or (response is not None and response.status_code < 500):
+                raise
+            return entry["data"]
+
+    def fetch(self, key, path, params, entry=None):
+        """
+        Fetch a response (conditionally, if there is a cached ``entry``) and update
+        the cache.
+        """
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.request("GET", path, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            entry = dict(entry, fetched=time.time())
+        else:
+            entry = {
+                "data": self.decode(response),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched": time.time(),
+            }
+
+        if "no-store" not in response.headers.get("Cache-Control", ""):
+            self.cache.set(key, entry, self.max_age + self.stale_ttl)
+        return entry["data"]
+
+    def schedule_revalidation(self, key, path, params, entry):
+        """
+        Revalidate a stale response in the background, at most once at a time.
+        """
+        with self.lock:
+            if key in self.revalidating:
+                return
+            self.revalidating.add(key)
+
+        def revalidate():
+            try:
+                self.fetch(key, path, params, entry)
+            except REQUEST_ERRORS:
+                pass
+            finally:
+                with self.lock:
+                    self.revalidating.discard(key)
+
+        return self.executor.submit(revalidate)
+
+    def send(self, method, path, **kwargs):
+        """
+        Send an unsafe request (e.g. POST) and return the decoded response. All
+        cached responses of the client are invalidated.
+        """
+        try:
+            return self.decode(self.request(method, path, **kwargs))
+        finally:
+            self.invalidate()
+
+    def post(self, path, **kwargs):
+        return self.send("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.send("PUT", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.send("PATCH", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.send("DELETE", path, **kwargs)
+
+    def decode(self, response):
+        """
+        Decode the JSON body of a response, empty bodies are returned as None.
+        """
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except json.JSONDecodeError:
+            raise RemoteError(f"Invalid JSON response from {response.url}")
+
+
+def fan_out(func, items, max_workers=8, timeout=None):
+    """
+    Call ``func`` for every item concurrently using a bounded thread pool. Every
+    call may take up to ``timeout`` seconds (measured from the start of the call).
+    Calls which didn't start until every worker could have run its calls with the
+    full timeout are given up too.
+
+    Returns a tuple of the results (in the order of the items) and a dict of
+    errors by item index. Failed or timed out calls have a result of None and the
+    raised exception (or ``TimeoutError``) as error.
+    """
+    items = list(items)
+    results, errors = [None] * len(items), {}
+    if not items:
+        return results, errors
+
+    started = {}
+
+    def call(index, item):
+        started[index] = time.monotonic()
+        try:
+            return func(item)
+        finally:
+            # Database connections are per thread, don't leak them.
+            connections.close_all()
+
+    max_workers = min(max_workers, len(items))
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="cruditor-fan-out"
+    )
+    if timeout is not None:
+        rounds = -(-len(items) // max_workers)
+        overall_deadline = time.monotonic() + timeout * rounds
+
+    futures = {executor.submit(call, index, item): index for index, item in enumerate(items)}
+    pending = set(futures)
+
+    try:
+        while pending:
+            wait_timeout = None
+            if timeout is not None:
+                now = time.monotonic()
+                deadlines = [started.get(futures[future], now) + timeout for future in pending]
+                wait_timeout = max(min(deadlines + [overall_deadline]) - now, 0)
+
+            done, pending = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    errors[index] = e
+
+            if timeout is not None:
+                now = time.monotonic()
+                for future in list(pending):
+                    index = futures[future]
+                    if now >= overall_deadline or (
+                        index in started and now - started[index] >= timeout
+                    ):
+                        errors[index] = TimeoutError(f"Call timed out after {timeout} seconds")
+                        pending.discard(future)
+    finally:
+        # Don't wait for timed out calls, the threads finish in the background.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results, errors
@@ -0,0 +1,296 @@
+import functools
+import operator
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.utils import names_digest
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Upper
+
+try:
+    from django.contrib.postgres.indexes import GinIndex, OpClass
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+    from django.db.backends.postgresql import psycopg_any  # noqa: F401
+except ImportError:
+    # psycopg is optional, it is only required for the PostgreSQL search backend.
+    SearchQuery = None
+
+#: FTS5 tables of ``SQLiteSearchBackend`` by database alias and table name, True if the
+#: table exists (see ``SQLiteSearchBackend.has_index``).
+fts_tables = {}
+
+
+class SearchBackend:
+    """
+    Base class of the full text search backends used by ``MultiCharFilter`` for
+    fields prefixed with "@". The base class falls back to an OR of ``icontains``
+    lookups without ranking, it is used for databases without a specific backend.
+    """
+
+    #: Name of the annotation holding the relevance of a row (higher is better).
+    rank_annotation = "search_rank"
+
+    def get_query(self, queryset, fields, value):
+        """
+        Returns a tuple of the (annotated) queryset and a Q object matching the rows
+        of the queryset which contain ``value`` in one of the ``fields``.
+        """
+        return queryset, functools.reduce(
+            operator.or_, [Q(**{f"{field}__icontains": value}) for field in fields]
+        )
+
+    def order_by_rank(self, queryset):
+        """
+        Orders the queryset by relevance, the previous ordering is used to order
+        rows of the same relevance.
+        """
+        if self.rank_annotation not in queryset.query.annotations:
+            return queryset
+
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.order_by(F(self.rank_annotation).desc(nulls_last=True), *ordering)
+
+    def get_index_name(self, model, fields, suffix):
+        digest = names_digest(model._meta.db_table, *fields, length=8)
+        return f"{model._meta.db_table[:16]}_{digest}_{suffix}"
+
+    def create_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        """
+        Creates the database objects required to search ``fields`` of ``model``.
+        Call it from a migration (``RunPython``), see ``drop_index`` to revert it.
+        """
+
+    def drop_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        """
+        Removes the database objects created by ``create_index``.
+        """
+
+    def rebuild_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        """
+        Rebuilds the search index, e.g. after bulk imports which bypassed it.
+        """
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Search backend using PostgreSQL full text search. The fields are combined to a
+    single ``SearchVector`` which is matched using a websearch query (supporting
+    quoted phrases, "or" and "-"). Rows are ranked using ``SearchRank``.
+
+    If ``trigram`` is enabled, rows which contain the value in one of the fields
+    (like ``icontains``) are matched too, this requires the ``pg_trgm`` extension.
+    ``create_index`` adds GIN indexes for the search vector and the trigrams.
+    """
+
+    #: Name of the annotation holding the search vector.
+    vector_annotation = "search_vector"
+
+    def __init__(self, config="simple", trigram=False):
+        if SearchQuery is None:
+            raise ImproperlyConfigured("The PostgreSQL search backend requires psycopg.")
+        self.config = config
+        self.trigram = trigram
+
+    def get_vector(self, fields):
+        return SearchVector(*fields, config=self.config)
+
+    def get_query(self, queryset, fields, value):
+        vector = self.get_vector(fields)
+        search_query = SearchQuery(value, config=self.config, search_type="websearch")
+        queryset = queryset.annotate(
+            **{
+                self.vector_annotation: vector,
+                self.rank_annotation: SearchRank(vector, search_query),
+            }
+        )
+
+        # The vector expression is inlined, the index created by ``create_index`` is used.
+        query = Q(**{self.vector_annotation: search_query})
+        if self.trigram:
+            query |= super().get_query(queryset, fields, value)[1]
+        return queryset, query
+
+    def get_indexes(self, model, fields):
+        """
+        Returns the GIN indexes for ``fields``, e.g. to add them to ``Meta.indexes``
+        of the model instead of calling ``create_index``.
+        """
+        indexes = [
+            GinIndex(self.get_vector(fields), name=self.get_index_name(model, fields, "fts"))
+        ]
+        if self.trigram:
+            indexes.extend(
+                GinIndex(
+                    OpClass(Upper(field), name="gin_trgm_ops"),
+                    name=self.get_index_name(model, [field], "trgm"),
+                )
+                for field in fields
+            )
+        return indexes
+
+    def create_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        with connections[using].schema_editor() as schema_editor:
+            for index in self.get_indexes(model, fields):
+                schema_editor.add_index(model, index)
+
+    def drop_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        with connections[using].schema_editor() as schema_editor:
+            for index in self.get_indexes(model, fields):
+                schema_editor.remove_index(model, index)
+
+    def rebuild_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        connection = connections[using]
+        with connection.cursor() as cursor:
+            for index in self.get_indexes(model, fields):
+                cursor.execute(f"REINDEX INDEX {connection.ops.quote_name(index.name)}")
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    Search backend using an SQLite FTS5 table, which is kept in sync with the table
+    of the model using triggers. Only local fields of models with an integer primary
+    key are supported. Every word of the value is matched as prefix, rows are ranked
+    using bm25.
+
+    The FTS5 table has to be created using ``create_index`` (e.g. in a migration),
+    the fields are searched using ``icontains`` lookups (like ``SearchBackend``)
+    as long as the table does not exist.
+    """
+
+    #: FTS5 tokenizer, see https://www.sqlite.org/fts5.html#tokenizers
+    tokenizer = "unicode61 remove_diacritics 2"
+
+    def get_table_name(self, model):
+        return f"{model._meta.db_table}_search"
+
+    def get_columns(self, model, fields):
+        columns = []
+        for name in fields:
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                field = None
+            if field is None or field.is_relation or field.model is not model:
+                raise ImproperlyConfigured(
+                    f"SQLite full text search only supports local fields, got {name!r}."
+                )
+            columns.append(field.column)
+        return columns
+
+    def get_match_value(self, columns, value):
+        """
+        Converts the value to an FTS5 query on ``columns``, every word is quoted and
+        matched as prefix.
+        """
+        words = ['"{}"*'.format(word.replace('"', '""')) for word in value.split()]
+        if not words:
+            return None
+        return "{{{}}} : ({})".format(" ".join(columns), " ".join(words))
+
+    def has_index(self, model, using=DEFAULT_DB_ALIAS):
+        """
+        Returns if the FTS5 table of ``model`` was created using ``create_index``.
+        The result is cached per process, ``create_index`` and ``drop_index`` update
+        it (restart the processes if the table is created by another process).
+        """
+        key = (using, self.get_table_name(model))
+        if key not in fts_tables:
+            with connections[using].cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                    [key[1]],
+                )
+                fts_tables[key] = cursor.fetchone() is not None
+        return fts_tables[key]
+
+    def get_query(self, queryset, fields, value):
+        if not self.has_index(queryset.model, queryset.db):
+            return super().get_query(queryset, fields, value)
+
+        match_value = self.get_match_value(self.get_columns(queryset.model, fields), value)
+        if not match_value:
+            return queryset, Q(pk__in=[])
+
+        qn = connections[queryset.db].ops.quote_name
+        model = queryset.model
+        table, pk = qn(self.get_table_name(model)), qn(model._meta.pk.column)
+        queryset = queryset.annotate(
+            **{
+                self.rank_annotation: RawSQL(
+                    f"SELECT -rank FROM {table} WHERE {table} MATCH %s "
+                    f"AND rowid = {qn(model._meta.db_table)}.{pk}",
+                    [match_value],
+                )
+            }
+        )
+        return queryset, Q(
+            pk__in=RawSQL(f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [match_value])
+        )
+
+    def create_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        table, source = qn(self.get_table_name(model)), qn(model._meta.db_table)
+        pk = qn(model._meta.pk.column)
+        columns = [qn(column) for column in self.get_columns(model, fields)]
+        names = ", ".join(columns)
+        new = ", ".join(f"new.{column}" for column in columns)
+        old = ", ".join(f"old.{column}" for column in columns)
+
+        delete = (
+            f"INSERT INTO {table}({table}, rowid, {names}) VALUES('delete', old.{pk}, {old});"
+        )
+        insert = f"INSERT INTO {table}(rowid, {names}) VALUES (new.{pk}, {new});"
+        trigger = qn(f"{self.get_table_name(model)}_%s")
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE {table} USING fts5({names}, content={source}, "
+                f"content_rowid={pk}, tokenize='{self.tokenizer}')"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {trigger % 'insert'} AFTER INSERT ON {source} "
+                f"BEGIN {insert} END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {trigger % 'delete'} AFTER DELETE ON {source} "
+                f"BEGIN {delete} END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {trigger % 'update'} AFTER UPDATE ON {source} "
+                f"BEGIN {delete} {insert} END"
+            )
+        fts_tables[(using, self.get_table_name(model))] = True
+        self.rebuild_index(model, fields, using)
+
+    def drop_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            for action in ("insert", "delete", "update"):
+                cursor.execute(
+                    f"DROP TRIGGER IF EXISTS {qn(f'{self.get_table_name(model)}_{action}')}"
+                )
+            cursor.execute(f"DROP TABLE IF EXISTS {qn(self.get_table_name(model))}")
+        fts_tables[(using, self.get_table_name(model))] = False
+
+    def rebuild_index(self, model, fields, using=DEFAULT_DB_ALIAS):
+        table = connections[using].ops.quote_name(self.get_table_name(model))
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"INSERT INTO {table}({table}) VALUES('rebuild')")
+            cursor.execute(f"INSERT INTO {table}({table}) VALUES('optimize')")
+
+
+#: Search backends by database vendor, other databases use ``SearchBackend``.
+SEARCH_BACKENDS = {
+    "postgresql": PostgresSearchBackend,
+    "sqlite": SQLiteSearchBackend,
+}
+
+
+def get_search_backend(using=DEFAULT_DB_ALIAS):
+    """
+    Returns the default search backend for the database ``using``.
+    """
+    return SEARCH_BACKENDS.get(connections[using].vendor, SearchBackend)()
@@ -0,0 +1,170 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.query import ValuesIterable
+
+
+def get_table_accessors(table_class):
+    """
+    Returns the accessors of all columns of a django-tables2 Table class as
+    queryset-style lookups (e.g. ``person__first_name``).
+    """
+    accessors = []
+    for name, column in table_class.base_columns.items():
+        accessor = str(column.accessor or name)
+        accessors.append(accessor.replace(".", "__"))
+    return accessors
+
+
+def get_table_ordering(table_class):
+    """
+    Returns the explicit ``order_by`` lookups of all columns of a django-tables2
+    Table class.
+    """
+    ordering = []
+    for column in table_class.base_columns.values():
+        for accessor in getattr(column, "order_by", None) or ():
+            ordering.append(str(accessor).lstrip("-").replace(".", "__"))
+    return ordering
+
+
+def get_model_field(opts, name):
+    """
+    Returns the field of a model by name. In addition to ``Options.get_field``,
+    reverse relations are also found by their accessor name (e.g. ``item_set``)
+    and ``pk`` is resolved to the primary key field.
+    """
+    if name == "pk":
+        return opts.pk
+
+    try:
+        return opts.get_field(name)
+    except FieldDoesNotExist:
+        for related_object in opts.related_objects:
+            if related_object.get_accessor_name() == name:
+                return related_object
+        raise
+
+
+def get_related_lookups(model, accessors):
+    """
+    Derives the lookups for ``select_related`` and ``prefetch_related`` from the
+    provided accessors. Single-valued relations (foreign keys, one-to-one relations)
+    are joined, as soon as an accessor spans a multi-valued relation, the relation
+    is prefetched.
+
+    Returns a tuple of two lists, the select related and the prefetch related lookups.
+    """
+    select_related, prefetch_related = [], []
+
+    for accessor in accessors:
+        opts, path, multivalued = model._meta, [], False
+
+        for bit in accessor.split("__"):
+            try:
+                field = get_model_field(opts, bit)
+            except FieldDoesNotExist:
+                break
+
+            if not field.is_relation or field.related_model is None:
+                break
+
+            path.append(bit)
+            multivalued = multivalued or field.one_to_many or field.many_to_many
+            opts = field.related_model._meta
+
+        lookup = "__".join(path)
+        if not lookup:
+            continue
+
+        target = prefetch_related if multivalued else select_related
+        if lookup not in target:
+            target.append(lookup)
+
+    return select_related, prefetch_related
+
+
+def get_projection_fields(model, lookups):
+    """
+    Returns the lookups pointing to concrete fields of ``model`` (following
+    single-valued relations) to pass them to ``QuerySet.only`` or ``QuerySet.values``.
+    Lookups which can't be resolved to a field (e.g. properties or methods) or span
+    multi-valued relations are skipped.
+    """
+    fields = []
+
+    for lookup in lookups:
+        opts, path = model._meta, []
+
+        for bit in lookup.lstrip("-").replace(".", "__").split("__"):
+            try:
+                field = get_model_field(opts, bit)
+            except FieldDoesNotExist:
+                break
+
+            if field.one_to_many or field.many_to_many:
+                path = []
+                break
+
+            path.append(bit)
+            if not field.is_relation or field.related_model is None:
+                break
+            opts = field.related_model._meta
+
+        lookup = "__".join(path)
+        if lookup and lookup not in fields:
+            fields.append(lookup)
+
+    return fields
+
+
+class TableRow(dict):
+    """
+    Lightweight row used instead of model instances when a list view fetches its
+    data using ``QuerySet.values``. Related values (e.g. ``person__first_name``) are
+    also available as nested rows (``row["person"]["first_name"]``), the primary
+    key is available as ``pk`` attribute.
+    """
+
+    def __getitem__(self, key):
+        try:
+            return super().__getitem__(key)
+        except KeyError:
+            prefix = f"{key}__"
+            nested = {
+                name[len(prefix) :]: value
+                for name, value in self.items()
+                if name.startswith(prefix)
+            }
+            if not nested:
+                raise
+            return TableRow(nested)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @property
+    def pk(self):
+        return self["pk"]
+
+
+class TableRowIterable(ValuesIterable):
+    """
+    Iterable for ``QuerySet.values`` which yields ``TableRow`` objects instead of dicts.
+    """
+
+    def __iter__(self):
+        for row in super().__iter__():
+            yield TableRow(row)
+
+
+def get_values_queryset(queryset, fields):
+    """
+    Returns a queryset which fetches only the provided fields (and the primary key)
+    as ``TableRow`` objects.
+    """
+    queryset = queryset.values("pk", *[field for field in fields if field != "pk"])
+    # There is no public API to change the type of rows returned by values().
+    queryset._iterable_class = TableRowIterable
+    return queryset
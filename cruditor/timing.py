@@ -0,0 +1,112 @@
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTimer:
+    """
+    Records the duration of the named phases of a request (e.g. ``auth``, ``count``
+    or ``render``). Phases may be nested and repeated, repeated phases are summed up.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []
+        self.metrics = []
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def add(self, name, duration, description=None):
+        """
+        Adds a metric which is not measured by the timer, e.g. the database time
+        (``duration`` in milliseconds).
+        """
+        self.metrics.append((name, duration, description))
+
+    @property
+    def total(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def get_timings(self):
+        """
+        Returns a dict of the phase names and their total duration in milliseconds,
+        in the order the phases were started.
+        """
+        timings = {}
+        for name, duration in self.phases:
+            timings[name] = timings.get(name, 0) + duration
+        for name, duration, description in self.metrics:
+            timings[name] = timings.get(name, 0) + duration
+        return timings
+
+    def get_header(self):
+        """
+        Returns the value of the ``Server-Timing`` header.
+        """
+        descriptions = {name: description for name, _, description in self.metrics}
+        entries = []
+        for name, duration in self.get_timings().items():
+            entry = f"{name};dur={duration:.1f}"
+            if descriptions.get(name):
+                entry += f';desc="{descriptions[name]}"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.total:.1f}")
+        return ", ".join(entries)
+
+
+class NullTimer:
+    """
+    Timer which records nothing, used if timing is disabled.
+    """
+
+    enabled = False
+    phases = ()
+    metrics = ()
+
+    def phase(self, name):
+        return NULL_PHASE
+
+    def add(self, name, duration, description=None):
+        pass
+
+
+NULL_PHASE = nullcontext()
+
+#: Shared timer of views without timing.
+NULL_TIMER = NullTimer()
+
+
+def get_timing_sinks():
+    """
+    Returns the timing sinks configured in the ``CRUDITOR_TIMING_SINKS`` setting, a
+    list of dotted paths to callables which are called with the view and the
+    ``RequestTimer`` after the response was rendered.
+    """
+    return [import_string(path) for path in getattr(settings, "CRUDITOR_TIMING_SINKS", ())]
+
+
+def log_timings(view, timer):
+    """
+    Timing sink which logs the phases of the request to the ``cruditor.timing``
+    logger.
+    """
+    logger.info(
+        "%s %s %s",
+        view.request.method,
+        view.request.path,
+        " ".join(f"{name}={duration:.1f}ms" for name, duration in timer.get_timings().items()),
+        extra={"request": view.request, "view": view, "timings": timer.get_timings()},
+    )
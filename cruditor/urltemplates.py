@@ -0,0 +1,179 @@
+import itertools
+import re
+from urllib.parse import quote, unquote
+
+from django.conf import settings
+from django.urls import NoReverseMatch, Resolver404, get_script_prefix, get_urlconf, resolve
+from django.urls import reverse as django_reverse
+from django.urls.resolvers import RoutePattern
+from django.utils.http import RFC3986_SUBDELIMS
+from django.utils.translation import get_language
+
+#: Characters which are not quoted in URL parameters (same as ``django.urls.reverse``).
+SAFE_CHARACTERS = RFC3986_SUBDELIMS + "/~:@"
+
+#: Values matching this expression do not need to be quoted.
+SAFE_VALUE = re.compile(r"[\w.~-]*", re.ASCII)
+
+#: Compiled URL templates (None if the route cannot be compiled), see ``get_url_template``.
+url_templates = {}
+
+
+def get_placeholders(index):
+    """
+    Returns the values used to find the position of the parameter ``index`` in the
+    reversed URL. The values are accepted by the builtin path converters (the first
+    one by ``int``, ``str``, ``slug`` and ``path``, the second one by ``uuid``).
+    """
+    return (f"8642097531{index:02d}", f"8642a975-31e0-4b8c-9d7e-{index:012d}")
+
+
+class URLTemplate:
+    """
+    Template of the URL of a route, the static parts of the URL and the converters of
+    the parameters. ``build`` returns the URL for the given parameters using string
+    substitution, the resolver is not involved.
+    """
+
+    def __init__(self, parts, parameters):
+        #: Static parts of the URL, one more than parameters.
+        self.parts = parts
+        #: List of the parameter (index or name) and the converter per placeholder.
+        self.parameters = [
+            (key, converter, re.compile(converter.regex)) for key, converter in parameters
+        ]
+
+    @classmethod
+    def compile(cls, viewname, urlconf, names):
+        """
+        Compiles the route of ``viewname``, ``names`` is the number of positional
+        arguments or a tuple of the keyword arguments. Returns None if the route
+        cannot be compiled, e.g. if the route (or one of the including routes) is a
+        regular expression or uses custom converters.
+        """
+        keys = range(names) if isinstance(names, int) else names
+        for values in itertools.product(*(get_placeholders(i) for i in range(len(keys)))):
+            try:
+                if isinstance(names, int):
+                    url = django_reverse(viewname, urlconf=urlconf, args=values)
+                else:
+                    url = django_reverse(
+                        viewname, urlconf=urlconf, kwargs=dict(zip(keys, values))
+                    )
+            except NoReverseMatch:
+                continue
+            return cls.from_url(url, urlconf, dict(zip(keys, values)))
+        return None
+
+    @classmethod
+    def from_url(cls, url, urlconf, placeholders):
+        prefix = get_script_prefix()
+        try:
+            match = resolve(unquote(f"/{url[len(prefix) :]}"), urlconf)
+        except Resolver404:
+            return None
+
+        if "(?P<" in match.route or match.route.startswith("^"):
+            return None
+        converters = RoutePattern(match.route).converters
+        if len(converters) != len(placeholders):
+            return None
+
+        # Positional arguments are mapped to the route parameters in order.
+        names = list(converters) if placeholders and 0 in placeholders else None
+        positions = []
+        for key, placeholder in placeholders.items():
+            if url.count(placeholder) != 1:
+                return None
+            converter = converters.get(names[key] if names else key)
+            if converter is None:
+                return None
+            positions.append((url.index(placeholder), key, placeholder, converter))
+
+        parts, parameters, start = [], [], 0
+        for position, key, placeholder, converter in sorted(positions, key=lambda p: p[0]):
+            parts.append(url[start:position])
+            parameters.append((key, converter))
+            start = position + len(placeholder)
+        parts.append(url[start:])
+        return cls(parts, parameters)
+
+    def build(self, values):
+        """
+        Returns the URL for ``values`` (the positional arguments or a dict of the
+        keyword arguments), or None if one of the values is not accepted by the
+        converter of the parameter (or the URL would need escaping).
+        """
+        url = [self.parts[0]]
+        for (key, converter, regex), part in zip(self.parameters, self.parts[1:]):
+            try:
+                text = str(converter.to_url(values[key]))
+            except ValueError:
+                return None
+            if not regex.fullmatch(text):
+                return None
+            if not SAFE_VALUE.fullmatch(text):
+                text = quote(text, safe=SAFE_CHARACTERS)
+            url.append(text)
+            url.append(part)
+        url = "".join(url)
+        return None if "//" in url else url
+
+
+def get_url_template(viewname, urlconf=None, names=0):
+    """
+    Returns the ``URLTemplate`` of ``viewname`` for the number of positional
+    arguments or the tuple of keyword arguments (``names``). The template is
+    compiled once per URLconf, script prefix and language.
+    """
+    urlconf = urlconf or get_urlconf() or settings.ROOT_URLCONF
+    key = (viewname, urlconf, names, get_script_prefix(), get_language())
+    if key not in url_templates:
+        url_templates[key] = URLTemplate.compile(viewname, urlconf, names)
+    return url_templates[key]
+
+
+def get_url_builder(viewname, urlconf=None, names=0):
+    """
+    Returns a function building the URL of ``viewname`` for the positional arguments
+    (a tuple) or the keyword arguments (a dict), see ``get_url_template`` for
+    ``names``. The template is looked up once, use the builder within a request
+    (e.g. for the rows of a table). Falls back to ``django.urls.reverse`` if the
+    route cannot be compiled or if a value is not accepted by the route.
+    """
+    template = get_url_template(viewname, urlconf, names)
+
+    def build_url(values):
+        url = template.build(values) if template else None
+        if url is not None:
+            return url
+        if isinstance(values, dict):
+            return django_reverse(viewname, urlconf=urlconf, kwargs=values)
+        return django_reverse(viewname, urlconf=urlconf, args=values)
+
+    return build_url
+
+
+def reverse(viewname, urlconf=None, args=None, kwargs=None, current_app=None):
+    """
+    Drop-in replacement of ``django.urls.reverse`` for routes using path converters,
+    like the routes created by ``cruditor.collection.generate_urls``. The route is
+    compiled to an ``URLTemplate`` once, the URLs are built by string substitution.
+    ``current_app`` and mixed positional and keyword arguments are passed to
+    ``django.urls.reverse``.
+    """
+    if current_app or (args and kwargs):
+        return django_reverse(
+            viewname, urlconf=urlconf, args=args, kwargs=kwargs, current_app=current_app
+        )
+    if kwargs:
+        return get_url_builder(viewname, urlconf, tuple(sorted(kwargs)))(kwargs)
+    args = tuple(args or ())
+    return get_url_builder(viewname, urlconf, len(args))(args)
+
+
+def clear_url_templates():
+    """
+    Removes the compiled URL templates, e.g. after the URLconf was changed at runtime.
+    """
+    url_templates.clear()
@@ -1,19 +1,66 @@
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import update_session_auth_hash
 from django.contrib.auth.views import LogoutView
-from django.core.exceptions import ImproperlyConfigured
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.core.paginator import EmptyPage, PageNotAnInteger
 from django.db import models
-from django.http import HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import redirect
+from django.template.loader import get_template
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+from django.utils.crypto import constant_time_compare
 from django.utils.decorators import method_decorator
-from django.utils.text import capfirst
-from django.utils.translation import gettext
+from django.utils.encoding import force_str
+from django.utils.safestring import mark_safe
+from django.utils.text import capfirst, slugify
+from django.utils.translation import get_language, gettext
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.cache import never_cache
-from django.views.generic import CreateView, DeleteView, FormView, TemplateView, UpdateView
-
+from django.views.generic import (
+    CreateView,
+    DeleteView,
+    FormView,
+    TemplateView,
+    UpdateView,
+    View,
+)
+
+from cruditor import export, metrics
+from cruditor.datasources import (
+    CruditorDataSource,
+    DataSourcePaginator,
+    DataSourceTableData,
+    filter_data_source,
+)
+from cruditor.datastructures import TitleButton
 from cruditor.forms import ChangePasswordForm
-from cruditor.mixins import CruditorMixin, FormViewMixin
+from cruditor.mixins import (
+    AsyncCruditorMixin,
+    AsyncFormViewMixin,
+    CruditorMixin,
+    FormViewMixin,
+)
+from cruditor.pagination import (
+    CachedCount,
+    CruditorPaginator,
+    KeysetPaginator,
+    normalize_filter_value,
+)
+from cruditor.remote import fan_out
+from cruditor.tables import (
+    get_projection_fields,
+    get_related_lookups,
+    get_table_accessors,
+    get_table_ordering,
+    get_values_queryset,
+)
 
 try:
     import django_tables2 as tables
@@ -79,18 +126,158 @@ class CruditorListView(CruditorMixin, TemplateView):
     #: Template to use when rendering the list view.
     template_name = "cruditor/list.html"
 
+    #: Use keyset (seek) pagination instead of OFFSET/LIMIT based page numbers.
+    keyset_pagination = False
+
+    #: Query parameter to pass the cursor when ``keyset_pagination`` is enabled.
+    keyset_cursor_field = "cursor"
+
+    #: Lookups to pass to ``select_related``. Set to True to join all non-null foreign
+    #: keys. If False, the lookups are derived from the accessors of the table columns.
+    list_select_related = False
+
+    #: Additional lookups to pass to ``prefetch_related``. Multi-valued relations
+    #: used by the table columns are prefetched automatically.
+    list_prefetch_related = ()
+
+    #: Restrict the fetched fields to the ones used by the table columns (plus the
+    #: primary key and the ordering). Set to "only" to use ``QuerySet.only`` or to
+    #: "values" to fetch lightweight ``TableRow`` objects using ``QuerySet.values``.
+    #: Make sure the table doesn't access other fields (e.g. in ``__str__``).
+    list_projection = None
+
+    #: Additional fields to fetch when ``list_projection`` is enabled.
+    list_projection_fields = ()
+
+    #: Formats in which the (filtered) list can be exported, e.g. ``("csv", "jsonl")``.
+    export_formats = ()
+
+    #: Query parameter to request an export (e.g. ``?_export=csv``).
+    export_param = "_export"
+
+    #: Number of rows fetched from the database at once when exporting.
+    export_chunk_size = 2000
+
+    #: Number of concurrent ``enrich_row`` calls when enriching the rows of the current
+    #: page (e.g. with details from a remote service). Enrichment is disabled if not set.
+    list_enrich_workers = None
+
+    #: Seconds a single ``enrich_row`` call may take before the row is rendered as is.
+    list_enrich_timeout = 5
+
+    #: Accessor of a value which changes on every update of a record (e.g. ``updated_at``
+    #: or a version field). If set, the rendered rows are cached, see ``cache_table_rows``.
+    list_row_cache_version = None
+
+    #: Cache alias used to cache the rendered rows.
+    list_row_cache_alias = "default"
+
+    #: Seconds the rendered rows are cached.
+    list_row_cache_timeout = 3600
+
+    #: Template to render a single row of the table when caching rows.
+    list_row_template_name = "cruditor/includes/table-row.html"
+
+    #: Count strategy to get the number of rows (e.g. ``CappedCount`` or ``CachedCount``
+    #: from ``cruditor.pagination``). If not set, all rows are counted.
+    count_strategy = None
+
+    #: The FilterSet of the current request, set by ``get_context_data``.
+    filterset = None
+
+    #: Template used to render only the table (including the pagination) when a
+    #: fragment is requested, e.g. by cruditor.js when sorting or paging.
+    fragment_template_name = "cruditor/list-fragment.html"
+
+    #: Request header to request a fragment response.
+    fragment_header = "X-Cruditor-Fragment"
+
+    #: Query parameter to request a fragment response (e.g. ``?_fragment=1``).
+    fragment_param = "_fragment"
+
+    def get(self, request, *args, **kwargs):
+        """
+        Renders the list view. If an export was requested (see ``export_formats``),
+        the export is streamed instead.
+        """
+        export_format = request.GET.get(self.export_param)
+        if export_format and export_format in self.get_export_formats():
+            return self.render_export(export_format)
+
+        self.setup_fragment(request)
+        response = super().get(request, *args, **kwargs)
+        patch_vary_headers(response, [self.fragment_header])
+        return response
+
+    def is_fragment_request(self, request):
+        """
+        Returns True if only the table should be rendered, either the
+        ``fragment_header`` or the ``fragment_param`` is set.
+        """
+        return bool(
+            request.headers.get(self.fragment_header) or request.GET.get(self.fragment_param)
+        )
+
+    def setup_fragment(self, request):
+        """
+        Sets ``fragment`` if a fragment is requested. The ``fragment_param`` is removed
+        from the request to not render it into the links of the table.
+        """
+        self.fragment = self.is_fragment_request(request)
+        if self.fragment_param in request.GET:
+            request.GET = request.GET.copy()
+            del request.GET[self.fragment_param]
+
+    def get_template_names(self):
+        if getattr(self, "fragment", False):
+            return [self.fragment_template_name]
+        return super().get_template_names()
+
+    def get_page_context_data(self, **kwargs):
+        """
+        Returns the context of the page without the list specific context. For
+        fragments, the ``cruditor`` context variable is skipped as the navigation,
+        breadcrumb and title buttons are not rendered.
+        """
+        if getattr(self, "fragment", False):
+            return super(CruditorMixin, self).get_context_data(**kwargs)
+        return super().get_context_data(**kwargs)
+
     def get_context_data(self, **kwargs):
         """
         Prepares the context by adding the ``table`` context variable.
         If you have configured ``filter_class``, the ``filter_form`` context
         variable will be provided too.
         """
-        context = super().get_context_data(**kwargs)
-        filtered_qs = self.get_filtered_queryset()
+        context = self.get_page_context_data(**kwargs)
+        with self.timer.phase("filter"):
+            filtered_qs = self.get_filtered_queryset()
+        self.filterset = filtered_qs if hasattr(filtered_qs, "form") else None
         context["table"] = self.get_table(filtered_qs)
         context["filter_form"] = filtered_qs.form if hasattr(filtered_qs, "form") else None
         return context
 
+    def get_slow_request_details(self, context):
+        """
+        Adds the number of rows of the table page, the number of (filtered) rows
+        and the active filters to the details of slow requests.
+        """
+        details = super().get_slow_request_details(context)
+        table = context.get("table") if context else None
+        page = getattr(table, "page", None)
+        if page is not None:
+            details["page_rows"] = len(page.object_list)
+            details["total_rows"] = getattr(table.paginator, "count", None)
+
+        filter_form = context.get("filter_form") if context else None
+        if filter_form is not None and filter_form.is_valid():
+            details["filters"] = {
+                name: str(value)
+                for name, value in filter_form.cleaned_data.items()
+                if value not in (None, "", [], ())
+            }
+        return details
+
     def get_queryset(self):
         """
         Provide a queryset to fetch data with. If ``queryset`` is set on the class,
@@ -154,13 +341,459 @@ class CruditorListView(CruditorMixin, TemplateView):
     def get_table(self, filtered_qs):
         """
         Prepare the table object using the provided QuerySet/Iterable.
+
+        If timing is enabled, the rows of the current page are fetched right away to
+        record the durations of counting the rows (``count``) and fetching the page
+        (``page``) separately.
+        """
+        with self.timer.phase("filter"):
+            qs = self.get_table_data(filtered_qs)
+        table = self.get_table_class()(qs, **self.get_table_kwargs())
+        with self.timer.phase("count"):
+            tables.RequestConfig(self.request, paginate=False).configure(table)
+            self.paginate_table(table)
+        if self.timer.enabled:
+            with self.timer.phase("page"):
+                self.fetch_page(table)
+        with self.timer.phase("enrich"):
+            self.enrich_table(table)
+        with self.timer.phase("row-cache"):
+            self.cache_table_rows(table)
+        if self.collect_metrics:
+            self.record_table_metrics(table)
+        return table
+
+    def paginate_table(self, table):
+        """
+        Paginates the table using the options from ``get_pagination_options``.
+        Invalid page numbers show the first page, page numbers beyond the last page
+        show the last page (like django-tables2's ``RequestConfig``).
+        """
+        options = self.get_pagination_options(table)
+        if not options:
+            return
+
+        try:
+            table.paginate(**options)
+        except PageNotAnInteger:
+            table.page = table.paginator.page(1)
+        except EmptyPage:
+            table.page = table.paginator.page(table.paginator.num_pages)
+
+    def fetch_page(self, table):
+        """
+        Evaluates the rows of the current page of the table (if paginated).
+        """
+        page = getattr(table, "page", None)
+        if page is not None and not isinstance(page.object_list.data, list):
+            page.object_list.data = list(page.object_list.data)
+
+    def record_table_metrics(self, table):
+        """
+        Records the number of rows of the current page and the number of rows of
+        the list (if paginated).
+        """
+        page = getattr(table, "page", None)
+        if page is None:
+            return
+
+        view = metrics.get_view_label(self)
+        metrics.LIST_PAGE_ROWS.set(len(page.object_list), view=view)
+        count = getattr(table.paginator, "count", None)
+        if count is not None:
+            metrics.LIST_RESULT_COUNT.set(count, view=view)
+
+    def enrich_table(self, table):
+        """
+        Replace the records of the current page by the results of ``enrich_row``.
+        The calls are made concurrently (up to ``list_enrich_workers`` at once), rows
+        whose call failed or timed out are rendered without details and a warning
+        message is displayed. The errors are available as ``enrich_errors``.
+        """
+        self.enrich_errors = {}
+        if not self.list_enrich_workers or not hasattr(table, "page"):
+            return
+
+        rows = table.page.object_list
+        records = list(rows.data)
+        results, self.enrich_errors = fan_out(
+            self.enrich_row, records, self.list_enrich_workers, self.list_enrich_timeout
+        )
+        rows.data = [
+            record if index in self.enrich_errors else result
+            for index, (record, result) in enumerate(zip(records, results))
+        ]
+
+        if self.enrich_errors:
+            messages.warning(
+                self.request,
+                gettext("Details of {0} of {1} rows could not be loaded.").format(
+                    len(self.enrich_errors), len(records)
+                ),
+                fail_silently=True,
+            )
+
+    def enrich_row(self, record):
+        """
+        Override to fetch additional data for a row of the current page, e.g. if a
+        remote list endpoint only returns ids. Return the record to render instead.
+        Called from worker threads, see ``list_enrich_workers``.
         """
+        return record
+
+    def cache_table_rows(self, table):
+        """
+        Looks up the rendered rows of the current page in the cache (using one
+        ``get_many`` call), renders the missing rows and caches them (using one
+        ``set_many`` call). The rendered HTML is passed to the template as
+        ``row.cached_html``.
+
+        Only enabled if ``list_row_cache_version`` is set. The rows are rendered
+        using ``list_row_template_name`` and the context of ``get_row_context``,
+        without the request and context processors, as they are shared between all
+        users.
+        """
+        if not self.list_row_cache_version or not hasattr(table, "page"):
+            return
+
+        rows = list(table.page.object_list)
+        keys = [self.get_row_cache_key(table, row) for row in rows]
+        cache = caches[self.list_row_cache_alias]
+        cached = cache.get_many([key for key in keys if key])
+
+        template, missing = get_template(self.list_row_template_name), {}
+        for row, key in zip(rows, keys):
+            if key in cached:
+                row.cached_html = mark_safe(cached[key])
+                continue
+
+            row.cached_html = template.render(self.get_row_context(table, row))
+            if key:
+                missing[key] = str(row.cached_html)
+
+        if missing:
+            cache.set_many(missing, self.list_row_cache_timeout)
+        table.page.object_list = rows
+
+    def get_row_context(self, table, row):
+        """
+        Returns the context to render a cached row (see ``cache_table_rows``). Only
+        add values which are the same for all users, e.g. not the request.
+        """
+        return {"table": table, "row": row}
+
+    def get_row_cache_key(self, table, row):
+        """
+        Returns the cache key of a rendered row, built from the table class, the
+        visible columns, the active language and time zone, the primary key and
+        the version (see ``list_row_cache_version``) of the record. Returns None to
+        not cache the row, e.g. if the row cache is disabled or the version is None.
+        """
+        if not self.list_row_cache_version:
+            return None
+        try:
+            pk = tables.A("pk").resolve(row.record)
+            version = tables.A(self.list_row_cache_version).resolve(row.record)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+        if version is None:
+            return None
+
+        table_class = table.__class__
+        digest = hashlib.md5(
+            "|".join(
+                [
+                    f"{table_class.__module__}.{table_class.__qualname__}",
+                    ",".join(column.name for column in table.columns),
+                    get_language() or "",
+                    timezone.get_current_timezone_name(),
+                    row.get_even_odd_css_class(),
+                    str(pk),
+                    str(version),
+                ]
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return f"cruditor:row:{digest}"
+
+    def get_table_data(self, filtered_qs):
+        """
+        Returns the data for the table from the (filtered) QuerySet/Iterable.
+
+        QuerySets are made distinct if required and related objects are fetched
+        using ``select_related`` and ``prefetch_related`` to avoid one query per row.
+        If ``list_projection`` is set, only the required fields are fetched.
+
+        For a ``CruditorDataSource``, the filter values are pushed down to the data
+        source instead of filtering a queryset.
+        """
+        if isinstance(getattr(filtered_qs, "queryset", None), CruditorDataSource):
+            filtered_qs = filter_data_source(filtered_qs)
+
         qs = getattr(filtered_qs, "qs", filtered_qs)
-        if hasattr(qs, "distinct"):
+        if isinstance(qs, CruditorDataSource):
+            return DataSourceTableData(qs)
+        if not hasattr(qs, "query"):
+            return qs
+
+        if self.requires_distinct(qs):
             qs = qs.distinct()
+
+        if self.list_projection == "values":
+            return get_values_queryset(qs, self.get_list_projection_fields(qs))
+
+        select_related = self.get_list_select_related(qs)
+        if select_related is True:
+            qs = qs.select_related()
+        elif select_related:
+            qs = qs.select_related(*select_related)
+
+        prefetch_related = self.get_list_prefetch_related(qs)
+        if prefetch_related:
+            qs = qs.prefetch_related(*prefetch_related)
+
+        if self.list_projection == "only" and select_related is not True:
+            qs = qs.only(*self.get_list_projection_fields(qs, select_related))
+
+        return qs
+
+    def get_list_select_related(self, queryset):
+        """
+        Returns the lookups to pass to ``select_related`` (or True to follow all
+        non-null foreign keys). If ``list_select_related`` is not set, the lookups
+        are derived from the single-valued relations used by the table columns.
+        """
+        if self.list_select_related:
+            return self.list_select_related
+
+        accessors = get_table_accessors(self.get_table_class())
+        return get_related_lookups(queryset.model, accessors)[0]
+
+    def get_list_prefetch_related(self, queryset):
+        """
+        Returns the lookups to pass to ``prefetch_related``. Combines the lookups from
+        ``list_prefetch_related`` and the multi-valued relations used by the table
+        columns.
+        """
+        accessors = get_table_accessors(self.get_table_class())
+        prefetch_related = list(self.list_prefetch_related)
+        for lookup in get_related_lookups(queryset.model, accessors)[1]:
+            if lookup not in prefetch_related:
+                prefetch_related.append(lookup)
+        return prefetch_related
+
+    def get_list_projection_fields(self, queryset, select_related=()):
+        """
+        Returns the fields to fetch when ``list_projection`` is enabled. The fields
+        are derived from the table columns, the ordering of the table and the
+        queryset (to allow cursors for keyset pagination) and ``list_projection_fields``.
+        Relations passed in ``select_related`` are included too.
+        """
+        table_class = self.get_table_class()
+        query = queryset.query
+        lookups = [
+            *get_table_accessors(table_class),
+            *get_table_ordering(table_class),
+            *[item for item in query.order_by if isinstance(item, str)],
+            *[item for item in query.get_meta().ordering if isinstance(item, str)],
+            *self.list_projection_fields,
+        ]
+
+        fields = get_projection_fields(queryset.model, lookups)
+        for lookup in select_related:
+            if not any(field.startswith(f"{lookup}__") for field in fields):
+                fields.append(lookup)
+        return fields
+
+    def requires_distinct(self, queryset):
+        """
+        Returns True if the queryset joins multi-valued relations (reverse foreign
+        keys or many-to-many relations) and might return duplicate rows. Only then,
+        ``get_table`` applies DISTINCT to the queryset.
+        """
+        query = queryset.query
+        if query.distinct or query.combinator:
+            return False
+
+        for join in query.alias_map.values():
+            join_field = getattr(join, "join_field", None)
+            if join_field is not None and (join_field.one_to_many or join_field.many_to_many):
+                return True
+
+        return False
+
+    def get_count_strategy(self):
+        """
+        Returns the count strategy used to get the number of rows for the pagination.
+        By default, returns the ``count_strategy`` property.
+        """
+        return self.count_strategy
+
+    def get_count_cache_key(self):
+        """
+        Returns the key used by ``CachedCount`` to cache the number of rows: the path
+        of the view and the URL together with the sorted and normalized values of the
+        filter form. The sorting and the page are not part of the key.
+
+        Returns None if the filter form is invalid, ``CachedCount`` falls back to the
+        SQL query then. Add request dependent restrictions of ``get_queryset`` (e.g.
+        per user) to the key when overriding this method.
+        """
+        values = {}
+        if self.filterset is not None:
+            if not self.filterset.is_valid():
+                return None
+            values = {
+                name: normalize_filter_value(value)
+                for name, value in self.filterset.form.cleaned_data.items()
+                if value not in (None, "", [], ())
+            }
+
+        view = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+        filters = json.dumps(values, sort_keys=True)
+        return f"{view}:{self.request.path}:{filters}"
+
+    def get_export_formats(self):
+        """
+        Returns the available export formats. By default, returns the ``export_formats``
+        property.
+        """
+        return self.export_formats
+
+    def get_export_filename(self, export_format):
+        """
+        Returns the filename of an export, based on the title of the view.
+        """
+        return "{}.{}".format(slugify(self.get_title()) or "export", export_format)
+
+    def get_export_rows(self, table, columns):
+        """
+        Yields the values of the exported columns for every row of the table. QuerySets
+        are iterated in chunks of ``export_chunk_size`` rows to keep the memory usage
+        flat regardless of the size of the result.
+        """
+        data = table.data.data
+        if hasattr(data, "iterator"):
+            data = data.iterator(chunk_size=self.export_chunk_size)
+
+        for record in data:
+            row = tables.rows.BoundRow(record, table=table)
+            yield [row.get_cell_value(column.name) for column in columns]
+
+    def get_export_table(self):
+        """
+        Returns the table (without pagination) and the columns to export.
+        Columns with ``exclude_from_export`` set are skipped.
+        """
+        qs = self.get_table_data(self.get_filtered_queryset())
         table = self.get_table_class()(qs, **self.get_table_kwargs())
-        tables.RequestConfig(self.request).configure(table)
-        return table
+        tables.RequestConfig(self.request, paginate=False).configure(table)
+
+        columns = [
+            column
+            for column in table.columns.iterall()
+            if not column.column.exclude_from_export
+        ]
+        return table, columns
+
+    def render_export(self, export_format):
+        """
+        Streams the filtered and ordered rows of the table in the requested format.
+        """
+        table, columns = self.get_export_table()
+        return self.get_export_response(
+            export_format,
+            export.iter_export(
+                export_format,
+                [column.name for column in columns],
+                [force_str(column.header, strings_only=True) for column in columns],
+                self.get_export_rows(table, columns),
+            ),
+        )
+
+    def get_export_response(self, export_format, streaming_content):
+        """
+        Wraps the chunks of an export into a streaming response with the
+        filename of the export set.
+        """
+        response = StreamingHttpResponse(
+            streaming_content, content_type=export.CONTENT_TYPES[export_format]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.get_export_filename(export_format)}"'
+        )
+        return response
+
+    def get_titlebuttons(self):
+        """
+        Adds a button per export format to the title buttons.
+        """
+        buttons = super().get_titlebuttons()
+
+        for export_format in self.get_export_formats():
+            params = self.request.GET.copy()
+            params[self.export_param] = export_format
+            buttons.append(
+                TitleButton(
+                    label=gettext("Export {0}").format(export_format.upper()),
+                    url=f"?{params.urlencode()}",
+                )
+            )
+
+        return buttons
+
+    def get_table_pagination(self, table):
+        """
+        Returns the pagination options passed to django-tables2's ``RequestConfig``.
+
+        If ``keyset_pagination`` is enabled and the table is backed by a QuerySet,
+        the ``KeysetPaginator`` is used and the cursor is taken from the request.
+        Otherwise, the ``CruditorPaginator`` is used together with the count strategy
+        returned by ``get_count_strategy`` (``CachedCount`` is keyed using
+        ``get_count_cache_key``). Tables backed by a ``CruditorDataSource``
+        use the ``DataSourcePaginator`` which fetches the page and the count at once.
+        """
+        if isinstance(table.data.data, CruditorDataSource):
+            return {"paginator_class": DataSourcePaginator}
+
+        if not self.keyset_pagination or not hasattr(table.data.data, "query"):
+            count_strategy = self.get_count_strategy()
+            if isinstance(count_strategy, CachedCount) and count_strategy.key is None:
+                count_strategy = count_strategy.with_key(self.get_count_cache_key())
+            return {
+                "paginator_class": CruditorPaginator,
+                "count_strategy": count_strategy,
+            }
+
+        cursor_field = f"{table.prefix}{self.keyset_cursor_field}"
+        return {
+            "paginator_class": KeysetPaginator,
+            "page": self.request.GET.get(cursor_field),
+            "cursor_field": cursor_field,
+        }
+
+    def get_pagination_options(self, table):
+        """
+        Returns the pagination options of ``get_table_pagination`` together with the
+        page and the number of rows per page from the request, like django-tables2's
+        ``RequestConfig``. With keyset pagination, the page number of the request is
+        ignored, the page is selected using the cursor only.
+        """
+        pagination = self.get_table_pagination(table)
+        if not pagination:
+            return pagination
+
+        options = dict(pagination)
+        options.pop("silent", None)
+        arguments = ("page", "per_page")
+        if getattr(options["paginator_class"], "keyset", False):
+            arguments = ("per_page",)
+        for arg in arguments:
+            try:
+                options[arg] = int(self.request.GET[getattr(table, f"prefixed_{arg}_field")])
+            except (ValueError, KeyError):
+                pass
+        return options
 
 
 class CruditorAddView(CruditorMixin, FormViewMixin, CreateView):
@@ -244,15 +877,19 @@ class CruditorDeleteView(CruditorMixin, DeleteView):
         nice success message. If there are protected related objects, an error
         message is shown instead with the output of ``format_linked_objects``.
         """
-        self.object = self.get_object()
+        with self.timer.phase("object"):
+            self.object = self.get_object()
         try:
-            self.perform_delete()
+            with self.timer.phase("delete"):
+                self.perform_delete()
         except models.ProtectedError as e:
+            self.record_deletion("protected")
             return self.render_to_response(
                 self.get_context_data(
                     linked_objects=self.format_linked_objects(e.protected_objects)
                 )
             )
+        self.record_deletion("deleted")
         messages.success(
             self.request,
             self.success_message.format(
@@ -261,6 +898,13 @@ class CruditorDeleteView(CruditorMixin, DeleteView):
         )
         return HttpResponseRedirect(self.get_success_url())
 
+    def record_deletion(self, result):
+        """
+        Records a confirmed deletion, ``result`` is ``deleted`` or ``protected``.
+        """
+        if self.collect_metrics:
+            metrics.DELETIONS.inc(view=metrics.get_view_label(self), result=result)
+
     def get_title(self):
         """
         Generate a sane title when requesting a confirmation to delete an item
@@ -342,3 +986,165 @@ class CruditorLogoutView(CruditorMixin, LogoutView):
         return super().get_context_data(
             cruditor=self.get_cruditor_context(alternative_title="Logout"), **kwargs
         )
+
+
+class CruditorMetricsView(View):
+    """
+    Renders the metrics of the Cruditor views (see ``cruditor.metrics``) in the
+    Prometheus text exposition format.
+
+    If the ``CRUDITOR_METRICS_TOKEN`` setting is set, the scraper has to send the
+    token as bearer token (``Authorization: Bearer <token>``). Otherwise, only
+    staff users have access.
+    """
+
+    #: Registry to render.
+    registry = metrics.registry
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    @method_decorator(never_cache)
+    def get(self, request, *args, **kwargs):
+        if not self.has_access(request):
+            raise PermissionDenied
+        return HttpResponse(self.registry.render(), content_type=self.content_type)
+
+    def has_access(self, request):
+        token = getattr(settings, "CRUDITOR_METRICS_TOKEN", None)
+        if token:
+            return constant_time_compare(
+                request.headers.get("Authorization", ""), f"Bearer {token}"
+            )
+        return request.user.is_active and request.user.is_staff
+
+
+class AsyncCruditorListView(AsyncCruditorMixin, CruditorListView):
+    """
+    Async variant of ``CruditorListView`` for ASGI deployments. The count and the
+    rows of the current page (or the rows of an export) are fetched using the
+    async interface of the queryset.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        export_format = request.GET.get(self.export_param)
+        if export_format and export_format in self.get_export_formats():
+            return await self.arender_export(export_format)
+
+        self.setup_fragment(request)
+        context = await self.aget_context_data(**kwargs)
+        response = self.render_to_response(context)
+        patch_vary_headers(response, [self.fragment_header])
+        return response
+
+    async def aget_context_data(self, **kwargs):
+        """
+        Async variant of ``get_context_data``.
+        """
+        filtered_qs = self.get_filtered_queryset()
+        self.filterset = filtered_qs if hasattr(filtered_qs, "form") else None
+        table = await self.aget_table(filtered_qs)
+
+        # Bypass CruditorListView.get_context_data, the table is prepared already.
+        context = await sync_to_async(self.get_page_context_data)(**kwargs)
+        context["table"] = table
+        context["filter_form"] = filtered_qs.form if hasattr(filtered_qs, "form") else None
+        return context
+
+    async def aget_table(self, filtered_qs):
+        """
+        Async variant of ``get_table``.
+        """
+        # Validating the filter form might hit the database (e.g. for choices).
+        qs = await sync_to_async(self.get_table_data)(filtered_qs)
+        table = self.get_table_class()(qs, **self.get_table_kwargs())
+        tables.RequestConfig(self.request, paginate=False).configure(table)
+        await self.apaginate_table(table)
+        await sync_to_async(self.enrich_table)(table)
+        if self.list_row_cache_version:
+            await sync_to_async(self.cache_table_rows)(table)
+        return table
+
+    async def apaginate_table(self, table):
+        """
+        Paginates the table using the options from ``get_pagination_options``, like
+        django-tables2's ``RequestConfig`` but using the async ``apage`` method of
+        the paginator.
+        """
+        options = self.get_pagination_options(table)
+        if not options:
+            return
+
+        paginator_class = options.pop("paginator_class")
+        per_page = options.pop("per_page", None) or table._meta.per_page
+        page = options.pop("page", 1)
+
+        table.paginator = paginator_class(table.rows, per_page, **options)
+        try:
+            table.page = await table.paginator.apage(page)
+        except PageNotAnInteger:
+            table.page = await table.paginator.apage(1)
+        except EmptyPage:
+            table.page = await table.paginator.apage(table.paginator.num_pages)
+
+    async def aget_export_rows(self, table, columns):
+        """
+        Async variant of ``get_export_rows``. Note: using ``aiterator`` together with
+        ``prefetch_related`` requires Django 5.0 or newer.
+        """
+        data = table.data.data
+        if hasattr(data, "aiterator"):
+            async for record in data.aiterator(chunk_size=self.export_chunk_size):
+                row = tables.rows.BoundRow(record, table=table)
+                yield [row.get_cell_value(column.name) for column in columns]
+        else:
+            for values in self.get_export_rows(table, columns):
+                yield values
+
+    async def arender_export(self, export_format):
+        """
+        Async variant of ``render_export``, the export is streamed using an async
+        iterator to avoid buffering the whole document when served using ASGI.
+        """
+        table, columns = await sync_to_async(self.get_export_table)()
+        return self.get_export_response(
+            export_format,
+            export.aiter_export(
+                export_format,
+                [column.name for column in columns],
+                [force_str(column.header, strings_only=True) for column in columns],
+                self.aget_export_rows(table, columns),
+            ),
+        )
+
+
+class AsyncCruditorAddView(AsyncCruditorMixin, AsyncFormViewMixin, CruditorAddView):
+    """
+    Async variant of ``CruditorAddView``.
+    """
+
+    async def aget_object(self, queryset=None):
+        return None
+
+
+class AsyncCruditorChangeView(AsyncCruditorMixin, AsyncFormViewMixin, CruditorChangeView):
+    """
+    Async variant of ``CruditorChangeView``.
+    """
+
+
+class AsyncCruditorDeleteView(AsyncCruditorMixin, CruditorDeleteView):
+    """
+    Async variant of ``CruditorDeleteView``. The deletion itself is run using
+    ``sync_to_async``.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object = await self.aget_object()
+        context = await sync_to_async(self.get_context_data)(object=self.object)
+        return self.render_to_response(context)
+
+    async def post(self, request, *args, **kwargs):
+        return await sync_to_async(self.form_valid)(request, *args, **kwargs)
+
+    async def delete(self, *args, **kwargs):
+        return await sync_to_async(self.form_valid)(*args, **kwargs)
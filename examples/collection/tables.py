@@ -1,11 +1,13 @@
 import django_tables2 as tables
-from django_tables2.utils import A
+from cruditor.urltemplates import reverse
 
 from examples.store.models import Person
 
 
 class PersonTable(tables.Table):
-    first_name = tables.LinkColumn("collection:change", args=(A("pk"),))
+    first_name = tables.Column(
+        linkify=lambda record: reverse("collection:change", args=(record.pk,))
+    )
 
     class Meta:
         model = Person
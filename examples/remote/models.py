@@ -1,7 +1,10 @@
-import requests
+from cruditor.inmemory import InMemoryCollection
+from cruditor.remote import RemoteClient
 
 BASE_TAG = {"id": 0, "name": "cruditor"}
 
+client = RemoteClient("http://petstore.swagger.io/v2/", stale_while_revalidate=True)
+
 
 class Pet:
     def __init__(self, pet):
@@ -30,8 +33,8 @@ class Pet:
 
     def update(self, form):
         self.data = Pet(
-            requests.put(
-                "http://petstore.swagger.io/v2/pet",
+            client.put(
+                "pet",
                 json={
                     "id": self.data["id"],
                     "name": form["name"],
@@ -39,17 +42,17 @@ class Pet:
                     "tags": [BASE_TAG],
                     "status": "available",
                 },
-            ).json()
+            )
         ).data
+        PetCollection.invalidate()
 
     def delete(self):
-        requests.delete("http://petstore.swagger.io/v2/pet/{}".format(self.data["id"]))
+        client.delete("pet/{}".format(self.data["id"]))
+        PetCollection.invalidate()
 
     @classmethod
-    def get_list(cls):
-        all_pets = requests.get(
-            "http://petstore.swagger.io/v2/pet/findByStatus", {"status": "available"}
-        ).json()
+    def get_list(cls, status="available"):
+        all_pets = client.get("pet/findByStatus", {"status": status})
 
         for pet in all_pets:
             # Filter pets with tag cruditor
@@ -61,18 +64,32 @@ class Pet:
 
     @classmethod
     def get(cls, pk):
-        return Pet(requests.get(f"http://petstore.swagger.io/v2/pet/{pk}").json())
+        return Pet(client.get(f"pet/{pk}", stale_while_revalidate=False))
 
     @classmethod
     def create(cls, form):
-        return Pet(
-            requests.post(
-                "http://petstore.swagger.io/v2/pet",
+        pet = Pet(
+            client.post(
+                "pet",
                 json={
                     "name": form["name"],
                     "photoUrls": [form["photo_url"]],
                     "tags": [BASE_TAG],
                     "status": "available",
                 },
-            ).json()
+            )
         )
+        PetCollection.invalidate()
+        return pet
+
+
+class PetCollection(InMemoryCollection):
+    verbose_name = "pet"
+    verbose_name_plural = "pets"
+
+    # The petstore demo API returns all pets at once, keep them in memory for a
+    # minute. Sorting and paging is done using the indexes of the collection.
+    ttl = 60
+
+    def load(self):
+        return Pet.get_list()
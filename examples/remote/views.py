@@ -10,7 +10,7 @@ from django.urls import reverse, reverse_lazy
 from examples.mixins import ExamplesMixin
 
 from .forms import PetForm
-from .models import Pet
+from .models import Pet, PetCollection
 
 
 class PetMixin(ExamplesMixin, CollectionViewMixin):
@@ -26,7 +26,7 @@ class PetListView(PetMixin, CruditorListView):
         return [{"url": reverse("remote:add"), "label": "Add pet"}]
 
     def get_queryset(self):
-        return Pet.get_list()
+        return PetCollection()
 
 
 class PetAddView(PetMixin, CruditorAddView):
@@ -69,3 +69,5 @@ ROOT_URLCONF = "examples.urls"
 WSGI_APPLICATION = "examples.wsgi.application"
 
 STATIC_URL = "/static/"
+
+CRUDITOR_METRICS = True
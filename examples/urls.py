@@ -1,3 +1,4 @@
+from cruditor.views import CruditorMetricsView
 from django.contrib import admin
 from django.urls import include, path
 
@@ -11,6 +12,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("", HomeView.as_view(), name="home"),
     path("logout/", LogoutView.as_view(), name="logout"),
+    path("metrics/", CruditorMetricsView.as_view(), name="metrics"),
     path("change-password/", ChangePasswordView.as_view(), name="change-password"),
     path("minimal/", include("examples.minimal.urls")),
     path("collection/", include("examples.collection.urls")),
@@ -49,6 +49,17 @@ class TestListView:
         table_class2 = view.get_table_class()
         assert table_class2 is table_class
 
+    @pytest.mark.django_db
+    def test_table_fallback_links(self):
+        person = PersonFactory.create(first_name="John")
+        view = PersonListView()
+
+        table = view.get_table_class()([person])
+        assert table.rows[0].get_cell("item") == (
+            f'<a href="/collection/{person.pk}/">John</a>'
+        )
+        assert view.get_collection_record_url(person) == f"/collection/{person.pk}/"
+
 
 class TestAddView:
     def setup_method(self):
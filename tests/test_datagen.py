@@ -0,0 +1,164 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+import pytest
+from cruditor.datagen import (
+    DataGenerator,
+    generate,
+    generate_related,
+    get_collection_models,
+    get_copy_value,
+    get_reverse_relation,
+    zipf_weights,
+)
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from examples.store.models import Person, RelatedPerson
+
+
+def test_zipf_weights():
+    assert zipf_weights(3) == [1, 1 / 2, 1 / 3]
+
+
+def test_get_collection_models():
+    assert Person in get_collection_models()
+
+
+class TestDataGenerator:
+    def test_build(self):
+        person = DataGenerator(Person).build(0)
+        person.full_clean()
+        assert person.country in Person.COUNTRIES
+        assert 1 <= person.stars <= 5
+
+    def test_deterministic(self):
+        fields = ("first_name", "last_name", "country", "birthdate", "approved", "stars")
+
+        def build(seed):
+            generator = DataGenerator(Person, seed=seed)
+            return [
+                tuple(getattr(person, field) for field in fields)
+                for person in (generator.build(index) for index in range(20))
+            ]
+
+        assert build(1) == build(1)
+        assert build(1) != build(2)
+
+    def test_values(self):
+        person = DataGenerator(Person, values={"country": "Italy"}).build(0)
+        assert person.country == "Italy"
+
+    @pytest.mark.django_db
+    def test_missing_related_rows(self):
+        with pytest.raises(ImproperlyConfigured):
+            DataGenerator(RelatedPerson).build(0)
+
+    def test_row_values(self):
+        generator = DataGenerator(RelatedPerson)
+        related = generator.build(0, {"person": 5})
+        assert related.person_id == 5
+        # The related rows are not loaded if the value is given.
+        assert generator.related_pks == {}
+
+
+class TestCopyValue:
+    def test_json(self):
+        field = models.JSONField()
+        assert get_copy_value(field, {"a": [1, "ä"]}, connection) == '{"a": [1, "\\u00e4"]}'
+        assert get_copy_value(field, None, connection) == "\\N"
+
+    def test_values(self):
+        assert get_copy_value(models.BooleanField(), True, connection) == "t"
+        assert get_copy_value(models.IntegerField(), 5, connection) == 5
+        assert get_copy_value(models.DateField(), datetime.date(2000, 1, 2), connection) == (
+            "2000-01-02"
+        )
+
+    def test_unsupported(self):
+        with pytest.raises(TypeError):
+            get_copy_value(models.BinaryField(), b"data", connection)
+
+
+@pytest.mark.django_db
+class TestGenerate:
+    def test_rows_target(self):
+        assert generate(Person, 30, batch_size=7) == 30
+        assert generate(Person, 30) == 0
+        assert generate(Person, 45) == 15
+        assert Person.objects.count() == 45
+
+    def test_fan_out(self):
+        generate(Person, 20, fan_out={"relatedperson": (1, 3)})
+        assert 20 <= RelatedPerson.objects.count() <= 60
+        assert not Person.objects.filter(relatedperson__isnull=True).exists()
+
+    def test_fan_out_parents_not_loaded(self):
+        generate(Person, 5)
+        relation = get_reverse_relation(Person, "relatedperson")
+        with CaptureQueriesContext(connection) as queries:
+            assert generate_related(relation, None, 1, 1, 0, 100, "default", None) == 5
+        # The parents are iterated once, the related rows don't pick random parents.
+        assert sum('FROM "store_person"' in query["sql"] for query in queries) == 1
+
+    def test_fan_out_new_rows_only(self):
+        generate(Person, 10)
+        generate(Person, 15, fan_out={"relatedperson": (2, 2)})
+        assert RelatedPerson.objects.count() == 10
+        assert set(RelatedPerson.objects.values_list("person", flat=True)) == set(
+            Person.objects.order_by("pk")[10:].values_list("pk", flat=True)
+        )
+
+    def test_unique_relation(self):
+        generate(Person, 3)
+        field = RelatedPerson._meta.get_field("person")
+        with mock.patch.object(field, "unique", True):
+            generate(RelatedPerson, 2)
+            generate(RelatedPerson, 3)
+            assert set(RelatedPerson.objects.values_list("person", flat=True)) == set(
+                Person.objects.values_list("pk", flat=True)
+            )
+
+            with pytest.raises(ImproperlyConfigured, match="no unused Persons left"):
+                generate(RelatedPerson, 4)
+
+    def test_unknown_relation(self):
+        with pytest.raises(ImproperlyConfigured):
+            generate(Person, 1, fan_out={"unknown": (1, 1)})
+
+
+@pytest.mark.django_db
+class TestCommand:
+    def test_generate(self):
+        out = StringIO()
+        call_command(
+            "cruditor_generate_data",
+            "store.Person",
+            rows=12,
+            fan_out=[("relatedperson", (1, 1))],
+            stdout=out,
+        )
+        assert Person.objects.count() == 12
+        assert RelatedPerson.objects.count() == 12
+        assert "Generated 24 rows for store.Person." in out.getvalue()
+
+    def test_fan_out_argument(self):
+        call_command(
+            "cruditor_generate_data", "store.Person", "--rows=5", "--fan-out=relatedperson=2"
+        )
+        assert RelatedPerson.objects.count() == 10
+
+    def test_list(self):
+        out = StringIO()
+        call_command("cruditor_generate_data", list=True, stdout=out)
+        assert "store.Person" in out.getvalue().split()
+
+    def test_errors(self):
+        with pytest.raises(CommandError):
+            call_command("cruditor_generate_data")
+        with pytest.raises(CommandError):
+            call_command("cruditor_generate_data", "store.Unknown")
+        with pytest.raises(CommandError):
+            call_command("cruditor_generate_data", "store.Person", "--fan-out=relatedperson")
@@ -0,0 +1,139 @@
+import django_filters
+import django_tables2 as tables
+import pytest
+from cruditor.datasources import (
+    CruditorDataSource,
+    DataSourcePaginator,
+    DataSourceResult,
+    DataSourceTableData,
+)
+from cruditor.forms import CruditorTapeformMixin
+from cruditor.pagination import ResultCount
+from cruditor.views import CruditorListView
+from django import forms
+
+
+class Item:
+    def __init__(self, pk, name):
+        self.pk = pk
+        self.name = name
+
+
+class ItemDataSource(CruditorDataSource):
+    chunk_size = 2
+
+    def __init__(self, *args, accuracy="exact", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.accuracy = accuracy
+        self.calls = []
+
+    def fetch(self, offset, limit, ordering, filters):
+        self.calls.append((offset, limit, ordering, filters))
+        items = [
+            Item(pk, name) for pk, name in enumerate(["Dan", "Anna", "Carl", "Bob", "Eve"])
+        ]
+        if "name" in filters:
+            items = [item for item in items if filters["name"].lower() in item.name.lower()]
+        for name in reversed(ordering):
+            items.sort(key=lambda item: getattr(item, name.lstrip("-")), reverse=name[0] == "-")
+        return DataSourceResult(
+            items[offset : offset + limit], ResultCount(len(items), self.accuracy)
+        )
+
+
+class ItemTable(tables.Table):
+    name = tables.Column()
+
+
+class ItemFilter(django_filters.FilterSet):
+    name = django_filters.CharFilter(label="Name")
+
+    class Meta:
+        class form(CruditorTapeformMixin, forms.Form):
+            pass
+
+
+class ItemListView(CruditorListView):
+    table_class = ItemTable
+    filter_class = ItemFilter
+
+    def get_queryset(self):
+        self.source = ItemDataSource(accuracy=self.accuracy)
+        return self.source
+
+
+class TestCruditorDataSource:
+    def test_filter_and_order_by_clone(self):
+        source = ItemDataSource()
+        filtered = source.filter(name__exact="a").order_by("-name")
+        assert filtered is not source
+        assert source.filters == {}
+        assert filtered.filters == {"name": "a"}
+        assert filtered.ordering == ("-name",)
+
+    def test_slicing(self):
+        source = ItemDataSource().order_by("name")
+        assert [item.name for item in source[1:3]] == ["Bob", "Carl"]
+        assert source[0].name == "Anna"
+        assert source.calls == [(1, 2, ["name"], {}), (0, 1, ["name"], {})]
+        with pytest.raises(IndexError):
+            source[10]
+
+    def test_count(self):
+        source = ItemDataSource().filter(name="a")
+        assert source.count() == 3
+        assert source.count() == 3
+        assert source.calls == [(0, 0, [], {"name": "a"})]
+
+    def test_iter_chunks(self):
+        source = ItemDataSource()
+        assert len(list(source)) == 5
+        assert [call[:2] for call in source.calls] == [(0, 2), (2, 2), (4, 2)]
+
+    def test_result_tuple(self):
+        class TupleDataSource(CruditorDataSource):
+            def fetch(self, offset, limit, ordering, filters):
+                return ["a", "b"], 10
+
+        assert TupleDataSource().get_result(0, 2) == DataSourceResult(
+            ["a", "b"], ResultCount(10)
+        )
+
+
+class TestListView:
+    def get_response(self, rf, admin_user, accuracy="exact", **params):
+        request = rf.get("/", data={"per_page": 2, **params})
+        request.user = admin_user
+        view = ItemListView(accuracy=accuracy)
+        view.setup(request)
+        response = view.dispatch(request)
+        return view, response
+
+    def test_pushdown(self, rf, admin_user):
+        view, response = self.get_response(rf, admin_user, page=2, sort="name", name="a")
+        table = response.context_data["table"]
+        assert isinstance(table.data, DataSourceTableData)
+        assert isinstance(table.paginator, DataSourcePaginator)
+        assert [row.record.name for row in table.page.object_list] == ["Dan"]
+        assert table.paginator.num_pages == 2
+
+    def test_single_fetch(self, rf, admin_user):
+        view, response = self.get_response(rf, admin_user, sort="-name")
+        response.render()
+        source = response.context_data["table"].data.data
+        assert source.calls == [(0, 2, ["-name"], {})]
+        assert "Page 1 of 3" in response.content.decode()
+
+    def test_invalid_page(self, rf, admin_user):
+        view, response = self.get_response(rf, admin_user, page=10)
+        table = response.context_data["table"]
+        assert table.page.number == 3
+        assert [row.record.name for row in table.page.object_list] == ["Eve"]
+
+    def test_estimated_count(self, rf, admin_user):
+        view, response = self.get_response(rf, admin_user, accuracy="about", page=2)
+        response.render()
+        table = response.context_data["table"]
+        assert table.paginator.num_pages == 3
+        assert table.page.has_next() is True
+        assert "Page 2 of about 3" in response.content.decode()
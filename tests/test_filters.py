@@ -1,5 +1,17 @@
-from cruditor.filters import AnyChoiceFilter, MultiCharFilter
-from examples.store.models import Person
+import django_filters
+import pytest
+from cruditor.filters import (
+    AnyChoiceFilter,
+    MultiCharFilter,
+    get_exists_query,
+    get_filter_indexes,
+)
+from django.db import connection
+from django.db.models import CharField, Exists, Value
+from django.db.models.functions import Lower
+from examples.store.models import Person, RelatedPerson
+
+from tests.factories import PersonFactory, RelatedPersonFactory
 
 
 class TestAnyChoiceFilter:
@@ -34,3 +46,115 @@ class TestMultiCharFilter:
     def test_skip_filter(self):
         instance = MultiCharFilter(("first_name", "^last_name"))
         assert len(instance.filter(Person.objects.all(), "").query.has_filters().children) == 0
+
+    @pytest.mark.django_db
+    def test_filter_reverse_relation(self):
+        person = PersonFactory.create(first_name="John")
+        RelatedPersonFactory.create_batch(2, person=person, first_name="Sally")
+        PersonFactory.create(first_name="Mary")
+
+        instance = MultiCharFilter(("first_name", "relatedperson__first_name"))
+        qs = instance.filter(Person.objects.all(), "sally")
+        assert len(qs.query.alias_map) == 1
+        assert list(qs) == [person]
+
+    @pytest.mark.django_db
+    def test_filter_reverse_relation_without_exists(self):
+        person = PersonFactory.create()
+        RelatedPersonFactory.create_batch(2, person=person, first_name="Sally")
+
+        instance = MultiCharFilter(("relatedperson__first_name",), use_exists=False)
+        assert list(instance.filter(Person.objects.all(), "sally")) == [person, person]
+
+    def test_filter_use_lower(self):
+        instance = MultiCharFilter(("^first_name", "=last_name", "country"), use_lower=True)
+        filters = (
+            instance.filter(Person.objects.all(), "Foo")
+            .query.has_filters()
+            .children[0]
+            .children
+        )
+        assert isinstance(filters[0].lhs, Lower)
+        assert filters[0].lookup_name == "startswith"
+        assert filters[0].rhs == Lower(Value("Foo"))
+
+        assert isinstance(filters[1].lhs, Lower)
+        assert filters[1].lookup_name == "exact"
+        assert filters[1].rhs == Lower(Value("Foo"))
+
+        assert filters[2].lookup_name == "icontains"
+        assert filters[2].rhs == "Foo"
+
+    @pytest.mark.django_db
+    def test_filter_use_lower_results(self):
+        person = PersonFactory.create(first_name="John", last_name="McDonald")
+        RelatedPersonFactory.create(person=person, first_name="Sally")
+        PersonFactory.create(first_name="Mary", last_name="Johnson")
+
+        instance = MultiCharFilter(("^first_name", "=last_name"), use_lower=True)
+        assert list(instance.filter(Person.objects.all(), "JO")) == [person]
+        assert list(instance.filter(Person.objects.all(), "mcdonald")) == [person]
+
+        instance = MultiCharFilter(("^relatedperson__first_name",), use_lower=True)
+        assert list(instance.filter(Person.objects.all(), "SAL")) == [person]
+
+    @pytest.mark.django_db
+    def test_filter_use_lower_non_ascii(self):
+        person = PersonFactory.create(first_name="Ärmin")
+
+        instance = MultiCharFilter(("^first_name",), use_lower=True)
+        assert list(instance.filter(Person.objects.all(), "Ärmin")) == [person]
+        assert list(instance.filter(Person.objects.all(), "ärm")) == list(
+            MultiCharFilter(("^first_name",)).filter(Person.objects.all(), "ärm")
+        )
+
+    def test_no_global_lookups(self):
+        assert "lower" not in CharField.get_lookups()
+
+
+class TestGetFilterIndexes:
+    class PersonFilter(django_filters.FilterSet):
+        search = MultiCharFilter(
+            ("^first_name", "=last_name", "country", "^relatedperson__first_name"),
+            use_lower=True,
+        )
+        name = MultiCharFilter(("^first_name",), use_lower=True)
+        other = MultiCharFilter(("^country",))
+
+        class Meta:
+            model = Person
+            fields = ("search", "name", "other")
+
+    def test_indexes(self):
+        indexes = get_filter_indexes(self.PersonFilter)
+        assert [index.expressions for index in indexes] == [
+            (Lower("first_name"),),
+            (Lower("last_name"),),
+        ]
+        assert len({index.name for index in indexes}) == 2
+        assert all(len(index.name) <= 30 for index in indexes)
+
+        sql = str(indexes[0].create_sql(Person, connection.schema_editor()))
+        assert 'LOWER("first_name")' in sql
+
+    def test_indexes_opclass(self):
+        index = get_filter_indexes(self.PersonFilter, opclass="text_pattern_ops")[0]
+        assert index.expressions[0].extra["name"] == "text_pattern_ops"
+
+
+class TestGetExistsQuery:
+    def test_plain_field(self):
+        query = get_exists_query(Person, "first_name__icontains", "foo")
+        assert query.children == [("first_name__icontains", "foo")]
+
+    def test_forward_relation(self):
+        query = get_exists_query(RelatedPerson, "person__first_name", "foo")
+        assert query.children == [("person__first_name", "foo")]
+
+    def test_reverse_relation(self):
+        query = get_exists_query(Person, "relatedperson__first_name__iexact", "foo")
+        assert isinstance(query.children[0], Exists)
+
+    def test_reverse_relation_lookup_only(self):
+        query = get_exists_query(Person, "relatedperson__isnull", True)
+        assert query.children == [("relatedperson__isnull", True)]
@@ -0,0 +1,154 @@
+import threading
+from unittest import mock
+
+import pytest
+from cruditor.datasources import DataSourceResult
+from cruditor.inmemory import InMemoryCollection, InMemoryIndex, resolve
+
+ROWS = [
+    {"pk": 1, "name": "Dan", "kind": "dog", "owner": {"name": "Zoe"}},
+    {"pk": 2, "name": "Anna", "kind": "cat", "owner": {"name": "Bob"}},
+    {"pk": 3, "name": "Carl", "kind": "dog", "owner": None},
+    {"pk": 4, "name": "Bob", "kind": "bird", "owner": {"name": "Bob"}},
+    {"pk": 5, "name": "Eve Anna", "kind": "cat", "owner": {"name": "Al"}},
+]
+
+
+class AnimalCollection(InMemoryCollection):
+    search_fields = {"search": ("name", "^owner__name"), "words": ("@name",)}
+    loads = 0
+
+    def load(self):
+        AnimalCollection.loads += 1
+        return list(ROWS)
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    AnimalCollection.invalidate()
+    AnimalCollection.loads = 0
+
+
+def names(rows):
+    return [row["name"] for row in rows]
+
+
+def test_resolve():
+    class Obj:
+        owner = {"name": "Zoe"}
+
+    assert resolve(ROWS[0], "owner__name") == "Zoe"
+    assert resolve(Obj(), "owner.name") == "Zoe"
+    assert resolve(ROWS[2], "owner__name") is None
+    assert resolve(Obj(), "missing") is None
+
+
+class TestInMemoryIndex:
+    def test_page_single_field(self):
+        index = InMemoryIndex(ROWS)
+        assert names(index.page(None, ["name"], 1, 2)) == ["Bob", "Carl"]
+        assert names(index.page(None, ["-name"], 0, 2)) == ["Eve Anna", "Dan"]
+        assert names(index.page(None, ["-name"], 4, 2)) == ["Anna"]
+        assert names(index.page(None, [], 3, 5)) == ["Bob", "Eve Anna"]
+        assert index.page(None, ["name"], 0, 0) == []
+
+    def test_page_multiple_fields(self):
+        index = InMemoryIndex(ROWS)
+        assert names(index.page(None, ["kind", "-name"], 0, 5)) == [
+            "Bob",
+            "Eve Anna",
+            "Anna",
+            "Dan",
+            "Carl",
+        ]
+
+    def test_page_none_last(self):
+        index = InMemoryIndex(ROWS)
+        assert names(index.page(None, ["owner__name", "name"], 0, 5))[-1] == "Carl"
+
+    def test_page_filtered(self):
+        index = InMemoryIndex(ROWS)
+        matches = index.filter({"kind": "dog"})
+        assert matches == {0, 2}
+        assert names(index.page(matches, ["name"], 0, 10)) == ["Carl", "Dan"]
+        assert names(index.page(matches, [], 1, 10)) == ["Carl"]
+
+    def test_indexes_built_once(self):
+        index = InMemoryIndex(ROWS)
+        index.page(None, ["name"], 0, 1)
+        order = index.sort_orders["name"]
+        index.page(None, ["-name"], 0, 1)
+        assert index.sort_orders["name"] is order
+
+    def test_filter_values(self):
+        index = InMemoryIndex(ROWS)
+        assert index.filter({"kind": ["cat", "bird"]}) == {1, 3, 4}
+        assert index.filter({"pk": 3}) == {2}
+        assert index.filter({"kind": "dog", "pk": 2}) == set()
+        assert index.filter({}) is None
+
+    def test_search(self):
+        index = InMemoryIndex(ROWS)
+        assert index.search(("name", "^owner__name"), "bo") == {1, 3}
+        assert index.search(("name",), "ANNA") == {1, 4}
+        assert index.search(("=name",), "anna") == {1}
+        assert index.search(("@name",), "anna eve") == {4}
+
+
+class TestInMemoryCollection:
+    def test_fetch(self):
+        collection = AnimalCollection().filter(kind="cat").order_by("-name")
+        assert collection.fetch(0, 1, ["-name"], {"kind": "cat"}) == DataSourceResult(
+            [ROWS[4]], 2
+        )
+        assert names(collection[0:2]) == ["Eve Anna", "Anna"]
+        assert collection.count() == 2
+
+    def test_search_filter(self):
+        collection = AnimalCollection().filter(search="zo").order_by("name")
+        assert names(collection[0:10]) == ["Dan"]
+
+    def test_snapshot_shared(self):
+        AnimalCollection().count()
+        AnimalCollection().filter(kind="dog").count()
+        assert AnimalCollection.loads == 1
+
+    def test_ttl(self):
+        with mock.patch("cruditor.inmemory.time.monotonic", return_value=1000):
+            AnimalCollection().count()
+        with mock.patch("cruditor.inmemory.time.monotonic", return_value=1100):
+            AnimalCollection().count()
+        assert AnimalCollection.loads == 1
+        with mock.patch("cruditor.inmemory.time.monotonic", return_value=1300):
+            AnimalCollection().count()
+        assert AnimalCollection.loads == 2
+
+    def test_stale_while_reloading(self):
+        with mock.patch("cruditor.inmemory.time.monotonic", return_value=1000):
+            snapshot = AnimalCollection().get_snapshot()
+
+        with mock.patch("cruditor.inmemory.time.monotonic", return_value=2000):
+            with AnimalCollection.snapshots_lock:
+                # Another request is reloading the snapshot.
+                assert AnimalCollection().get_snapshot() is snapshot
+            assert AnimalCollection().get_snapshot() is not snapshot
+
+    def test_invalidate(self):
+        AnimalCollection().count()
+        AnimalCollection.invalidate()
+        AnimalCollection().count()
+        assert AnimalCollection.loads == 2
+
+    def test_concurrent_load(self):
+        barrier = threading.Barrier(4, timeout=2)
+
+        def count():
+            barrier.wait()
+            AnimalCollection().count()
+
+        threads = [threading.Thread(target=count) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert AnimalCollection.loads == 1
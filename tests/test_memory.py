@@ -0,0 +1,142 @@
+import gc
+import os
+import tracemalloc
+from io import StringIO
+from unittest import mock
+
+import pytest
+from cruditor.memory import (
+    MemoryTrace,
+    aggregate_memory_records,
+    get_memory_trace,
+    load_memory_records,
+    trace_lock,
+)
+from django.core.management import call_command
+from examples.collection.views import PersonListView
+
+
+@pytest.fixture
+def memory_settings(settings, tmp_path):
+    settings.CRUDITOR_MEMORY_DIR = str(tmp_path)
+    return settings
+
+
+def allocate():
+    return [str(i) * 10 for i in range(10000)]
+
+
+def test_get_memory_trace(settings):
+    assert get_memory_trace() is None
+    settings.CRUDITOR_MEMORY_SAMPLE_RATE = 0.5
+    with mock.patch("cruditor.memory.random.random", return_value=0.7):
+        assert get_memory_trace() is None
+    with mock.patch("cruditor.memory.random.random", return_value=0.2):
+        assert isinstance(get_memory_trace(), MemoryTrace)
+
+
+class TestMemoryTrace:
+    def test_trace(self):
+        with MemoryTrace() as trace:
+            data = allocate()
+            del data
+            kept = allocate()
+
+        assert not tracemalloc.is_tracing()
+        assert trace.peak > 10000 * 50
+        site, size, count = trace.surviving_sites[0]
+        assert site.startswith(__file__)
+        assert size >= 10000 * 50
+        assert kept
+
+    def test_already_tracing(self):
+        tracemalloc.start()
+        try:
+            previous = allocate()
+            with MemoryTrace() as trace:
+                kept = allocate()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+        # Only the allocations of the traced block are counted.
+        assert trace.surviving_sites[0][1] < 1.5 * trace.peak
+        assert previous and kept
+
+    def test_concurrent(self):
+        with trace_lock:
+            with MemoryTrace() as trace:
+                pass
+        assert trace.active is False
+        assert trace.peak is None
+
+
+def test_aggregate_memory_records():
+    records = [
+        {"view": "a", "peak": 100, "surviving_sites": [["x.py:1", 60, 1], ["y.py:2", 40, 1]]},
+        {"view": "a", "peak": 300, "surviving_sites": [["x.py:1", 100, 1]]},
+        {"view": "b", "peak": 200, "surviving_sites": []},
+    ]
+    first, second = aggregate_memory_records(records)
+    assert first["view"] == "a"
+    assert first["samples"] == 2
+    assert (first["max_peak"], first["mean_peak"], first["p95_peak"]) == (300, 200, 300)
+    assert first["surviving_sites"] == [("x.py:1", 80), ("y.py:2", 20)]
+    assert second["view"] == "b"
+
+
+@pytest.mark.django_db
+class TestViewMemory:
+    def get(self, rf, admin_user):
+        request = rf.get("/")
+        request.user = admin_user
+        return PersonListView.as_view()(request).render()
+
+    def test_disabled(self, rf, admin_user, memory_settings, tmp_path):
+        self.get(rf, admin_user)
+        assert not os.listdir(tmp_path)
+
+    def test_sampled(self, rf, admin_user, memory_settings, tmp_path):
+        memory_settings.CRUDITOR_MEMORY_SAMPLE_RATE = 1
+        self.get(rf, admin_user)
+        self.get(rf, admin_user)
+
+        records = load_memory_records()
+        assert len(records) == 2
+        assert records[0]["view"] == "examples.collection.views.PersonListView"
+        assert records[0]["method"] == "GET"
+        assert records[0]["peak"] > 0
+        assert records[0]["surviving_sites"]
+
+        out = StringIO()
+        call_command("cruditor_memory_report", sites=2, clear=True, stdout=out)
+        lines = out.getvalue().splitlines()
+        assert lines[0].startswith("examples.collection.views.PersonListView: 2 samples")
+        assert lines[1] == "  Allocations surviving the request (not the peak):"
+        assert len(lines) == 4
+        assert not load_memory_records()
+
+    def test_not_rendered(self, rf, admin_user, memory_settings, tmp_path):
+        memory_settings.CRUDITOR_MEMORY_SAMPLE_RATE = 1
+        request = rf.get("/")
+        request.user = admin_user
+        response = PersonListView.as_view()(request)
+        assert trace_lock.locked()
+
+        # The trace is stopped if the response is dropped without being rendered.
+        del response
+        gc.collect()
+        assert not trace_lock.locked()
+        assert not tracemalloc.is_tracing()
+        assert not os.listdir(tmp_path)
+
+    def test_write_error(self, rf, admin_user, memory_settings, tmp_path, caplog):
+        (tmp_path / "file").write_text("")
+        memory_settings.CRUDITOR_MEMORY_DIR = str(tmp_path / "file")
+        memory_settings.CRUDITOR_MEMORY_SAMPLE_RATE = 1
+        assert self.get(rf, admin_user).status_code == 200
+        assert "Writing the memory record" in caplog.text
+
+    def test_report_empty(self, memory_settings, tmp_path):
+        out = StringIO()
+        call_command("cruditor_memory_report", stdout=out)
+        assert out.getvalue() == f"No memory records in {tmp_path}.\n"
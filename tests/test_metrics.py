@@ -0,0 +1,257 @@
+import json
+import os
+import threading
+
+import pytest
+from cruditor import metrics
+from cruditor.metrics import MetricsRegistry
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.http import Http404
+from django.urls import reverse
+from examples.collection.views import PersonChangeView, PersonDeleteView, PersonListView
+from examples.store.models import Person
+
+from tests.factories import PersonFactory, RelatedPersonFactory
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    metrics.registry.reset()
+    yield
+    metrics.registry.reset()
+
+
+@pytest.fixture
+def metrics_settings(settings):
+    settings.CRUDITOR_METRICS = True
+    return settings
+
+
+def get_value(metric, **labels):
+    return metric.values.get(metric.get_key(labels))
+
+
+def call(rf, admin_user, view_class, method="get", data=None, **kwargs):
+    request = getattr(rf, method)("/", data=data or {})
+    request.user = admin_user
+    request._messages = CookieStorage(request)
+    response = view_class.as_view()(request, **kwargs)
+    # Template responses are rendered by the handler, after the middlewares.
+    if hasattr(response, "render") and not response.is_rendered:
+        response.render()
+    return response
+
+
+class TestMetricsRegistry:
+    def test_render(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ["view"])
+        counter.inc(view='a"b')
+        counter.inc(2, view='a"b')
+        registry.gauge("rows", "Rows.").set(2.5)
+        histogram = registry.histogram("duration", "Duration.", ["view"], buckets=(1, 5))
+        histogram.observe(0.5, view="v")
+        histogram.observe(3, view="v")
+        histogram.observe(10, view="v")
+
+        assert registry.render().splitlines() == [
+            "# HELP requests_total Requests.",
+            "# TYPE requests_total counter",
+            'requests_total{view="a\\"b"} 3',
+            "# HELP rows Rows.",
+            "# TYPE rows gauge",
+            "rows 2.5",
+            "# HELP duration Duration.",
+            "# TYPE duration histogram",
+            'duration_bucket{view="v",le="1"} 1',
+            'duration_bucket{view="v",le="5"} 2',
+            'duration_bucket{view="v",le="+Inf"} 3',
+            'duration_sum{view="v"} 13.5',
+            'duration_count{view="v"} 3',
+        ]
+
+    def test_labels_required(self):
+        registry = MetricsRegistry()
+        with pytest.raises(ValueError):
+            registry.counter("requests_total", "Requests.", ["view"]).inc()
+
+    def test_register_once(self):
+        registry = MetricsRegistry()
+        assert registry.counter("a", "A.") is registry.counter("a", "A.")
+
+    def test_multi_process(self, settings, tmp_path):
+        settings.CRUDITOR_METRICS_DIR = str(tmp_path)
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ["view"])
+        gauge = registry.gauge("rows", "Rows.", ["view"])
+        histogram = registry.histogram("duration", "Duration.", buckets=(1,))
+        counter.inc(view="v")
+        gauge.set(5, view="v")
+        histogram.observe(0.5)
+        registry.flush()
+        assert os.path.exists(tmp_path / f"{os.getpid()}.json")
+
+        # A running process (the parent) and a process which has exited.
+        other, dead = os.getppid(), 2**22 + 1
+        state = {
+            "requests_total": [[["v"], 2]],
+            "rows": [[["v"], 7]],
+            "duration": [[[], [0, 1, 2, 1]]],
+        }
+        for pid in (other, dead):
+            (tmp_path / f"{pid}.json").write_text(json.dumps(state))
+        (tmp_path / "invalid.json").write_text("{")
+
+        output = registry.render()
+        assert 'requests_total{view="v"} 5' in output
+        assert f'rows{{view="v",pid="{os.getpid()}"}} 5' in output
+        assert f'rows{{view="v",pid="{other}"}} 7' in output
+        assert f'pid="{dead}"' not in output
+        assert 'duration_bucket{le="+Inf"} 3' in output
+        assert "duration_count 3" in output
+
+        # The values of the registry are not changed by aggregation.
+        assert counter.values == {("v",): 1}
+
+    def test_flush_interval(self, settings, tmp_path):
+        settings.CRUDITOR_METRICS_DIR = str(tmp_path)
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.")
+        registry.flush()
+        counter.inc()
+        registry.flush()
+        path = tmp_path / f"{os.getpid()}.json"
+        assert json.loads(path.read_text()) == {"requests_total": []}
+        registry.flush(force=True)
+        assert json.loads(path.read_text()) == {"requests_total": [[[], 1]]}
+
+    def test_flush_concurrent(self, settings, tmp_path):
+        settings.CRUDITOR_METRICS_DIR = str(tmp_path)
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests.").inc()
+
+        errors = []
+
+        def flush():
+            try:
+                for _ in range(20):
+                    registry.flush(force=True)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=flush) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert os.listdir(tmp_path) == [f"{os.getpid()}.json"]
+
+    def test_flush_error(self, settings, tmp_path, caplog):
+        (tmp_path / "file").write_text("")
+        settings.CRUDITOR_METRICS_DIR = str(tmp_path / "file")
+        registry = MetricsRegistry()
+        registry.flush()
+        assert "Writing the metrics" in caplog.text
+
+    def test_mark_process_dead(self, settings, tmp_path):
+        settings.CRUDITOR_METRICS_DIR = str(tmp_path)
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.", ["view"])
+        registry.gauge("rows", "Rows.", ["view"])
+        registry.histogram("duration", "Duration.", buckets=(1,))
+        state = {
+            "requests_total": [[["v"], 2]],
+            "rows": [[["v"], 7]],
+            "duration": [[[], [0, 1, 2, 1]]],
+            "other_total": [[[], 3]],
+        }
+        (tmp_path / "100.json").write_text(json.dumps(state))
+        (tmp_path / "101.json").write_text(json.dumps(state))
+        registry.mark_process_dead(100)
+        registry.mark_process_dead(101)
+        registry.mark_process_dead(102)
+
+        assert sorted(os.listdir(tmp_path)) == ["archive.json", "archive.lock"]
+        assert json.loads((tmp_path / "archive.json").read_text()) == {
+            "requests_total": [[["v"], 4]],
+            "duration": [[[], [0, 2, 4, 2]]],
+            "other_total": [[[], 6]],
+        }
+
+        counter.inc(view="v")
+        output = registry.render()
+        assert 'requests_total{view="v"} 5' in output
+        assert "duration_count 2" in output
+        assert "rows{" not in output
+
+    def test_pid_reused(self, settings, tmp_path):
+        settings.CRUDITOR_METRICS_DIR = str(tmp_path)
+        (tmp_path / f"{os.getpid()}.json").write_text(json.dumps({"requests_total": [[[], 2]]}))
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests.")
+        counter.inc()
+        registry.flush()
+
+        assert json.loads((tmp_path / f"{os.getpid()}.json").read_text()) == {
+            "requests_total": [[[], 1]]
+        }
+        assert "requests_total 3" in registry.render()
+
+
+@pytest.mark.django_db
+class TestViewMetrics:
+    def test_disabled(self, rf, admin_user):
+        call(rf, admin_user, PersonListView)
+        assert not metrics.REQUESTS.values
+
+    def test_list(self, rf, admin_user, metrics_settings):
+        PersonFactory.create_batch(3)
+        call(rf, admin_user, PersonListView)
+
+        view = "examples.collection.views.PersonListView"
+        assert get_value(metrics.REQUESTS, view=view, method="GET", status=200) == 1
+        assert get_value(metrics.REQUEST_DURATION, view=view, method="GET")[-1] == 1
+        assert get_value(metrics.REQUEST_QUERIES, view=view, method="GET")[-2] >= 2
+        assert get_value(metrics.LIST_PAGE_ROWS, view=view) == 3
+        assert get_value(metrics.LIST_RESULT_COUNT, view=view) == 3
+
+    def test_not_found(self, rf, admin_user, metrics_settings):
+        with pytest.raises(Http404):
+            call(rf, admin_user, PersonChangeView, pk=0)
+        view = "examples.collection.views.PersonChangeView"
+        assert get_value(metrics.REQUESTS, view=view, method="GET", status=404) == 1
+
+    def test_form(self, rf, admin_user, metrics_settings):
+        person = PersonFactory.create()
+        call(rf, admin_user, PersonChangeView, "post", {}, pk=person.pk)
+        view = "examples.collection.views.PersonChangeView"
+        assert get_value(metrics.FORM_SUBMISSIONS, view=view, result="invalid") == 1
+
+    def test_delete(self, rf, admin_user, metrics_settings):
+        protected = RelatedPersonFactory.create().person
+        deleted = PersonFactory.create()
+        call(rf, admin_user, PersonDeleteView, "post", pk=protected.pk)
+        call(rf, admin_user, PersonDeleteView, "post", pk=deleted.pk)
+
+        view = "examples.collection.views.PersonDeleteView"
+        assert get_value(metrics.DELETIONS, view=view, result="protected") == 1
+        assert get_value(metrics.DELETIONS, view=view, result="deleted") == 1
+        assert not Person.objects.filter(pk=deleted.pk).exists()
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    def test_staff(self, client, admin_client):
+        assert client.get(reverse("metrics")).status_code == 403
+        response = admin_client.get(reverse("metrics"))
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE cruditor_requests_total counter" in response.content.decode()
+
+    def test_token(self, client, admin_client, settings):
+        settings.CRUDITOR_METRICS_TOKEN = "secret"
+        assert admin_client.get(reverse("metrics")).status_code == 403
+        response = client.get(reverse("metrics"), headers={"Authorization": "Bearer secret"})
+        assert response.status_code == 200
@@ -0,0 +1,152 @@
+import dataclasses
+
+import pytest
+from cruditor.datastructures import NavigationDivider, NavigationGroup, NavigationItem
+from cruditor.navigation import (
+    CompiledDivider,
+    CompiledGroup,
+    CompiledItem,
+    Navigation,
+    NavigationRegistry,
+)
+from django.contrib.auth.models import Permission
+from django.urls import reverse, reverse_lazy, set_script_prefix
+from django.utils import translation
+from examples.mixins import ExamplesMixin
+
+
+def build():
+    build.calls += 1
+    return [
+        NavigationItem(name="Home", url=reverse_lazy("home")),
+        NavigationGroup(
+            name="Persons",
+            items=[
+                NavigationItem(name="List", url=reverse("collection:list")),
+                NavigationDivider(),
+                NavigationItem(
+                    name="Add", url=reverse("collection:add"), permission="store.add_person"
+                ),
+            ],
+        ),
+        NavigationGroup(
+            name="Admin",
+            permission="store.delete_person",
+            items=[NavigationItem(name="Delete", url="/delete/")],
+        ),
+        NavigationGroup(
+            name="Empty",
+            items=[
+                NavigationItem(name="Add", url="/add/", permission="store.add_person"),
+            ],
+        ),
+    ]
+
+
+@pytest.fixture
+def registry():
+    build.calls = 0
+    return NavigationRegistry(build)
+
+
+@pytest.fixture
+def staff_user(django_user_model):
+    return django_user_model.objects.create(username="staff", is_staff=True)
+
+
+@pytest.fixture(autouse=True)
+def clear_examples_registry():
+    ExamplesMixin.navigation_registry.clear()
+
+
+def test_compile(registry):
+    tree = registry.get_tree()
+    assert tree[0] == CompiledItem(name="Home", url="/")
+    assert tree[1].items[1] == CompiledDivider()
+    assert isinstance(tree[1], CompiledGroup)
+    assert registry.permissions == {"store.add_person", "store.delete_person"}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        tree[0].url = "/other/"
+    assert not hasattr(tree[0], "__dict__")
+
+    registry.get_tree()
+    assert build.calls == 1
+
+
+@pytest.mark.django_db
+class TestNavigationRegistry:
+    def test_superuser(self, registry, admin_user):
+        navigation = registry.get_navigation(admin_user)
+        assert isinstance(navigation, Navigation)
+        assert [node.name for node in navigation] == ["Home", "Persons", "Admin", "Empty"]
+        assert len(navigation[1].items) == 3
+
+    def test_permissions(self, registry, staff_user):
+        navigation = registry.get_navigation(staff_user)
+        assert [node.name for node in navigation] == ["Home", "Persons"]
+        # The divider at the end of the group is removed.
+        assert navigation[1].items == (CompiledItem(name="List", url="/collection/"),)
+
+        staff_user.user_permissions.add(Permission.objects.get(codename="add_person"))
+        staff_user = type(staff_user).objects.get(pk=staff_user.pk)
+        navigation = registry.get_navigation(staff_user)
+        assert [node.name for node in navigation] == ["Home", "Persons", "Empty"]
+        assert len(navigation[1].items) == 3
+
+    def test_cached(self, registry, staff_user, django_user_model):
+        other = django_user_model.objects.create(username="other", is_staff=True)
+        first = registry.get_navigation(staff_user)
+        second = registry.get_navigation(other)
+        assert tuple(first) == tuple(second)
+        assert first[0] is second[0]
+        assert list(registry.navigations) == [("/", "en-us", ())]
+
+    def test_no_permissions_no_queries(self, staff_user, django_assert_num_queries):
+        registry = NavigationRegistry(lambda: [NavigationItem(name="Home", url="/")])
+        with django_assert_num_queries(0):
+            assert registry.get_permission_key(staff_user) == ()
+
+    def test_render(self, registry, admin_user, staff_user):
+        html = registry.get_navigation(admin_user, "cruditor/includes/menu.html").html
+        assert 'href="/collection/add/"' in html
+        assert registry.get_navigation(admin_user, "cruditor/includes/menu.html").html is html
+
+        staff_html = registry.get_navigation(staff_user, "cruditor/includes/menu.html").html
+        assert 'href="/collection/add/"' not in staff_html
+
+        with translation.override("de"):
+            registry.get_navigation(admin_user, "cruditor/includes/menu.html").html
+        assert len(registry.menus) == 3
+
+    def test_script_prefix_and_language(self, registry, admin_user):
+        try:
+            set_script_prefix("/app/")
+            navigation = registry.get_navigation(admin_user, "cruditor/includes/menu.html")
+            assert navigation[0].url == "/app/"
+            assert 'href="/app/collection/add/"' in navigation.html
+        finally:
+            set_script_prefix("/")
+        assert registry.get_navigation(admin_user)[0].url == "/"
+        with translation.override("de"):
+            registry.get_navigation(admin_user)
+        assert build.calls == 3
+        assert len(registry.trees) == 3
+
+    def test_render_without_template(self, registry, admin_user):
+        assert registry.get_navigation(admin_user).html is None
+
+    def test_max_entries(self, registry, admin_user):
+        registry.max_entries = 1
+        registry.get_navigation(admin_user, "cruditor/includes/menu.html").html
+        registry.get_navigation(admin_user, "cruditor/includes/extrahead.html").html
+        assert list(registry.menus) == [
+            ("/", "en-us", ("*",), "cruditor/includes/extrahead.html")
+        ]
+
+
+@pytest.mark.django_db
+def test_view_menu(admin_client):
+    response = admin_client.get(reverse("minimal:demo"))
+    assert response.status_code == 200
+    assert 'class="dropdown-item" href="/collection/filter/"' in response.content.decode()
+    assert len(ExamplesMixin.navigation_registry.menus) == 1
@@ -0,0 +1,273 @@
+import datetime
+
+import pytest
+from cruditor.pagination import (
+    CachedCount,
+    CappedCount,
+    CruditorPaginator,
+    EstimatedCount,
+    ExactCount,
+    KeysetPaginator,
+    ResultCount,
+)
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from examples.collection.tables import PersonTable
+from examples.collection.views import PersonFilterView
+from examples.store.models import Person
+
+from tests.factories import PersonFactory
+
+
+class KeysetPersonListView(PersonFilterView):
+    keyset_pagination = True
+
+
+class BirthdatePersonTable(PersonTable):
+    class Meta(PersonTable.Meta):
+        fields = ("first_name", "birthdate")
+
+
+class KeysetBirthdateListView(KeysetPersonListView):
+    table_class = BirthdatePersonTable
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def setup_method(self):
+        self.persons = [
+            PersonFactory.create(first_name=name)
+            for name in ("Anna", "Bob", "Bob", "Carl", "Dan")
+        ]
+
+    def get_table(self, rf, admin_user, **params):
+        request = rf.get("/", data={"per_page": 2, **params})
+        request.user = admin_user
+        response = KeysetPersonListView.as_view()(request)
+        return response.context_data["table"]
+
+    def get_names(self, table):
+        return [row.record.first_name for row in table.page.object_list]
+
+    def test_first_page(self, rf, admin_user):
+        table = self.get_table(rf, admin_user)
+        assert isinstance(table.paginator, KeysetPaginator)
+        assert self.get_names(table) == ["Anna", "Bob"]
+        assert table.page.has_previous() is False
+        assert table.page.has_next() is True
+
+    def test_forward_and_backward(self, rf, admin_user):
+        table = self.get_table(rf, admin_user, sort="first_name")
+        assert self.get_names(table) == ["Anna", "Bob"]
+
+        table = self.get_table(rf, admin_user, sort="first_name", cursor=table.page.next_cursor)
+        assert self.get_names(table) == ["Bob", "Carl"]
+        assert table.page.has_previous() is True
+        assert table.page.has_next() is True
+
+        last = self.get_table(rf, admin_user, sort="first_name", cursor=table.page.next_cursor)
+        assert self.get_names(last) == ["Dan"]
+        assert last.page.has_next() is False
+
+        table = self.get_table(
+            rf, admin_user, sort="first_name", cursor=last.page.previous_cursor
+        )
+        assert self.get_names(table) == ["Bob", "Carl"]
+
+        table = self.get_table(
+            rf, admin_user, sort="first_name", cursor=table.page.previous_cursor
+        )
+        assert self.get_names(table) == ["Anna", "Bob"]
+        assert table.page.has_previous() is False
+
+    def test_descending(self, rf, admin_user):
+        table = self.get_table(rf, admin_user, sort="-first_name")
+        assert self.get_names(table) == ["Dan", "Carl"]
+
+        table = self.get_table(
+            rf, admin_user, sort="-first_name", cursor=table.page.next_cursor
+        )
+        assert self.get_names(table) == ["Bob", "Bob"]
+
+    def test_cursor_from_other_ordering(self, rf, admin_user):
+        table = self.get_table(rf, admin_user, sort="first_name")
+        table = self.get_table(
+            rf, admin_user, sort="-first_name", cursor=table.page.next_cursor
+        )
+        assert self.get_names(table) == ["Dan", "Carl"]
+
+    def test_invalid_cursor(self, rf, admin_user):
+        table = self.get_table(rf, admin_user, cursor="invalid")
+        assert self.get_names(table) == ["Anna", "Bob"]
+
+    def test_no_count_query(self, rf, admin_user, django_assert_num_queries):
+        request = rf.get("/", data={"per_page": 2})
+        request.user = admin_user
+        with django_assert_num_queries(1):
+            KeysetPersonListView.as_view()(request).render()
+
+    def test_rendered_links(self, rf, admin_user):
+        request = rf.get("/", data={"per_page": 2})
+        request.user = admin_user
+        content = KeysetPersonListView.as_view()(request).render().content.decode()
+        assert "cursor=" in content
+        assert "Page 1 of" not in content
+
+    def test_page_parameter_ignored(self, rf, admin_user):
+        table = self.get_table(rf, admin_user, sort="first_name")
+        table = self.get_table(
+            rf, admin_user, sort="first_name", cursor=table.page.next_cursor, page=3
+        )
+        assert self.get_names(table) == ["Bob", "Carl"]
+
+    def test_ordering_appends_pk(self):
+        paginator = KeysetPaginator(None, 10)
+        assert paginator.get_ordering(Person.objects.order_by("-first_name")) == [
+            "-first_name",
+            "pk",
+        ]
+        assert paginator.get_ordering(Person.objects.order_by("id")) == ["id"]
+
+
+@pytest.mark.django_db
+class TestKeysetPaginationNullable:
+    def setup_method(self):
+        self.persons = [
+            PersonFactory.create(
+                first_name=str(i), birthdate=None if i % 2 else datetime.date(2000, 1, i)
+            )
+            for i in range(1, 7)
+        ]
+
+    def get_page(self, rf, admin_user, **params):
+        request = rf.get("/", data={"per_page": 2, **params})
+        request.user = admin_user
+        table = KeysetBirthdateListView.as_view()(request).context_data["table"]
+        return [int(row.record.first_name) for row in table.page.object_list], table.page
+
+    def walk(self, rf, admin_user, sort):
+        names, page = self.get_page(rf, admin_user, sort=sort)
+        pages = [names]
+        while page.has_next():
+            names, page = self.get_page(rf, admin_user, sort=sort, cursor=page.next_cursor)
+            pages.append(names)
+
+        backwards = [names]
+        while page.has_previous():
+            names, page = self.get_page(rf, admin_user, sort=sort, cursor=page.previous_cursor)
+            backwards.insert(0, names)
+
+        assert backwards == pages
+        return [name for names in pages for name in names]
+
+    def test_ascending(self, rf, admin_user):
+        # SQLite sorts NULL values first.
+        assert self.walk(rf, admin_user, "birthdate") == [1, 3, 5, 2, 4, 6]
+
+    def test_descending(self, rf, admin_user):
+        assert self.walk(rf, admin_user, "-birthdate") == [6, 4, 2, 1, 3, 5]
+
+    def test_nulls_largest(self):
+        paginator = KeysetPaginator(None, 10)
+        seek = paginator.get_seek_filter(["birthdate", "pk"], [None, 1], nulls_largest=True)
+        assert (
+            list(Person.objects.filter(seek).order_by("birthdate", "pk"))
+            == [person for person in self.persons if person.birthdate is None][1:]
+        )
+
+        seek = paginator.get_seek_filter(
+            ["birthdate", "pk"], [datetime.date(2000, 1, 6), 6], nulls_largest=True
+        )
+        assert set(Person.objects.filter(seek)) == {
+            person for person in self.persons if person.birthdate is None
+        }
+
+
+@pytest.mark.django_db
+class TestCountStrategies:
+    def setup_method(self):
+        PersonFactory.create_batch(5)
+
+    def get_response(self, rf, admin_user, strategy, **params):
+        request = rf.get("/", data={"per_page": 2, **params})
+        request.user = admin_user
+        view = PersonFilterView.as_view(count_strategy=strategy)
+        return view(request).render()
+
+    def test_exact_default(self, rf, admin_user):
+        response = self.get_response(rf, admin_user, None)
+        table = response.context_data["table"]
+        assert isinstance(table.paginator, CruditorPaginator)
+        assert table.paginator.result_count == ResultCount(5)
+        assert "Page 1 of 3" in response.content.decode()
+
+    def test_exact_list(self):
+        assert ExactCount().count([1, 2, 3]) == ResultCount(3)
+
+    def test_capped(self, rf, admin_user):
+        response = self.get_response(rf, admin_user, CappedCount(limit=3))
+        table = response.context_data["table"]
+        assert table.paginator.result_count == ResultCount(3, "more_than")
+        assert table.page.has_next() is True
+        assert "Page 1 of more than 2" in response.content.decode()
+
+    def test_capped_beyond_limit(self, rf, admin_user):
+        response = self.get_response(rf, admin_user, CappedCount(limit=3), page=3)
+        table = response.context_data["table"]
+        assert len(table.page.object_list) == 1
+        assert table.page.number == 3
+        assert table.page.has_next() is False
+        assert table.page.has_previous() is True
+
+    def test_capped_not_reached(self):
+        assert CappedCount(limit=10).count(Person.objects.all()) == ResultCount(5)
+
+    def test_estimated_fallback(self):
+        assert EstimatedCount().count(Person.objects.all()) == ResultCount(5)
+
+    def test_cached(self, django_assert_num_queries):
+        cache.clear()
+        strategy = CachedCount(timeout=10)
+        approved = Person.objects.filter(approved=True).count()
+
+        with django_assert_num_queries(1):
+            assert strategy.count(Person.objects.filter(approved=True)).value == approved
+            assert strategy.count(Person.objects.filter(approved=True)).value == approved
+
+        with django_assert_num_queries(1):
+            assert strategy.count(Person.objects.filter(approved=False)).value == 5 - approved
+
+    def count_queries(self, rf, admin_user, strategy, query_string):
+        request = rf.get(f"/?per_page=2&{query_string}")
+        request.user = admin_user
+        with CaptureQueriesContext(connection) as queries:
+            PersonFilterView.as_view(count_strategy=strategy)(request).render()
+        return sum("COUNT(" in query["sql"] for query in queries.captured_queries)
+
+    def test_cached_view_key(self, rf, admin_user):
+        # Empty tables are counted again by django-tables2, make sure there are rows.
+        PersonFactory.create(country="Italy", approved=True)
+        PersonFactory.create(country="France")
+        cache.clear()
+        strategy = CachedCount(timeout=10)
+        assert self.count_queries(rf, admin_user, strategy, "country=Italy&approved=true") == 1
+        assert self.count_queries(rf, admin_user, strategy, "approved=true&country=Italy") == 0
+        assert self.count_queries(rf, admin_user, strategy, "sort=-first_name&page=2") == 1
+        assert self.count_queries(rf, admin_user, strategy, "country=&sort=last_name") == 0
+        assert self.count_queries(rf, admin_user, strategy, "country=France") == 1
+
+    def test_count_cache_key(self, rf, admin_user):
+        request = rf.get("/", data={"country": "Spain"})
+        request.user = admin_user
+        view = PersonFilterView(request=request)
+        view.filterset = view.get_filtered_queryset()
+        assert view.get_count_cache_key() is None
+
+        request = rf.get("/", data={"approved": "true", "country": "Italy", "search": ""})
+        view = PersonFilterView(request=request)
+        view.filterset = view.get_filtered_queryset()
+        assert view.get_count_cache_key() == (
+            "examples.collection.views.PersonFilterView:/:"
+            '{"approved": true, "country": "Italy"}'
+        )
@@ -0,0 +1,120 @@
+import os
+import pstats
+import time
+from unittest import mock
+
+import pytest
+from cruditor.profiling import (
+    CProfiler,
+    RequestProfile,
+    StackSampler,
+    get_profile_directory,
+    get_request_profile,
+    rotate_profiles,
+)
+from examples.collection.views import PersonListView
+
+
+@pytest.fixture
+def profile_settings(settings, tmp_path):
+    settings.CRUDITOR_PROFILE_DIR = str(tmp_path)
+    return settings
+
+
+def get_list(rf, admin_user):
+    request = rf.get("/")
+    request.user = admin_user
+    return PersonListView.as_view()(request).render()
+
+
+def test_get_request_profile(settings):
+    assert get_request_profile() is None
+
+    settings.CRUDITOR_PROFILE_SAMPLE_RATE = 0.5
+    with mock.patch("cruditor.profiling.random.random", return_value=0.7):
+        assert get_request_profile() is None
+    with mock.patch("cruditor.profiling.random.random", return_value=0.2):
+        profile = get_request_profile()
+    assert profile.sampled is True
+    assert isinstance(profile.profiler, CProfiler)
+
+    settings.CRUDITOR_PROFILE_THRESHOLD = 1
+    settings.CRUDITOR_PROFILER = "sampler"
+    with mock.patch("cruditor.profiling.random.random", return_value=0.7):
+        profile = get_request_profile()
+    assert profile.sampled is False
+    assert isinstance(profile.profiler, StackSampler)
+
+
+def test_get_profile_directory(settings):
+    settings.CRUDITOR_PROFILE_DIR = "/profiles"
+    assert get_profile_directory(PersonListView()) == (
+        "/profiles/examples.collection.views.PersonListView"
+    )
+
+
+def test_rotate_profiles(tmp_path):
+    for name in ("1.prof", "2.folded", "3.prof", "notes.txt"):
+        (tmp_path / name).touch()
+    rotate_profiles(tmp_path, 2)
+    assert sorted(os.listdir(tmp_path)) == ["2.folded", "3.prof", "notes.txt"]
+
+
+def test_threshold():
+    profile = RequestProfile(StackSampler(), sampled=False, threshold=10)
+    with profile:
+        pass
+    assert profile.should_save() is False
+    profile.duration = 11
+    assert profile.should_save() is True
+
+
+def test_stack_sampler(tmp_path):
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        pass
+    sampler.stop()
+    assert sampler.stacks
+    assert any("test_stack_sampler" in stack for stack in sampler.stacks)
+
+    sampler.dump(tmp_path / "dump.folded")
+    line = (tmp_path / "dump.folded").read_text().splitlines()[0]
+    assert line.rsplit(" ", 1)[1].isdigit()
+
+
+@pytest.mark.django_db
+class TestViewProfiling:
+    def test_disabled(self, rf, admin_user, profile_settings, tmp_path):
+        get_list(rf, admin_user)
+        assert not os.listdir(tmp_path)
+
+    def test_sampled(self, rf, admin_user, profile_settings, tmp_path):
+        profile_settings.CRUDITOR_PROFILE_SAMPLE_RATE = 1
+        profile_settings.CRUDITOR_PROFILE_KEEP = 2
+        for _ in range(3):
+            response = get_list(rf, admin_user)
+        assert response.is_rendered
+
+        directory = tmp_path / "examples.collection.views.PersonListView"
+        dumps = sorted(os.listdir(directory))
+        assert len(dumps) == 2
+        assert dumps[0].endswith(".prof") and "-GET-" in dumps[0]
+        stats = pstats.Stats(str(directory / dumps[0]))
+        assert any(func[2] == "render" for func in stats.stats)
+
+    def test_write_error(self, rf, admin_user, profile_settings, tmp_path, caplog):
+        # A file instead of a directory, the profile directory cannot be created.
+        (tmp_path / "file").write_text("")
+        profile_settings.CRUDITOR_PROFILE_DIR = str(tmp_path / "file")
+        profile_settings.CRUDITOR_PROFILE_SAMPLE_RATE = 1
+        response = get_list(rf, admin_user)
+        assert response.status_code == 200
+        assert "Writing the profile" in caplog.text
+
+    def test_threshold(self, rf, admin_user, profile_settings, tmp_path):
+        profile_settings.CRUDITOR_PROFILE_THRESHOLD = 60
+        profile_settings.CRUDITOR_PROFILER = "sampler"
+        get_list(rf, admin_user)
+        assert not os.listdir(tmp_path)
@@ -0,0 +1,99 @@
+import logging
+import pickle
+
+import pytest
+from cruditor.queries import QueryBudgetExceeded, QueryCounter, normalize_sql
+from examples.collection.views import PersonListView
+from examples.store.models import Person
+
+from tests.factories import PersonFactory
+
+
+def test_normalize_sql():
+    assert normalize_sql("SELECT * FROM t WHERE a = 'x''y' AND b = 12") == (
+        "SELECT * FROM t WHERE a = ? AND b = ?"
+    )
+    assert normalize_sql('SELECT "t"."a1" FROM t WHERE id IN (%s, %s,\n %s)') == (
+        'SELECT "t"."a1" FROM t WHERE id IN (...)'
+    )
+    assert normalize_sql("INSERT INTO t VALUES (%s, %s), (%s, NULL)") == (
+        "INSERT INTO t VALUES (...)"
+    )
+
+
+@pytest.mark.django_db
+class TestQueryCounter:
+    def test_count(self):
+        with QueryCounter() as counter:
+            for pk in range(3):
+                Person.objects.filter(pk=pk).exists()
+            Person.objects.count()
+        Person.objects.count()
+
+        assert counter.count == 4
+        assert counter.duration > 0
+        (first, first_count, _), (second, second_count, _) = counter.group()
+        assert (first_count, second_count) == (3, 1)
+        assert "WHERE" in first and "COUNT" in second
+        assert counter.format().splitlines()[0].startswith("    3x")
+
+    def test_limit(self):
+        with QueryCounter(limit=2) as counter:
+            for pk in range(3):
+                Person.objects.filter(pk=pk).exists()
+            Person.objects.count()
+
+        assert counter.count == 4
+        assert len(counter.queries) == 2
+        assert "COUNT" in counter.queries[-1][0]
+
+
+@pytest.mark.django_db
+class TestQueryBudget:
+    def setup_method(self):
+        PersonFactory.create_batch(3)
+
+    def get(self, rf, admin_user, **initkwargs):
+        request = rf.get("/")
+        request.user = admin_user
+        return PersonListView.as_view(**initkwargs)(request).render()
+
+    def test_within_budget(self, rf, admin_user, caplog):
+        response = self.get(rf, admin_user, max_queries=50, max_query_time=10)
+        assert response.status_code == 200
+        assert response.is_rendered
+        assert not caplog.records
+
+    def test_log(self, rf, admin_user, caplog):
+        with caplog.at_level(logging.WARNING, logger="cruditor.mixins"):
+            response = self.get(rf, admin_user, max_queries=1)
+        assert response.status_code == 200
+        (record,) = caplog.records
+        assert record.name == "cruditor.mixins"
+        assert "GET / exceeded its query budget" in record.getMessage()
+        assert "(max. 1)" in record.getMessage()
+        assert "SELECT" in record.getMessage()
+
+    def test_raise(self, rf, admin_user):
+        with pytest.raises(QueryBudgetExceeded, match="query time"):
+            self.get(rf, admin_user, max_query_time=0, query_budget_action="raise")
+
+    def test_setting(self, rf, admin_user, settings):
+        settings.CRUDITOR_QUERY_BUDGET_ACTION = "raise"
+        with pytest.raises(QueryBudgetExceeded):
+            self.get(rf, admin_user, max_queries=1)
+
+    def test_lazy_rendering(self, rf, admin_user, caplog):
+        request = rf.get("/")
+        request.user = admin_user
+        response = PersonListView.as_view(max_queries=1)(request)
+        # Middlewares can change the response before it is rendered.
+        assert not response.is_rendered
+        assert not caplog.records
+        response.template_name = "cruditor/list-fragment.html"
+
+        response.render()
+        assert response.is_rendered
+        assert "exceeded its query budget" in caplog.records[0].getMessage()
+        assert not response.content.decode().lstrip().startswith("<!DOCTYPE")
+        pickle.dumps(response)
@@ -0,0 +1,210 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from cruditor.remote import CircuitBreaker, CircuitOpenError, RemoteClient, fan_out
+from django.core.cache import cache
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(
+            (self.command, self.path, dict(self.headers), self.client_address)
+        )
+
+        if server.status >= 500:
+            return self.respond(server.status, b"")
+        if server.delay:
+            time.sleep(server.delay)
+
+        etag = f'"{server.version}"'
+        if self.headers.get("If-None-Match") == etag:
+            return self.respond(304, b"", etag=etag)
+
+        body = json.dumps({"path": self.path, "version": server.version}).encode()
+        return self.respond(200, body, etag=etag)
+
+    def do_POST(self):
+        self.server.requests.append(
+            (self.command, self.path, dict(self.headers), self.client_address)
+        )
+        self.server.version += 1
+        self.respond(201, self.rfile.read(int(self.headers["Content-Length"])))
+
+    def respond(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads, server.block_on_close = True, False
+    server.requests, server.version, server.status, server.delay = [], 1, 200, 0
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    cache.clear()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server):
+    client = RemoteClient(f"http://127.0.0.1:{server.server_port}/api/", timeout=2)
+    yield client
+    client.session.close()
+
+
+class TestRemoteClient:
+    def test_get_cached(self, server, client):
+        assert client.get("items", {"page": 1}) == {"path": "/api/items?page=1", "version": 1}
+        assert client.get("items", {"page": 1})["version"] == 1
+        assert len(server.requests) == 1
+
+        client.get("items", {"page": 2})
+        assert len(server.requests) == 2
+
+    def test_revalidate_etag(self, server, client):
+        client.max_age = 0
+        client.get("items")
+        assert client.get("items")["version"] == 1
+
+        assert len(server.requests) == 2
+        assert server.requests[1][2]["If-None-Match"] == '"1"'
+
+    def test_stale_while_revalidate(self, server, client):
+        client.max_age = 0
+        client.get("items")
+        server.version = 2
+
+        assert client.get("items", stale_while_revalidate=True)["version"] == 1
+        client.executor.shutdown(wait=True)
+        assert len(server.requests) == 2
+
+        client.max_age = 60
+        assert client.get("items")["version"] == 2
+
+    def test_unsafe_request_invalidates(self, server, client):
+        client.get("items")
+        assert client.post("items", json={"name": "new"}) == {"name": "new"}
+        assert client.get("items")["version"] == 2
+        assert [request[0] for request in server.requests] == ["GET", "POST", "GET"]
+
+    def test_no_cache(self, server, client):
+        client.cache_alias = None
+        client.get("items")
+        client.get("items")
+        assert len(server.requests) == 2
+
+    def test_stale_on_error(self, server, client):
+        client.max_age = 0
+        client.get("items")
+        server.status = 503
+        assert client.get("items")["version"] == 1
+
+    def test_error_without_cache(self, server, client):
+        server.status = 500
+        with pytest.raises(requests.HTTPError):
+            client.get("items")
+
+    def test_timeout(self, server, client):
+        client.timeout = 0.1
+        server.delay = 0.5
+        with pytest.raises(requests.Timeout):
+            client.get("items")
+
+    def test_circuit_breaker(self, server, client):
+        client.circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        server.status = 500
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                client.get("items")
+
+        with pytest.raises(CircuitOpenError):
+            client.get("items")
+        assert len(server.requests) == 2
+
+    def test_connection_pooling(self, server, client):
+        client.cache_alias = None
+        client.get("items")
+        client.get("items")
+        # Both requests were sent using the same connection.
+        assert server.requests[0][3] == server.requests[1][3]
+
+    def test_unknown_option(self):
+        with pytest.raises(TypeError):
+            RemoteClient("http://localhost/", unknown=True)
+
+
+class TestCircuitBreaker:
+    def test_half_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.state == "half-open"
+
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_open(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        assert breaker.allow() is True
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.allow() is False
+
+
+class TestFanOut:
+    def test_concurrent(self):
+        barrier = threading.Barrier(3, timeout=2)
+
+        def func(item):
+            barrier.wait()
+            return item * 2
+
+        assert fan_out(func, [1, 2, 3], max_workers=3) == ([2, 4, 6], {})
+
+    def test_partial_failure(self):
+        def func(item):
+            if item == 2:
+                raise ValueError("broken")
+            return item
+
+        results, errors = fan_out(func, [1, 2, 3], max_workers=2)
+        assert results == [1, None, 3]
+        assert list(errors) == [1]
+        assert isinstance(errors[1], ValueError)
+
+    def test_timeout(self):
+        event = threading.Event()
+
+        def func(item):
+            if item == 1:
+                event.wait(2)
+            return item
+
+        start = time.monotonic()
+        results, errors = fan_out(func, [1, 2, 3], max_workers=2, timeout=0.1)
+        event.set()
+        assert time.monotonic() - start < 1
+        assert results == [None, 2, 3]
+        assert isinstance(errors[0], TimeoutError)
+
+    def test_empty(self):
+        assert fan_out(str, []) == ([], {})
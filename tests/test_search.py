@@ -0,0 +1,181 @@
+import pytest
+from cruditor.filters import MultiCharFilter
+from cruditor.search import (
+    PostgresSearchBackend,
+    SearchBackend,
+    SearchQuery,
+    SQLiteSearchBackend,
+    get_search_backend,
+)
+from django.core.exceptions import ImproperlyConfigured
+from examples.collection.filters import PersonFilter
+from examples.collection.views import PersonFilterView
+from examples.store.models import Person, RelatedPerson
+
+from tests.factories import PersonFactory, RelatedPersonFactory
+
+
+class SearchPersonFilter(PersonFilter):
+    search = MultiCharFilter(("@first_name",))
+
+
+class KeysetSearchListView(PersonFilterView):
+    filter_class = SearchPersonFilter
+    keyset_pagination = True
+
+
+@pytest.fixture
+def search_index(db):
+    backend = SQLiteSearchBackend()
+    backend.create_index(Person, ["first_name", "last_name"])
+    yield backend
+    backend.drop_index(Person, ["first_name", "last_name"])
+
+
+def test_get_search_backend():
+    assert isinstance(get_search_backend(), SQLiteSearchBackend)
+
+
+class TestSQLiteSearchBackend:
+    def test_match_value(self):
+        backend = SQLiteSearchBackend()
+        assert backend.get_match_value(["a", "b"], 'jo "sm') == '{a b} : ("jo"* """sm"*)'
+        assert backend.get_match_value(["a"], " ") is None
+
+    def test_local_fields_only(self):
+        with pytest.raises(ImproperlyConfigured):
+            SQLiteSearchBackend().get_columns(RelatedPerson, ["person"])
+        with pytest.raises(ImproperlyConfigured):
+            SQLiteSearchBackend().get_columns(RelatedPerson, ["person__first_name"])
+
+    @pytest.mark.django_db
+    def test_without_index(self):
+        person = PersonFactory.create(first_name="Johnny")
+        PersonFactory.create(first_name="Mary")
+
+        assert not SQLiteSearchBackend().has_index(Person)
+        instance = MultiCharFilter(("@first_name",))
+        assert list(instance.filter(Person.objects.all(), "ohn")) == [person]
+
+    @pytest.mark.django_db
+    def test_without_index_related_fields(self):
+        related = RelatedPersonFactory.create(first_name="Sally")
+        instance = MultiCharFilter(("@relatedperson__first_name",))
+        assert list(instance.filter(Person.objects.all(), "sal")) == [related.person]
+
+    def test_has_index(self, search_index, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert search_index.has_index(Person)
+        search_index.drop_index(Person, ["first_name", "last_name"])
+        with django_assert_num_queries(0):
+            assert not search_index.has_index(Person)
+        search_index.create_index(Person, ["first_name", "last_name"])
+        assert search_index.has_index(Person)
+
+    def test_keyset_pagination(self, search_index, rf, admin_user):
+        johns = [
+            PersonFactory.create(first_name="John", last_name=name) for name in ("A", "B", "C")
+        ]
+        PersonFactory.create(first_name="Mary")
+
+        def get_page(**params):
+            request = rf.get("/", data={"search": "john", "per_page": 2, **params})
+            request.user = admin_user
+            response = KeysetSearchListView.as_view()(request)
+            assert response.status_code == 200
+            return response.context_data["table"].page
+
+        page = get_page()
+        records = [row.record for row in page.object_list]
+        page = get_page(cursor=page.next_cursor)
+        records += [row.record for row in page.object_list]
+        assert sorted(records, key=lambda person: person.pk) == johns
+        assert page.next_cursor is None
+
+    def test_filter(self, search_index):
+        john = PersonFactory.create(first_name="John", last_name="Smith")
+        johnny = PersonFactory.create(first_name="Johnny", last_name="Walker")
+        mary = PersonFactory.create(first_name="Mary", last_name="Johnson")
+        PersonFactory.create(first_name="Sue", last_name="Miller")
+
+        instance = MultiCharFilter(("@first_name", "@last_name"))
+        assert set(instance.filter(Person.objects.all(), "john")) == {john, johnny, mary}
+        assert list(instance.filter(Person.objects.all(), "john smi")) == [john]
+
+    def test_filter_single_field(self, search_index):
+        PersonFactory.create(first_name="Mary", last_name="Johnson")
+        instance = MultiCharFilter(("@first_name",))
+        assert list(instance.filter(Person.objects.all(), "john")) == []
+
+    def test_order_by_rank(self, search_index):
+        john = PersonFactory.create(first_name="John", last_name="Smith")
+        PersonFactory.create(first_name="Anna", last_name="Johns")
+        johns = PersonFactory.create(first_name="John", last_name="Johns")
+
+        qs = MultiCharFilter(("@first_name", "@last_name")).filter(Person.objects.all(), "john")
+        assert list(qs)[0] == johns
+        assert qs[0].search_rank > 0
+
+        qs = MultiCharFilter(("@first_name", "@last_name"), order_by_rank=False).filter(
+            Person.objects.order_by("pk"), "john"
+        )
+        assert list(qs)[0] == john
+
+    def test_combined_with_lookups(self, search_index):
+        john = PersonFactory.create(first_name="John", country="Germany")
+        sue = PersonFactory.create(first_name="Sue", country="Johnland")
+
+        instance = MultiCharFilter(("@first_name", "country"))
+        assert set(instance.filter(Person.objects.all(), "john")) == {john, sue}
+
+    def test_index_in_sync(self, search_index):
+        person = PersonFactory.create(first_name="John")
+        instance = MultiCharFilter(("@first_name",))
+
+        person.first_name = "Mary"
+        person.save()
+        assert list(instance.filter(Person.objects.all(), "john")) == []
+        assert list(instance.filter(Person.objects.all(), "mary")) == [person]
+
+        person.delete()
+        assert list(instance.filter(Person.objects.all(), "mary")) == []
+
+    def test_rebuild_index(self, search_index):
+        person = PersonFactory.create(first_name="John")
+        search_index.rebuild_index(Person, ["first_name", "last_name"])
+        assert list(MultiCharFilter(("@first_name",)).filter(Person.objects.all(), "jo")) == [
+            person
+        ]
+
+
+class TestSearchBackend:
+    @pytest.mark.django_db
+    def test_fallback(self):
+        person = PersonFactory.create(first_name="Johnny")
+        PersonFactory.create(first_name="Mary")
+
+        instance = MultiCharFilter(("@first_name",), search_backend=SearchBackend())
+        assert list(instance.filter(Person.objects.all(), "ohn")) == [person]
+
+
+@pytest.mark.skipif(SearchQuery is None, reason="psycopg is not installed")
+class TestPostgresSearchBackend:
+    def test_get_query(self):
+        backend = PostgresSearchBackend(config="english")
+        qs, query = backend.get_query(Person.objects.all(), ["first_name", "last_name"], "jo")
+        assert set(qs.query.annotations) == {"search_vector", "search_rank"}
+        assert query.children[0][0] == "search_vector"
+
+    def test_get_query_trigram(self):
+        backend = PostgresSearchBackend(trigram=True)
+        qs, query = backend.get_query(Person.objects.all(), ["first_name"], "jo")
+        assert query.connector == "OR"
+        assert ("first_name__icontains", "jo") in query.children
+
+    def test_get_indexes(self):
+        indexes = PostgresSearchBackend(trigram=True).get_indexes(
+            Person, ["first_name", "last_name"]
+        )
+        assert len(indexes) == 3
+        assert len({index.name for index in indexes}) == 3
+        assert all(len(index.name) <= 30 for index in indexes)
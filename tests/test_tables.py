@@ -0,0 +1,86 @@
+import django_tables2 as tables
+from cruditor.tables import (
+    TableRow,
+    get_projection_fields,
+    get_related_lookups,
+    get_table_accessors,
+    get_table_ordering,
+)
+from examples.collection.tables import PersonTable
+from examples.store.models import Person, RelatedPerson
+
+
+class RelatedPersonTable(tables.Table):
+    first_name = tables.Column()
+    person_name = tables.Column(accessor="person__first_name")
+    country = tables.Column(accessor="person__country")
+
+    class Meta:
+        model = RelatedPerson
+        fields = ("first_name",)
+
+
+class PersonOrderTable(tables.Table):
+    name = tables.Column(accessor="first_name", order_by=("last_name", "-pk"))
+
+
+class PersonRelatedTable(tables.Table):
+    first_name = tables.Column()
+    related = tables.ManyToManyColumn(accessor="relatedperson_set")
+
+
+def test_get_table_accessors():
+    assert get_table_accessors(PersonTable) == ["first_name", "reminder"]
+    assert get_table_accessors(RelatedPersonTable) == [
+        "first_name",
+        "person__first_name",
+        "person__country",
+    ]
+
+
+def test_get_related_lookups_plain():
+    assert get_related_lookups(Person, ["first_name", "pk"]) == ([], [])
+
+
+def test_get_related_lookups_select():
+    accessors = get_table_accessors(RelatedPersonTable)
+    assert get_related_lookups(RelatedPerson, accessors) == (["person"], [])
+
+
+def test_get_related_lookups_prefetch():
+    assert get_related_lookups(Person, ["relatedperson_set", "relatedperson_set"]) == (
+        [],
+        ["relatedperson_set"],
+    )
+    assert get_related_lookups(Person, ["relatedperson__person__first_name"]) == (
+        [],
+        ["relatedperson__person"],
+    )
+
+
+def test_get_table_ordering():
+    assert get_table_ordering(PersonTable) == []
+    assert get_table_ordering(PersonOrderTable) == ["last_name", "pk"]
+
+
+def test_get_projection_fields():
+    assert get_projection_fields(
+        RelatedPerson,
+        ["first_name", "-pk", "person__first_name", "person__get_absolute_url", "__str__"],
+    ) == ["first_name", "pk", "person__first_name", "person"]
+
+
+def test_get_projection_fields_multivalued():
+    assert get_projection_fields(Person, ["relatedperson_set__first_name", "stars"]) == [
+        "stars"
+    ]
+
+
+class TestTableRow:
+    def test_nested(self):
+        row = TableRow({"pk": 1, "first_name": "Sally", "person__first_name": "John"})
+        assert row.pk == 1
+        assert row["first_name"] == "Sally"
+        assert row["person"]["first_name"] == "John"
+        assert row.get("person").get("first_name") == "John"
+        assert row.get("unknown") is None
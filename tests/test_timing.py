@@ -0,0 +1,86 @@
+import logging
+
+import pytest
+from cruditor.timing import NULL_TIMER, RequestTimer
+from examples.collection.views import PersonChangeView, PersonListView
+
+from tests.factories import PersonFactory
+
+received = []
+
+
+def collect(view, timer):
+    received.append((view, timer.get_timings()))
+
+
+class TestRequestTimer:
+    def test_phases(self):
+        timer = RequestTimer()
+        with timer.phase("auth"):
+            pass
+        with timer.phase("count"):
+            with timer.phase("auth"):
+                pass
+        timer.add("db", 2.5, "3 queries")
+
+        assert list(timer.get_timings()) == ["auth", "count", "db"]
+        assert timer.get_timings()["db"] == 2.5
+        header = timer.get_header()
+        assert header.startswith("auth;dur=")
+        assert 'db;dur=2.5;desc="3 queries"' in header
+        assert ", total;dur=" in header
+
+    def test_phase_exception(self):
+        timer = RequestTimer()
+        with pytest.raises(ValueError), timer.phase("fail"):
+            raise ValueError
+        assert "fail" in timer.get_timings()
+
+    def test_null_timer(self):
+        with NULL_TIMER.phase("auth"):
+            pass
+        assert NULL_TIMER.phases == ()
+
+
+@pytest.mark.django_db
+class TestServerTiming:
+    def setup_method(self):
+        received.clear()
+        self.person = PersonFactory.create()
+
+    def get(self, rf, admin_user, view_class, **kwargs):
+        request = rf.get("/")
+        request.user = admin_user
+        response = view_class.as_view(**kwargs)(request, pk=self.person.pk)
+        # Template responses are rendered by the handler, after the middlewares.
+        if hasattr(response, "render") and not response.is_rendered:
+            response.render()
+        return response
+
+    def test_disabled(self, rf, admin_user):
+        response = self.get(rf, admin_user, PersonListView)
+        assert "Server-Timing" not in response.headers
+
+    def test_list_header(self, rf, admin_user):
+        response = self.get(rf, admin_user, PersonListView, server_timing=True)
+        names = [entry.split(";")[0] for entry in response["Server-Timing"].split(", ")]
+        for name in ("auth", "filter", "count", "page", "context", "render", "db", "total"):
+            assert name in names
+
+    def test_form_header(self, rf, admin_user):
+        response = self.get(rf, admin_user, PersonChangeView, server_timing=True)
+        assert "object;dur=" in response["Server-Timing"]
+
+    def test_sinks(self, rf, admin_user, settings, caplog):
+        settings.CRUDITOR_TIMING_SINKS = [
+            "tests.test_timing.collect",
+            "cruditor.timing.log_timings",
+        ]
+        with caplog.at_level(logging.INFO, logger="cruditor.timing"):
+            response = self.get(rf, admin_user, PersonListView)
+
+        assert "Server-Timing" not in response.headers
+        ((view, timings),) = received
+        assert isinstance(view, PersonListView)
+        assert "render" in timings
+        assert caplog.records[0].getMessage().startswith("GET / auth=")
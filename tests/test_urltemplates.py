@@ -0,0 +1,103 @@
+import uuid
+
+import pytest
+from cruditor.urltemplates import (
+    URLTemplate,
+    clear_url_templates,
+    get_url_builder,
+    get_url_template,
+    reverse,
+    url_templates,
+)
+from django.urls import NoReverseMatch, path, re_path, set_script_prefix
+from django.urls import reverse as django_reverse
+from django.utils import translation
+
+
+def view(request):
+    pass
+
+
+urlpatterns = [
+    path("items/<uuid:uid>/<slug:slug>/", view, name="item"),
+    path("files/<path:name>", view, name="file"),
+    re_path(r"^legacy/(?P<pk>\d+)/$", view, name="legacy"),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    clear_url_templates()
+    yield
+    set_script_prefix("/")
+
+
+@pytest.mark.parametrize(
+    "viewname,args,kwargs",
+    [
+        ("home", None, None),
+        ("collection:list", (), None),
+        ("collection:change", (12,), None),
+        ("collection:change", ("12",), None),
+        ("collection:delete", None, {"pk": 4711}),
+        ("admin:auth_user_change", ("a b/ä?#",), None),
+        ("admin:auth_user_history", None, {"object_id": "5"}),
+    ],
+)
+def test_reverse(viewname, args, kwargs):
+    expected = django_reverse(viewname, args=args, kwargs=kwargs)
+    assert reverse(viewname, args=args, kwargs=kwargs) == expected
+    assert reverse(viewname, args=args, kwargs=kwargs) == expected
+    assert len(url_templates) == 1
+    assert isinstance(next(iter(url_templates.values())), URLTemplate)
+
+
+def test_reverse_converters():
+    uid = uuid.uuid4()
+    assert reverse("item", urlconf=__name__, args=(uid, "some-slug")) == (
+        f"/items/{uid}/some-slug/"
+    )
+    assert reverse("item", urlconf=__name__, kwargs={"slug": "s", "uid": uid}) == (
+        f"/items/{uid}/s/"
+    )
+    assert reverse("file", urlconf=__name__, args=("a/b c.txt",)) == "/files/a/b%20c.txt"
+
+
+def test_reverse_invalid():
+    with pytest.raises(NoReverseMatch):
+        reverse("collection:change", args=("abc",))
+    with pytest.raises(NoReverseMatch):
+        reverse("item", urlconf=__name__, args=("no-uuid", "slug"))
+    with pytest.raises(NoReverseMatch):
+        reverse("unknown")
+    assert get_url_template("unknown") is None
+
+
+def test_reverse_regex_route():
+    assert get_url_template("legacy", urlconf=__name__, names=1) is None
+    assert reverse("legacy", urlconf=__name__, args=(5,)) == "/legacy/5/"
+
+
+def test_leading_slashes():
+    assert reverse("file", urlconf=__name__, args=("/etc",)) == django_reverse(
+        "file", urlconf=__name__, args=("/etc",)
+    )
+
+
+def test_script_prefix_and_language():
+    reverse("collection:change", args=(1,))
+    set_script_prefix("/app/")
+    assert reverse("collection:change", args=(1,)) == "/app/collection/1/"
+    with translation.override("de"):
+        reverse("collection:change", args=(1,))
+    assert len(url_templates) == 3
+
+
+def test_get_url_builder():
+    build_url = get_url_builder("collection:change", names=1)
+    assert build_url((1,)) == "/collection/1/"
+    assert build_url((2,)) == "/collection/2/"
+
+    build_url = get_url_builder("item", urlconf=__name__, names=("slug", "uid"))
+    with pytest.raises(NoReverseMatch):
+        build_url({"slug": "s", "uid": "invalid"})
@@ -1,15 +1,41 @@
+import json
+import logging
+import pickle
+from datetime import timedelta
+
 import pytest
-from cruditor.datastructures import Breadcrumb
-from cruditor.views import Cruditor403View, Cruditor404View, CruditorListView
+from asgiref.sync import async_to_sync
+from cruditor.datastructures import Breadcrumb, TitleButton
+from cruditor.pagination import CappedCount, ResultCount
+from cruditor.views import (
+    AsyncCruditorAddView,
+    AsyncCruditorChangeView,
+    AsyncCruditorDeleteView,
+    AsyncCruditorListView,
+    Cruditor403View,
+    Cruditor404View,
+    CruditorListView,
+)
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.messages import SUCCESS as SUCCESS_LEVEL
 from django.contrib.messages import get_messages
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.http import Http404
+from django.test.signals import template_rendered
 from django.urls import reverse
+from django.utils import translation
+from examples.collection.filters import PersonFilter
+from examples.collection.forms import PersonForm
+from examples.collection.tables import PersonTable
+from examples.collection.views import PersonFilterView, PersonViewMixin
+from examples.formset.views import PersonChangeView as FormsetPersonChangeView
 from examples.minimal.views import DemoView
-from examples.store.models import Person
+from examples.store.models import Person, RelatedPerson
 
 from tests.factories import PersonFactory, RelatedPersonFactory
+from tests.test_tables import PersonRelatedTable, RelatedPersonTable
 
 
 @pytest.mark.django_db
@@ -122,6 +148,289 @@ class TestListView:
         assert response.context["filter_form"] is not None
         assert response.context["filter_form"].data
 
+    def test_get_table_no_distinct(self, rf):
+        view = CruditorListView(model=Person, table_class=PersonTable, request=rf.get("/"))
+        table = view.get_table(view.get_filtered_queryset())
+        assert table.data.data.query.distinct is False
+
+    def test_get_table_distinct_multivalued(self, rf):
+        RelatedPersonFactory.create_batch(2, person=self.person1, first_name="Sally")
+        view = CruditorListView(
+            queryset=Person.objects.filter(relatedperson__first_name="Sally"),
+            table_class=PersonTable,
+            request=rf.get("/"),
+        )
+        table = view.get_table(view.get_filtered_queryset())
+        assert table.data.data.query.distinct is True
+        assert list(table.data.data) == [self.person1]
+
+    def test_get_table_select_related(self, rf, django_assert_num_queries):
+        RelatedPersonFactory.create_batch(3, person=self.person1)
+        view = CruditorListView(
+            model=RelatedPerson, table_class=RelatedPersonTable, request=rf.get("/")
+        )
+        table = view.get_table(view.get_filtered_queryset())
+        assert table.data.data.query.select_related == {"person": {}}
+
+        with django_assert_num_queries(1):
+            assert len([row.get_cell("person_name") for row in table.page.object_list]) == 3
+
+    def test_get_table_select_related_explicit(self, rf):
+        view = CruditorListView(
+            model=RelatedPerson,
+            table_class=RelatedPersonTable,
+            list_select_related=True,
+            request=rf.get("/"),
+        )
+        table = view.get_table(view.get_filtered_queryset())
+        assert table.data.data.query.select_related is True
+
+    def test_get_table_prefetch_related(self, rf, django_assert_num_queries):
+        RelatedPersonFactory.create_batch(2, person=self.person1)
+        RelatedPersonFactory.create_batch(2, person=self.person2)
+        view = CruditorListView(
+            model=Person,
+            table_class=PersonRelatedTable,
+            list_prefetch_related=("relatedperson_set__person",),
+            request=rf.get("/"),
+        )
+        table = view.get_table(view.get_filtered_queryset())
+
+        with django_assert_num_queries(2):
+            for row in table.page.object_list:
+                assert row.get_cell("related")
+                assert [str(related) for related in row.record.relatedperson_set.all()]
+
+    def test_get_table_projection_only(self, rf):
+        view = CruditorListView(
+            model=Person, table_class=PersonTable, list_projection="only", request=rf.get("/")
+        )
+        table = view.get_table(view.get_filtered_queryset())
+        record = table.page.object_list.data[0]
+        assert record.get_deferred_fields() == {
+            "last_name",
+            "country",
+            "birthdate",
+            "approved",
+            "stars",
+        }
+
+    def test_get_table_projection_only_select_related(self, rf):
+        RelatedPersonFactory.create(person=self.person1)
+        view = CruditorListView(
+            model=RelatedPerson,
+            table_class=PersonTable,
+            list_select_related=("person",),
+            list_projection="only",
+            request=rf.get("/"),
+        )
+        qs = view.get_table_data(view.get_filtered_queryset())
+        assert qs.get().person == self.person1
+
+    def test_get_table_projection_values(self, rf):
+        RelatedPersonFactory.create(person=self.person1, first_name="Sally")
+        view = CruditorListView(
+            model=RelatedPerson,
+            table_class=RelatedPersonTable,
+            list_projection="values",
+            list_projection_fields=("is_child",),
+            request=rf.get("/"),
+        )
+        table = view.get_table(view.get_filtered_queryset())
+        row = next(iter(table.page.object_list))
+        assert set(row.record) == {
+            "pk",
+            "first_name",
+            "person__first_name",
+            "person__country",
+            "is_child",
+        }
+        assert row.get_cell("person_name") == self.person1.first_name
+
+    def test_get_projection_values_rendered(self, rf, admin_user):
+        request = rf.get("/", data={"sort": "-first_name"})
+        request.user = admin_user
+        response = PersonFilterView.as_view(list_projection="values")(request).render()
+        assert (
+            reverse("collection:change", args=(self.person1.pk,)) in response.content.decode()
+        )
+
+    def get_export(self, rf, admin_user, export_format, **params):
+        request = rf.get("/", data={"_export": export_format, **params})
+        request.user = admin_user
+        view = PersonFilterView.as_view(export_formats=("csv", "jsonl"), export_chunk_size=1)
+        return view(request)
+
+    def test_export_csv(self, rf, admin_user):
+        response = self.get_export(rf, admin_user, "csv", approved="2", sort="first_name")
+        assert response.streaming is True
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        assert response["Content-Disposition"] == 'attachment; filename="persons.csv"'
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert len(lines) == 2
+        assert lines[0] == "First name,Next reminder"
+        assert lines[1].startswith(f"{self.person1.first_name},")
+
+    def test_export_csv_formulas(self, rf, admin_user):
+        self.person1.first_name = "=HYPERLINK(1)"
+        self.person1.save()
+        self.person2.first_name = "-2"
+        self.person2.save()
+        response = self.get_export(rf, admin_user, "csv", sort="first_name")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[1].startswith("'-2,")
+        assert lines[2].startswith("'=HYPERLINK(1),")
+
+    def test_export_jsonl(self, rf, admin_user):
+        response = self.get_export(rf, admin_user, "jsonl", sort="-first_name")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        persons = sorted([self.person1, self.person2], key=lambda p: p.first_name, reverse=True)
+        assert [json.loads(line)["first_name"] for line in lines] == [
+            person.first_name for person in persons
+        ]
+
+    def test_export_not_enabled(self, admin_client):
+        response = admin_client.get(reverse("collection:filter"), data={"_export": "csv"})
+        assert response.status_code == 200
+        assert response.streaming is False
+
+    def test_export_titlebuttons(self, rf, admin_user):
+        request = rf.get("/", data={"approved": "2"})
+        request.user = admin_user
+        response = PersonFilterView.as_view(export_formats=("csv",))(request)
+        assert (
+            TitleButton(label="Export CSV", url="?approved=2&_export=csv")
+            in response.context_data["cruditor"]["titlebuttons"]
+        )
+
+    def test_enrich_rows(self, rf, admin_user):
+        class EnrichedPersonListView(PersonFilterView):
+            list_enrich_workers = 2
+
+            def enrich_row(self, record):
+                if record == failing:
+                    raise ValueError("Details not available")
+                return {"first_name": record.first_name.upper(), "pk": record.pk}
+
+        failing = self.person2
+        request = rf.get("/", data={"sort": "first_name"})
+        request.user = admin_user
+        request._messages = CookieStorage(request)
+        response = EnrichedPersonListView.as_view()(request)
+
+        view_records = [row.record for row in response.context_data["table"].page.object_list]
+        assert self.person2 in view_records
+        assert {"first_name": self.person1.first_name.upper(), "pk": self.person1.pk} in (
+            view_records
+        )
+
+        messages = list(get_messages(request))
+        assert [message.message for message in messages] == [
+            "Details of 1 of 2 rows could not be loaded."
+        ]
+
+    def test_enrich_rows_disabled(self, rf, admin_user):
+        request = rf.get("/")
+        request.user = admin_user
+        response = PersonFilterView.as_view()(request)
+        assert response.context_data["view"].enrich_errors == {}
+
+    def test_fragment_header(self, admin_client):
+        response = admin_client.get(
+            reverse("collection:filter"),
+            data={"sort": "first_name"},
+            HTTP_X_CRUDITOR_FRAGMENT="1",
+        )
+        assert response.status_code == 200
+        assert [t.name for t in response.templates][0] == "cruditor/list-fragment.html"
+        assert "cruditor" not in response.context
+        assert "cruditor-table" in response.content.decode()
+        assert "X-Cruditor-Fragment" in response["Vary"]
+
+    def test_fragment_param(self, admin_client):
+        response = admin_client.get(
+            reverse("collection:filter"), data={"sort": "first_name", "_fragment": "1"}
+        )
+        assert [t.name for t in response.templates][0] == "cruditor/list-fragment.html"
+        assert "_fragment" not in response.content.decode()
+
+    def test_no_fragment(self, admin_client):
+        response = admin_client.get(reverse("collection:filter"))
+        assert [t.name for t in response.templates][0] == "cruditor/list.html"
+        assert "X-Cruditor-Fragment" in response["Vary"]
+
+    def get_cached_rows(self, rf, admin_user, **params):
+        request = rf.get("/", data={"sort": "first_name", **params})
+        request.user = admin_user
+        response = PersonFilterView.as_view(list_row_cache_version="reminder")(request)
+        response.render()
+        return response
+
+    def test_row_cache(self, rf, admin_user):
+        cache.clear()
+        response = self.get_cached_rows(rf, admin_user)
+        view, table = response.context_data["view"], response.context_data["table"]
+        rows = list(table.page.object_list)
+        keys = [view.get_row_cache_key(table, row) for row in rows]
+        assert all(keys) and len(set(keys)) == 2
+        assert cache.get(keys[0]) in response.content.decode()
+
+        cache.set(keys[0], '<tr class="from-cache"></tr>')
+        response = self.get_cached_rows(rf, admin_user)
+        content = response.content.decode()
+        assert '<tr class="from-cache"></tr>' in content
+        assert rows[0].record.first_name not in content
+        assert rows[1].record.first_name in content
+
+    def test_row_cache_key_version(self, rf, admin_user):
+        cache.clear()
+        response = self.get_cached_rows(rf, admin_user)
+        view, table = response.context_data["view"], response.context_data["table"]
+        row = list(table.page.object_list)[0]
+        key = view.get_row_cache_key(table, row)
+
+        row.record.reminder = row.record.reminder + timedelta(days=1)
+        assert view.get_row_cache_key(table, row) != key
+        with translation.override("de"):
+            assert view.get_row_cache_key(table, row) != key
+
+    def test_row_cache_context(self, rf, admin_user):
+        cache.clear()
+        contexts = []
+
+        def receiver(sender, template, context, **kwargs):
+            if template.name == PersonFilterView.list_row_template_name:
+                contexts.append(context.flatten())
+
+        template_rendered.connect(receiver)
+        try:
+            self.get_cached_rows(rf, admin_user)
+        finally:
+            template_rendered.disconnect(receiver)
+        assert len(contexts) == 2
+        # Context processors are not run, the request and the user are not passed.
+        assert {"request", "user", "perms", "messages"}.isdisjoint(contexts[0])
+        assert {"table", "row"} <= set(contexts[0])
+
+    def test_row_cache_key_no_version(self, rf, admin_user):
+        cache.clear()
+        response = self.get_cached_rows(rf, admin_user)
+        view, table = response.context_data["view"], response.context_data["table"]
+        row = list(table.page.object_list)[0]
+        row.record.reminder = None
+        assert view.get_row_cache_key(table, row) is None
+        view.list_row_cache_version = None
+        row.record.reminder = timedelta(days=1)
+        assert view.get_row_cache_key(table, row) is None
+
+    def test_row_cache_disabled(self, rf, admin_user):
+        request = rf.get("/")
+        request.user = admin_user
+        response = PersonFilterView.as_view()(request)
+        rows = list(response.context_data["table"].page.object_list)
+        assert not hasattr(rows[0], "cached_html")
+
     def test_get_queryset_model(self):
         class DummyListView(CruditorListView):
             model = Person
@@ -379,6 +688,253 @@ class TestFormsetView:
         assert response.context["formsets"]["related_persons"].is_valid() is True
 
 
+class AsyncPersonListView(PersonViewMixin, AsyncCruditorListView):
+    title = "Persons"
+    filter_class = PersonFilter
+    table_class = PersonTable
+
+
+class AsyncPersonAddView(PersonViewMixin, AsyncCruditorAddView):
+    form_class = PersonForm
+
+
+class AsyncPersonChangeView(PersonViewMixin, AsyncCruditorChangeView):
+    form_class = PersonForm
+
+
+class AsyncPersonDeleteView(PersonViewMixin, AsyncCruditorDeleteView):
+    pass
+
+
+@pytest.mark.django_db
+class TestAsyncViews:
+    person_data = {
+        "first_name": "John",
+        "last_name": "Doe",
+        "country": "Germany",
+        "reminder_0": "2018-05-25",
+        "reminder_1": "09:00:00",
+        "stars": "2",
+    }
+
+    def setup_method(self):
+        self.person1 = PersonFactory.create(first_name="Anna", approved=True)
+        self.person2 = PersonFactory.create(first_name="Bob", approved=False)
+
+    def call(self, view, request, user, **kwargs):
+        request.user = user
+        request._messages = CookieStorage(request)
+        return async_to_sync(view)(request, **kwargs)
+
+    def test_list(self, rf, admin_user):
+        response = self.call(
+            AsyncPersonListView.as_view(), rf.get("/", data={"per_page": 1}), admin_user
+        )
+        assert "no-cache" in response["Cache-Control"]
+
+        table = response.context_data["table"]
+        assert table.paginator.result_count == ResultCount(2)
+        assert len(table.page.object_list) == 1
+        assert response.context_data["filter_form"] is not None
+        assert "Page 1 of 2" in response.render().content.decode()
+
+    def test_list_fragment(self, rf, admin_user):
+        response = self.call(
+            AsyncPersonListView.as_view(),
+            rf.get("/", data={"sort": "first_name"}, HTTP_X_CRUDITOR_FRAGMENT="1"),
+            admin_user,
+        )
+        assert response.template_name == ["cruditor/list-fragment.html"]
+        assert "cruditor" not in response.context_data
+        assert "table" in response.context_data
+        assert "cruditor-table" in response.render().content.decode()
+        assert "X-Cruditor-Fragment" in response["Vary"]
+
+    def test_list_capped_count(self, rf, admin_user):
+        response = self.call(
+            AsyncPersonListView.as_view(count_strategy=CappedCount(limit=1)),
+            rf.get("/", data={"per_page": 1, "page": 2, "sort": "first_name"}),
+            admin_user,
+        )
+        table = response.context_data["table"]
+        assert table.paginator.result_count == ResultCount(1, "more_than")
+        assert [row.record for row in table.page.object_list] == [self.person2]
+        assert table.page.has_next() is False
+
+    def test_list_keyset(self, rf, admin_user):
+        view = AsyncPersonListView.as_view(keyset_pagination=True)
+        response = self.call(
+            view, rf.get("/", data={"per_page": 1, "sort": "first_name"}), admin_user
+        )
+        page = response.context_data["table"].page
+        assert [row.record for row in page.object_list] == [self.person1]
+
+        response = self.call(
+            view,
+            rf.get("/", data={"per_page": 1, "sort": "first_name", "cursor": page.next_cursor}),
+            admin_user,
+        )
+        page = response.context_data["table"].page
+        assert [row.record for row in page.object_list] == [self.person2]
+
+    def test_list_export(self, rf, admin_user):
+        response = self.call(
+            AsyncPersonListView.as_view(export_formats=("jsonl",), export_chunk_size=1),
+            rf.get("/", data={"_export": "jsonl", "sort": "first_name"}),
+            admin_user,
+        )
+        assert response.is_async is True
+
+        async def consume():
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        lines = async_to_sync(consume)().decode().splitlines()
+        assert [json.loads(line)["first_name"] for line in lines] == ["Anna", "Bob"]
+
+    @pytest.mark.parametrize(
+        "initkwargs",
+        [{"max_queries": 5}, {"server_timing": True}, {"slow_request_threshold": 0}],
+    )
+    def test_unsupported_attributes(self, rf, admin_user, initkwargs):
+        with pytest.raises(ImproperlyConfigured):
+            self.call(AsyncPersonListView.as_view(**initkwargs), rf.get("/"), admin_user)
+
+    def test_unsupported_settings(self, rf, admin_user, settings):
+        settings.CRUDITOR_METRICS = True
+        with pytest.warns(RuntimeWarning, match="CRUDITOR_METRICS"):
+            response = self.call(AsyncPersonListView.as_view(), rf.get("/"), admin_user)
+        assert response.status_code == 200
+
+        settings.CRUDITOR_METRICS = False
+        settings.CRUDITOR_SLOW_REQUEST_THRESHOLD = 0
+        with pytest.warns(RuntimeWarning, match="CRUDITOR_SLOW_REQUEST_THRESHOLD"):
+            self.call(AsyncPersonListView.as_view(), rf.get("/"), admin_user)
+
+    def test_not_logged_in(self, rf):
+        response = self.call(AsyncPersonListView.as_view(), rf.get("/"), AnonymousUser())
+        assert response.status_code == 200
+        assert response.template_name[0] == AsyncPersonListView.login_template_name
+        assert "no-cache" in response["Cache-Control"]
+
+    def test_no_permission(self, rf, admin_user):
+        admin_user.is_superuser = False
+        view = AsyncPersonListView.as_view(required_permission="store.view_person")
+        with pytest.raises(PermissionDenied):
+            self.call(view, rf.get("/"), admin_user)
+
+    def test_add(self, rf, admin_user):
+        response = self.call(AsyncPersonAddView.as_view(), rf.get("/"), admin_user)
+        assert response.context_data["cruditor"]["title"] == "Add Person"
+
+        response = self.call(
+            AsyncPersonAddView.as_view(), rf.post("/", data=self.person_data), admin_user
+        )
+        assert response.status_code == 302
+        assert Person.objects.filter(first_name="John").exists() is True
+
+    def test_change(self, rf, admin_user):
+        view = AsyncPersonChangeView.as_view()
+        response = self.call(view, rf.get("/"), admin_user, pk=self.person1.pk)
+        assert response.context_data["form"].instance == self.person1
+
+        response = self.call(view, rf.post("/", data={}), admin_user, pk=self.person1.pk)
+        assert response.status_code == 200
+        assert response.context_data["form"].is_valid() is False
+
+        response = self.call(
+            view, rf.post("/", data=self.person_data), admin_user, pk=self.person1.pk
+        )
+        assert response.status_code == 302
+        self.person1.refresh_from_db()
+        assert self.person1.first_name == "John"
+
+    def test_change_not_found(self, rf, admin_user):
+        with pytest.raises(Http404):
+            self.call(AsyncPersonChangeView.as_view(), rf.get("/"), admin_user, pk=0)
+
+    def test_delete(self, rf, admin_user):
+        view = AsyncPersonDeleteView.as_view()
+        response = self.call(view, rf.get("/"), admin_user, pk=self.person1.pk)
+        assert response.context_data["object"] == self.person1
+
+        response = self.call(view, rf.post("/"), admin_user, pk=self.person1.pk)
+        assert response.status_code == 302
+        assert Person.objects.filter(pk=self.person1.pk).exists() is False
+
+
+@pytest.mark.django_db
+class TestSlowRequestLog:
+    def get_record(self, caplog, view, request, user, **kwargs):
+        request.user = user
+        request._messages = CookieStorage(request)
+        with caplog.at_level(logging.WARNING, logger="cruditor.slow_requests"):
+            response = view(request, **kwargs)
+            if hasattr(response, "render"):
+                response.render()
+        records = [r for r in caplog.records if r.name == "cruditor.slow_requests"]
+        return response, records[0] if records else None
+
+    def test_fast_request(self, rf, admin_user, caplog):
+        view = PersonFilterView.as_view(slow_request_threshold=60)
+        response, record = self.get_record(caplog, view, rf.get("/"), admin_user)
+        assert "render" not in response.__dict__
+        assert pickle.loads(pickle.dumps(response)).content == response.content
+        assert record is None
+
+    def test_lazy_rendering(self, rf, admin_user):
+        request = rf.get("/")
+        request.user = admin_user
+        response = PersonFilterView.as_view(slow_request_threshold=60)(request)
+        assert response.is_rendered is False
+
+    def test_max_queries(self, rf, admin_user, caplog):
+        PersonFactory.create_batch(3)
+        view = PersonFilterView.as_view(slow_request_threshold=0, slow_request_max_queries=1)
+        response, record = self.get_record(caplog, view, rf.get("/"), admin_user)
+
+        details = record.cruditor
+        assert details["query_count"] >= 2
+        # The rows of the table are fetched while rendering.
+        assert len(details["queries"]) == 1
+        assert "LIMIT" in details["queries"][0]["sql"]
+
+    def test_list(self, rf, admin_user, caplog):
+        PersonFactory.create_batch(3, country="Germany")
+        PersonFactory.create(country="Italy")
+        view = PersonFilterView.as_view(slow_request_threshold=0)
+        response, record = self.get_record(
+            caplog, view, rf.get("/", {"country": "Germany", "last_name": ""}), admin_user
+        )
+
+        assert record.getMessage().startswith(
+            "Slow request: GET / (examples.collection.views.PersonFilterView) took"
+        )
+        details = record.cruditor
+        assert details["status"] == 200
+        assert details["params"] == {"country": "Germany"}
+        assert details["filters"] == {"country": "Germany"}
+        assert (details["page_rows"], details["total_rows"]) == (3, 3)
+        assert details["query_count"] == len(details["queries"]) >= 2
+        assert all(query["sql"].startswith("SELECT") for query in details["queries"])
+        assert details["render_ms"] > 0
+
+    def test_form(self, rf, admin_user, caplog, settings):
+        settings.CRUDITOR_SLOW_REQUEST_THRESHOLD = 0
+        person = PersonFactory.create()
+        RelatedPersonFactory.create(person=person)
+        response, record = self.get_record(
+            caplog,
+            FormsetPersonChangeView.as_view(),
+            rf.post("/", {"first_name": ""}),
+            admin_user,
+            pk=person.pk,
+        )
+
+        details = record.cruditor
+        assert "first_name" in details["form_errors"]
+        assert details["formsets"] == {"related_persons": {"forms": 0, "errors": 1}}
+
+
 class TestChangePasswordView:
     def test_get(self, admin_client):
         response = admin_client.get(reverse("change-password"))